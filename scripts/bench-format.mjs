@@ -0,0 +1,111 @@
+/**
+ * Micro-benchmark for src/lib/format.ts: 100k table cells formatted the old
+ * way (a new Intl formatter per call), per cell with a cached formatter, and
+ * as whole columns.
+ *
+ *   npm run bench:format
+ *   node scripts/bench-format.mjs --cells 500000
+ *
+ * Loads the TypeScript module directly, which needs Node 22.6+ type
+ * stripping; older versions exit with a message instead of a flag error.
+ */
+
+import { spawnSync } from 'node:child_process';
+import { parseArgs } from 'node:util';
+
+const [major, minor] = process.versions.node.split('.').map(Number);
+if (major < 22 || (major === 22 && minor < 6)) {
+  console.error(`bench:format needs Node 22.6 or later to load src/lib/format.ts (this is ${process.version}).`);
+  process.exit(1);
+}
+// Type stripping is on by default from 23.6; before that, re-run with the flag
+if ((major < 23 || (major === 23 && minor < 6)) && !process.execArgv.includes('--experimental-strip-types')) {
+  const child = spawnSync(
+    process.execPath,
+    ['--experimental-strip-types', ...process.execArgv, ...process.argv.slice(1)],
+    { stdio: 'inherit' }
+  );
+  process.exit(child.status ?? 1);
+}
+
+const {
+  formatCurrencyColumn,
+  formatDateColumn,
+  formatDateValue,
+  getCurrencyFormat
+} = await import('../src/lib/format.ts');
+
+const { values: args } = parseArgs({
+  options: {
+    cells: { type: 'string', default: '100000' },
+    runs: { type: 'string', default: '5' }
+  }
+});
+const CELLS = Number(args.cells);
+const RUNS = Number(args.runs);
+
+// Shaped like the campaign columns: integer costs, two-decimal CPCs, dates
+// spread over a few months
+let state = 42;
+const random = () => {
+  state = (state * 1664525 + 1013904223) >>> 0;
+  return state / 4294967296;
+};
+const costs = Array.from({ length: CELLS }, () => 50 + Math.floor(random() * 1400));
+const cpcs = Array.from({ length: CELLS }, () => Math.round(random() * 500) / 100);
+const DAY_MS = 24 * 60 * 60 * 1000;
+const dates = Array.from({ length: CELLS }, () =>
+  new Date(Date.UTC(2024, 9, 1) + Math.floor(random() * 120) * DAY_MS).toISOString().split('T')[0]
+);
+
+const SHORT_DATE = { month: 'short', day: 'numeric', year: 'numeric' };
+
+const cases = {
+  currency: {
+    'new formatter per call': (values) => values.map((value) => new Intl.NumberFormat('en-US', {
+      style: 'currency',
+      currency: 'USD',
+      minimumFractionDigits: 0,
+      maximumFractionDigits: 2
+    }).format(value)),
+    'cached formatter per cell': (values) => values.map((value) => getCurrencyFormat().format(value)),
+    'formatCurrencyColumn': (values) => formatCurrencyColumn(values)
+  },
+  date: {
+    'toLocaleDateString per call': (values) => values.map((value) => new Date(value).toLocaleDateString('en-US', SHORT_DATE)),
+    'cached formatter per cell': (values) => values.map((value) => formatDateValue(value, 'short')),
+    'formatDateColumn': (values) => formatDateColumn(values, 'short')
+  }
+};
+const inputs = { currency: [...costs, ...cpcs].slice(0, CELLS), date: dates };
+
+function median(samples) {
+  const sorted = [...samples].sort((a, b) => a - b);
+  return sorted[Math.floor(sorted.length / 2)];
+}
+
+let failed = false;
+for (const [column, variants] of Object.entries(cases)) {
+  console.log(`\n${column} column, ${CELLS.toLocaleString('en-US')} cells (median of ${RUNS} runs)`);
+  let baseline = null;
+  let expected = null;
+  for (const [name, run] of Object.entries(variants)) {
+    const output = run(inputs[column]);
+    if (expected === null) {
+      expected = output;
+    } else if (output.some((text, i) => text !== expected[i])) {
+      console.log(`  ${name}: output differs from the baseline`);
+      failed = true;
+    }
+    const samples = [];
+    for (let i = 0; i < RUNS; i++) {
+      const start = performance.now();
+      run(inputs[column]);
+      samples.push(performance.now() - start);
+    }
+    const ms = median(samples);
+    baseline ??= ms;
+    console.log(`  ${name.padEnd(28)} ${ms.toFixed(1).padStart(9)} ms  ${(baseline / ms).toFixed(1).padStart(6)}x`);
+  }
+}
+process.exit(failed ? 1 : 0);
@@ -1,50 +1,45 @@
 'use client';
 
-import React, { useState, useEffect } from 'react';
+import React, { useMemo, useState } from 'react';
 import DashboardLayout from '@/components/layout/DashboardLayout';
-import LineChart from '@/components/charts/LineChart';
-import BarChart from '@/components/charts/BarChart';
-import DonutChart from '@/components/charts/DonutChart';
-import { 
-  generateLineChartData, 
-  generateBarChartData, 
-  generateDonutChartData 
-} from '@/lib/data';
+import {
+  LazyLineChart as LineChart,
+  LazyBarChart as BarChart,
+  LazyDonutChart as DonutChart
+} from '@/components/charts/LazyCharts';
+import { apiQueryKey, fetchSeries } from '@/lib/api';
+import { simulateLatency } from '@/lib/data';
+import { useDataFetching } from '@/lib/hooks';
+import { TIME_RANGE_DAYS, getRollupCube } from '@/lib/rollup';
 import { Download, Filter } from 'lucide-react';
-import { LineChartData, BarChartData, DonutChartData } from '@/types/dashboard';
+import { LineChartData, BarChartData, DonutChartData, TimeRange } from '@/types/dashboard';
 
 export default function AnalyticsPage() {
-  const [isLoading, setIsLoading] = useState(true);
-  const [timeRange, setTimeRange] = useState('30d');
-  const [data, setData] = useState<{
+  const [timeRange, setTimeRange] = useState<TimeRange>('30d');
+
+  // Shared with the reports page: cached series show at once and revalidate
+  const { data: series, loading: isLoading } = useDataFetching({
+    key: apiQueryKey('series'),
+    // Simulate API delay
+    fetchFn: (signal) => simulateLatency(800).then(() => fetchSeries({ signal })),
+    onError: (error) => {
+      console.error('Analytics data fetch error:', error);
+    }
+  });
+  const data: {
     lineChartData: LineChartData[];
     barChartData: BarChartData[];
     donutChartData: DonutChartData[];
-  }>({
+  } = series ?? {
     lineChartData: [],
     barChartData: [],
     donutChartData: []
-  });
-
-  // Simulate data loading
-  useEffect(() => {
-    const loadData = async () => {
-      setIsLoading(true);
-      
-      // Simulate API delay
-      await new Promise(resolve => setTimeout(resolve, 800));
-      
-      setData({
-        lineChartData: generateLineChartData(),
-        barChartData: generateBarChartData(),
-        donutChartData: generateDonutChartData()
-      });
-      
-      setIsLoading(false);
-    };
-
-    loadData();
-  }, [timeRange]);
+  };
+  // The series covers a year; switching ranges reads its rollups instead of refetching
+  const lineChartData = useMemo(
+    () => getRollupCube(data.lineChartData).lastDays(TIME_RANGE_DAYS[timeRange]).data,
+    [data.lineChartData, timeRange]
+  );
 
   return (
     <DashboardLayout 
@@ -64,7 +59,7 @@ export default function AnalyticsPage() {
           <div className="flex items-center gap-3">
             <select 
               value={timeRange}
-              onChange={(e) => setTimeRange(e.target.value)}
+              onChange={(e) => setTimeRange(e.target.value as TimeRange)}
               className="px-3 py-2 border border-gray-300 dark:border-gray-600 rounded-lg focus:ring-2 focus:ring-primary-500 focus:border-transparent text-sm bg-white dark:bg-gray-700 text-gray-900 dark:text-white"
             >
               <option value="7d">Last 7 days</option>
@@ -157,7 +152,7 @@ export default function AnalyticsPage() {
           {/* Revenue Trend - 2/3 width on desktop */}
           <div className="lg:col-span-2">
             <LineChart
-              data={data.lineChartData}
+              data={lineChartData}
               title="Revenue Trend"
               loading={isLoading}
               height={300}
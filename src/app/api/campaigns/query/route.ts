@@ -0,0 +1,26 @@
+import { cachedJsonResponse, campaignDataset, campaignDatasetVersion } from '@/lib/apiCache';
+import { campaignQueryParams, cursorMatchesVersion, parseCampaignQuery, queryCampaigns } from '@/lib/campaignQuery';
+import { dataConfigFromParams } from '@/lib/dataConfig';
+
+export const dynamic = 'force-dynamic';
+
+/**
+ * One page of campaigns: ?sort=&dir=&q=&status=&cursor=&limit=
+ *
+ * Pages are cached per dataset version and cursors carry that version, so a
+ * cursor into a dataset that has since been regenerated gets a 409 instead of
+ * rows from the new one.
+ */
+export async function GET(request: Request) {
+  const params = new URL(request.url).searchParams;
+  const config = dataConfigFromParams(params);
+  const query = parseCampaignQuery(params);
+  const campaigns = campaignDataset(config);
+  const version = campaignDatasetVersion(campaigns);
+  if (!cursorMatchesVersion(query.cursor, version)) {
+    return new Response('Cursor is from an older campaign dataset; start again from the first page', { status: 409 });
+  }
+  return cachedJsonResponse(request, `campaigns/query?v=${version}&${campaignQueryParams(query)}`, config, () =>
+    queryCampaigns(campaigns, query, version)
+  );
+}
@@ -0,0 +1,16 @@
+import { cachedJsonResponse, campaignDataset } from '@/lib/apiCache';
+import { dataConfigFromParams } from '@/lib/dataConfig';
+
+export const dynamic = 'force-dynamic';
+
+/**
+ * Campaign rows for the campaigns page
+ */
+export async function GET(request: Request) {
+  const params = new URL(request.url).searchParams;
+  const config = dataConfigFromParams(params);
+  // ?fresh=1 has to reach the shared dataset too, or the payload is rebuilt from the old rows
+  return cachedJsonResponse(request, 'campaigns', config, () =>
+    campaignDataset(config, { fresh: params.get('fresh') === '1' })
+  );
+}
@@ -0,0 +1,21 @@
+import { cachedJsonResponse } from '@/lib/apiCache';
+import { DASHBOARD_SECTIONS, generateDashboardSection } from '@/lib/data';
+import { dataConfigFromParams } from '@/lib/dataConfig';
+import { DashboardSection } from '@/types/dashboard';
+
+export const dynamic = 'force-dynamic';
+
+/**
+ * One dashboard section (metrics, a chart's series or the campaigns), so
+ * widgets can load and fail independently
+ */
+export async function GET(request: Request, { params }: { params: Promise<{ section: string }> }) {
+  const { section } = await params;
+  if (!DASHBOARD_SECTIONS.includes(section as DashboardSection)) {
+    return new Response(`Unknown dashboard section: ${section}`, { status: 404 });
+  }
+  const config = dataConfigFromParams(new URL(request.url).searchParams);
+  return cachedJsonResponse(request, `dashboard/${section}`, config, () =>
+    generateDashboardSection(section as DashboardSection, config)
+  );
+}
@@ -0,0 +1,13 @@
+import { cachedJsonResponse } from '@/lib/apiCache';
+import { generateDashboardData } from '@/lib/data';
+import { dataConfigFromParams } from '@/lib/dataConfig';
+
+export const dynamic = 'force-dynamic';
+
+/**
+ * Complete dashboard payload (metrics, charts and campaigns)
+ */
+export async function GET(request: Request) {
+  const config = dataConfigFromParams(new URL(request.url).searchParams);
+  return cachedJsonResponse(request, 'dashboard', config, () => generateDashboardData(config));
+}
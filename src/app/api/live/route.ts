@@ -0,0 +1,54 @@
+import { createLiveFeed } from '@/lib/data';
+import { dataConfigFromParams } from '@/lib/dataConfig';
+
+export const dynamic = 'force-dynamic';
+
+const DEFAULT_INTERVAL_MS = 5000;
+const MIN_INTERVAL_MS = 1000;
+const MAX_INTERVAL_MS = 60000;
+
+/**
+ * Server-sent `delta` events for the dashboard: ?interval=<ms> between events
+ */
+export async function GET(request: Request) {
+  const params = new URL(request.url).searchParams;
+  const config = dataConfigFromParams(params);
+  const requested = Number(params.get('interval'));
+  const interval = Number.isFinite(requested) && requested > 0
+    ? Math.min(MAX_INTERVAL_MS, Math.max(MIN_INTERVAL_MS, requested))
+    : DEFAULT_INTERVAL_MS;
+
+  const nextDelta = createLiveFeed(config);
+  const encoder = new TextEncoder();
+  let timer: ReturnType<typeof setInterval> | undefined;
+
+  const stream = new ReadableStream<Uint8Array>({
+    start(controller) {
+      const stop = () => {
+        clearInterval(timer);
+        try {
+          controller.close();
+        } catch {
+          // Already closed by the client
+        }
+      };
+      controller.enqueue(encoder.encode(`retry: ${interval}\n\n`));
+      timer = setInterval(() => {
+        const delta = nextDelta();
+        controller.enqueue(encoder.encode(`id: ${delta.seq}\nevent: delta\ndata: ${JSON.stringify(delta)}\n\n`));
+      }, interval);
+      request.signal.addEventListener('abort', stop);
+    },
+    cancel() {
+      clearInterval(timer);
+    }
+  });
+
+  return new Response(stream, {
+    headers: {
+      'Content-Type': 'text/event-stream',
+      'Cache-Control': 'no-cache, no-transform',
+      Connection: 'keep-alive'
+    }
+  });
+}
@@ -0,0 +1,20 @@
+import { cachedJsonResponse } from '@/lib/apiCache';
+import { generateBarChartData, generateDonutChartData, generateLineChartData } from '@/lib/data';
+import { dataConfigFromParams } from '@/lib/dataConfig';
+import { TIME_RANGE_DAYS } from '@/lib/rollup';
+import { SeriesData } from '@/types/dashboard';
+
+export const dynamic = 'force-dynamic';
+
+/**
+ * Chart series for the analytics and reports pages; the line series always
+ * covers the longest selectable range, which the pages roll up client-side
+ */
+export async function GET(request: Request) {
+  const config = dataConfigFromParams(new URL(request.url).searchParams);
+  return cachedJsonResponse(request, 'series', config, (): SeriesData => ({
+    lineChartData: generateLineChartData({ days: Math.max(config.days, TIME_RANGE_DAYS['1y']) }, config),
+    barChartData: generateBarChartData({}, config),
+    donutChartData: generateDonutChartData()
+  }));
+}
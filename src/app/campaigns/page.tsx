@@ -1,39 +1,35 @@
 'use client';
 
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useMemo, useCallback } from 'react';
 import DashboardLayout from '@/components/layout/DashboardLayout';
 import DataTable from '@/components/dashboard/DataTable';
-import { generateCampaignData } from '@/lib/data';
+import { simulateLatency } from '@/lib/data';
 import { Search, Filter, Download } from 'lucide-react';
-import type { CampaignData } from '@/types/dashboard';
+import type { CampaignData, CampaignPage, CampaignStatus } from '@/types/dashboard';
+
+const NO_CAMPAIGNS: CampaignData[] = [];
 
 export default function CampaignsPage() {
   const [isLoading, setIsLoading] = useState(true);
-  const [campaigns, setCampaigns] = useState<CampaignData[]>([]);
+  const [totals, setTotals] = useState<Pick<CampaignPage, 'totalItems' | 'statusCounts'> | null>(null);
   const [searchTerm, setSearchTerm] = useState('');
   const [statusFilter, setStatusFilter] = useState('all');
 
-  // Simulate data loading
+  // Simulate data loading; rows are then queried page by page by the table
   useEffect(() => {
-    const loadData = async () => {
-      setIsLoading(true);
-      
-      // Simulate API delay
-      await new Promise(resolve => setTimeout(resolve, 1000));
-      
-      setCampaigns(generateCampaignData());
-      setIsLoading(false);
-    };
-
-    loadData();
+    simulateLatency(1000).finally(() => setIsLoading(false));
   }, []);
 
-  // Filter campaigns based on search and status
-  const filteredCampaigns = campaigns.filter((campaign) => {
-    const matchesSearch = campaign.name.toLowerCase().includes(searchTerm.toLowerCase());
-    const matchesStatus = statusFilter === 'all' || campaign.status === statusFilter;
-    return matchesSearch && matchesStatus;
-  });
+  const filters = useMemo(() => ({
+    search: searchTerm,
+    statuses: statusFilter === 'all' ? undefined : [statusFilter as CampaignStatus]
+  }), [searchTerm, statusFilter]);
+
+  // Stats cover the whole dataset, whichever page is on screen
+  const handlePageLoaded = useCallback((page: CampaignPage) => {
+    setTotals({ totalItems: page.totalItems, statusCounts: page.statusCounts });
+  }, []);
+  const totalCampaigns = totals?.totalItems ?? 0;
 
   return (
     <DashboardLayout 
@@ -100,9 +96,12 @@ export default function CampaignsPage() {
       {/* Campaigns Table */}
       <div className="bg-white rounded-lg border border-gray-200">
         <DataTable
-          data={filteredCampaigns}
+          data={NO_CAMPAIGNS}
           loading={isLoading}
           itemsPerPage={10}
+          serverMode
+          filters={filters}
+          onPageLoaded={handlePageLoaded}
         />
       </div>
 
@@ -112,10 +111,10 @@ export default function CampaignsPage() {
           <div className="flex items-center justify-between">
             <div>
               <p className="text-sm font-medium text-text-secondary">Total Campaigns</p>
-              <p className="text-2xl font-bold text-text-primary">{campaigns.length}</p>
+              <p className="text-2xl font-bold text-text-primary">{totalCampaigns}</p>
             </div>
             <div className="w-12 h-12 bg-primary-100 rounded-lg flex items-center justify-center">
-              <span className="text-primary-600 font-bold">{campaigns.length}</span>
+              <span className="text-primary-600 font-bold">{totalCampaigns}</span>
             </div>
           </div>
         </div>
@@ -125,7 +124,7 @@ export default function CampaignsPage() {
             <div>
               <p className="text-sm font-medium text-text-secondary">Active</p>
               <p className="text-2xl font-bold text-text-primary">
-                {campaigns.filter((c: any) => c.status === 'active').length}
+                {totals?.statusCounts.active ?? 0}
               </p>
             </div>
             <div className="w-12 h-12 bg-green-100 rounded-lg flex items-center justify-center">
@@ -139,7 +138,7 @@ export default function CampaignsPage() {
             <div>
               <p className="text-sm font-medium text-text-secondary">Paused</p>
               <p className="text-2xl font-bold text-text-primary">
-                {campaigns.filter((c: any) => c.status === 'paused').length}
+                {totals?.statusCounts.paused ?? 0}
               </p>
             </div>
             <div className="w-12 h-12 bg-yellow-100 rounded-lg flex items-center justify-center">
@@ -153,7 +152,7 @@ export default function CampaignsPage() {
             <div>
               <p className="text-sm font-medium text-text-secondary">Completed</p>
               <p className="text-2xl font-bold text-text-primary">
-                {campaigns.filter((c: any) => c.status === 'completed').length}
+                {totals?.statusCounts.completed ?? 0}
               </p>
             </div>
             <div className="w-12 h-12 bg-blue-100 rounded-lg flex items-center justify-center">
@@ -1,46 +1,43 @@
 'use client';
 
-import React, { useState, useEffect } from 'react';
+import React, { useMemo, useState } from 'react';
 import DashboardLayout from '@/components/layout/DashboardLayout';
-import LineChart from '@/components/charts/LineChart';
-import BarChart from '@/components/charts/BarChart';
-import { 
-  generateLineChartData, 
-  generateBarChartData 
-} from '@/lib/data';
+import {
+  LazyLineChart as LineChart,
+  LazyBarChart as BarChart
+} from '@/components/charts/LazyCharts';
+import { apiQueryKey, fetchSeries } from '@/lib/api';
+import { simulateLatency } from '@/lib/data';
+import { useDataFetching } from '@/lib/hooks';
+import { TIME_RANGE_DAYS, getRollupCube } from '@/lib/rollup';
 import { Calendar, Download, Filter, FileText, TrendingUp, Users, DollarSign } from 'lucide-react';
-import type { LineChartData, BarChartData } from '@/types/dashboard';
+import type { LineChartData, BarChartData, TimeRange } from '@/types/dashboard';
 
 export default function ReportsPage() {
-  const [isLoading, setIsLoading] = useState(true);
   const [selectedReport, setSelectedReport] = useState('performance');
-  const [dateRange, setDateRange] = useState('30d');
-  const [data, setData] = useState<{
+  const [dateRange, setDateRange] = useState<TimeRange>('30d');
+
+  // Same cache entry as the analytics page
+  const { data: series, loading: isLoading } = useDataFetching({
+    key: apiQueryKey('series'),
+    // Simulate API delay
+    fetchFn: (signal) => simulateLatency(600).then(() => fetchSeries({ signal })),
+    dependencies: [selectedReport],
+    onError: (error) => {
+      console.error('Reports data fetch error:', error);
+    }
+  });
+  const data: {
     lineChartData: LineChartData[];
     barChartData: BarChartData[];
-  }>({
+  } = series ?? {
     lineChartData: [],
     barChartData: []
-  });
-
-  // Simulate data loading
-  useEffect(() => {
-    const loadData = async () => {
-      setIsLoading(true);
-      
-      // Simulate API delay
-      await new Promise(resolve => setTimeout(resolve, 600));
-      
-      setData({
-        lineChartData: generateLineChartData(),
-        barChartData: generateBarChartData()
-      });
-      
-      setIsLoading(false);
-    };
-
-    loadData();
-  }, [dateRange, selectedReport]);
+  };
+  const lineChartData = useMemo(
+    () => getRollupCube(data.lineChartData).lastDays(TIME_RANGE_DAYS[dateRange]).data,
+    [data.lineChartData, dateRange]
+  );
 
   const reports = [
     {
@@ -98,7 +95,7 @@ export default function ReportsPage() {
           <div className="flex items-center gap-3">
             <select 
               value={dateRange}
-              onChange={(e) => setDateRange(e.target.value)}
+              onChange={(e) => setDateRange(e.target.value as TimeRange)}
               className="px-3 py-2 border border-gray-300 rounded-lg focus:ring-2 focus:ring-primary-500 focus:border-transparent text-sm"
             >
               <option value="7d">Last 7 days</option>
@@ -187,7 +184,7 @@ export default function ReportsPage() {
                       Performance Trend
                     </h3>
                     <LineChart
-                      data={data.lineChartData}
+                      data={lineChartData}
                       title="Revenue Trend"
                       loading={isLoading}
                       height={300}
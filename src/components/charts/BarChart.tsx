@@ -54,7 +54,7 @@ const CustomTooltip = ({ active, payload, label }: CustomTooltipProps) => {
   return null;
 };
 
-export default function BarChart({
+function BarChart({
   data,
   title = 'Traffic Sources',
   loading = false,
@@ -190,4 +190,6 @@ export default function BarChart({
       </div>
     </div>
   );
-} 
\ No newline at end of file
+}
+
+export default React.memo(BarChart);
\ No newline at end of file
@@ -51,7 +51,7 @@ const CustomTooltip = ({ active, payload, label }: CustomTooltipProps) => {
   return null;
 };
 
-export default function DonutChart({
+function DonutChart({
   data,
   title = 'Device Distribution',
   loading = false,
@@ -174,4 +174,6 @@ export default function DonutChart({
       </div>
     </div>
   );
-} 
\ No newline at end of file
+}
+
+export default React.memo(DonutChart);
\ No newline at end of file
@@ -0,0 +1,66 @@
+'use client';
+
+/**
+ * Code-split wrappers for the chart components.
+ *
+ * Recharts is only fetched for pages that render a chart, and only once the
+ * chart slot approaches the viewport (or the browser goes idle). Until then a
+ * skeleton with the chart's own loading markup holds its place, so layout and
+ * DOM structure are the same as with the eager components.
+ */
+
+import React, { ComponentType } from 'react';
+import dynamic from 'next/dynamic';
+import { useNearViewport } from '@/lib/hooks';
+import { cn } from '@/lib/utils';
+import { ChartProps } from '@/types/dashboard';
+
+interface ChartSkeletonProps {
+  className?: string;
+  ref?: React.Ref<HTMLDivElement>;
+}
+
+function ChartSkeleton({ className, ref }: ChartSkeletonProps) {
+  return (
+    <div ref={ref} className={cn(
+      "bg-white rounded-xl p-6 shadow-soft border border-gray-100",
+      "animate-pulse",
+      className
+    )}>
+      <div className="w-32 h-6 bg-gray-200 rounded mb-4"></div>
+      <div className="w-full h-[300px] bg-gray-200 rounded"></div>
+    </div>
+  );
+}
+
+/**
+ * Wrap a dynamically imported chart so its chunk is requested when the slot
+ * nears the viewport
+ */
+function deferred<P extends ChartProps>(Chart: ComponentType<P>, name: string) {
+  function DeferredChart(props: P) {
+    const { ref, near } = useNearViewport<HTMLDivElement>();
+    if (!near) {
+      return <ChartSkeleton ref={ref} className={props.className} />;
+    }
+    return <Chart {...props} />;
+  }
+  DeferredChart.displayName = `Lazy${name}`;
+  return React.memo(DeferredChart);
+}
+
+// Charts measure their container, so there is nothing useful to server-render
+export const LazyLineChart = deferred(
+  dynamic(() => import('./LineChart'), { ssr: false, loading: () => <ChartSkeleton /> }),
+  'LineChart'
+);
+
+export const LazyBarChart = deferred(
+  dynamic(() => import('./BarChart'), { ssr: false, loading: () => <ChartSkeleton /> }),
+  'BarChart'
+);
+
+export const LazyDonutChart = deferred(
+  dynamic(() => import('./DonutChart'), { ssr: false, loading: () => <ChartSkeleton /> }),
+  'DonutChart'
+);
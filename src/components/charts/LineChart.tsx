@@ -1,6 +1,6 @@
 'use client';
 
-import React from 'react';
+import React, { useState, useMemo, useRef, useEffect } from 'react';
 import {
   LineChart as RechartsLineChart,
   Line,
@@ -10,12 +10,37 @@ import {
   Tooltip,
   ResponsiveContainer,
   Area,
-  AreaChart
+  AreaChart,
+  ReferenceArea
 } from 'recharts';
-import { LineChartProps } from '@/types/dashboard';
+import { LineChartData, LineChartProps } from '@/types/dashboard';
+import { lttb } from '@/lib/downsample';
+import { formatDateColumn } from '@/lib/format';
 import { formatCurrency, formatDate } from '@/lib/utils';
 import { cn } from '@/lib/utils';
 
+// Plotted points per horizontal pixel; more cannot be told apart
+const POINTS_PER_PIXEL = 0.5;
+const FALLBACK_WIDTH = 800;
+// Point markers only while they are far enough apart to read
+const MAX_DOTTED_POINTS = 60;
+
+const revenueOf = (point: LineChartData) => point.revenue;
+
+/**
+ * Index of the point dated ``date`` in ``data`` (dates ascend)
+ */
+function indexOfDate(data: LineChartData[], date: string): number {
+  let low = 0;
+  let high = data.length - 1;
+  while (low < high) {
+    const mid = (low + high) >>> 1;
+    if (data[mid].date < date) low = mid + 1;
+    else high = mid;
+  }
+  return low;
+}
+
 interface CustomTooltipProps {
   active?: boolean;
   payload?: any[];
@@ -51,7 +76,7 @@ const CustomTooltip = ({ active, payload, label }: CustomTooltipProps) => {
   return null;
 };
 
-export default function LineChart({
+function LineChart({
   data,
   title = 'Revenue Trend',
   loading = false,
@@ -59,6 +84,48 @@ export default function LineChart({
   height = 300,
   className
 }: LineChartProps) {
+  const series = data as LineChartData[];
+  const containerRef = useRef<HTMLDivElement>(null);
+  const [width, setWidth] = useState(0);
+  // Zoomed range as indexes into the full series, and the drag in progress
+  const [zoom, setZoom] = useState<[number, number] | null>(null);
+  const [selection, setSelection] = useState<{ from: string; to: string } | null>(null);
+  const hasData = Boolean(series?.length);
+
+  // Re-observe once the container mounts, i.e. after loading/error/empty states
+  useEffect(() => {
+    const element = containerRef.current;
+    if (!element || typeof ResizeObserver === 'undefined') return;
+    const observer = new ResizeObserver(([entry]) => setWidth(Math.round(entry.contentRect.width)));
+    observer.observe(element);
+    return () => observer.disconnect();
+  }, [loading, error, hasData]);
+
+  // Downsample the visible range to what the chart width can show; zooming
+  // in or widening the chart brings back detail
+  const visible = useMemo(() => {
+    if (!hasData) return [];
+    const start = zoom ? Math.min(zoom[0], series.length - 1) : 0;
+    const end = zoom ? Math.min(zoom[1], series.length - 1) : series.length - 1;
+    const range = start === 0 && end === series.length - 1 ? series : series.slice(start, end + 1);
+    return lttb(range, (width || FALLBACK_WIDTH) * POINTS_PER_PIXEL, revenueOf);
+  }, [series, hasData, zoom, width]);
+
+  // Axis labels for the plotted dates, formatted as one column
+  const dateLabels = useMemo(() => {
+    const dates = visible.map((point) => point.date);
+    const labels = formatDateColumn(dates, 'short');
+    return new Map(dates.map((date, i) => [date, labels[i]]));
+  }, [visible]);
+
+  const finishSelection = () => {
+    if (selection && selection.from !== selection.to) {
+      const [from, to] = [selection.from, selection.to].sort();
+      setZoom([indexOfDate(series, from), indexOfDate(series, to)]);
+    }
+    setSelection(null);
+  };
+
   if (loading) {
     return (
       <div className={cn(
@@ -107,18 +174,36 @@ export default function LineChart({
       className
     )}>
       {/* Chart Title */}
-      <div className="mb-6">
-        <h3 className="text-lg font-semibold text-text-primary">{title}</h3>
-        <p className="text-sm text-text-secondary">
-          Last 30 days revenue performance
-        </p>
+      <div className="mb-6 flex items-start justify-between gap-4">
+        <div>
+          <h3 className="text-lg font-semibold text-text-primary">{title}</h3>
+          <p className="text-sm text-text-secondary">
+            Last 30 days revenue performance
+          </p>
+        </div>
+        {zoom && (
+          <button
+            onClick={() => setZoom(null)}
+            className="px-3 py-1 text-sm border border-gray-300 rounded-md hover:bg-gray-50 transition-colors"
+          >
+            Reset zoom
+          </button>
+        )}
       </div>
 
-      {/* Chart Container */}
-      <div className="w-full" style={{ height: `${height}px` }}>
+      {/* Chart Container (drag across the chart to zoom) */}
+      <div ref={containerRef} className="w-full" style={{ height: `${height}px` }}>
         <ResponsiveContainer width="100%" height="100%">
           <AreaChart
-            data={data}
+            data={visible}
+            onMouseDown={(state) => {
+              if (state?.activeLabel) setSelection({ from: String(state.activeLabel), to: String(state.activeLabel) });
+            }}
+            onMouseMove={(state) => {
+              if (selection && state?.activeLabel) setSelection({ ...selection, to: String(state.activeLabel) });
+            }}
+            onMouseUp={finishSelection}
+            onMouseLeave={() => setSelection(null)}
             margin={{
               top: 5,
               right: 30,
@@ -144,7 +229,7 @@ export default function LineChart({
               axisLine={false}
               tickLine={false}
               tick={{ fontSize: 12, fill: '#64748B' }}
-              tickFormatter={(value) => formatDate(value, 'short')}
+              tickFormatter={(value) => dateLabels.get(value) ?? formatDate(value, 'short')}
               interval="preserveStartEnd"
             />
             
@@ -171,12 +256,13 @@ export default function LineChart({
               stroke="#3B82F6"
               strokeWidth={3}
               fill="url(#colorRevenue)"
-              dot={{
+              dot={visible.length <= MAX_DOTTED_POINTS && {
                 fill: '#3B82F6',
                 strokeWidth: 2,
                 stroke: '#FFFFFF',
                 r: 4,
               }}
+              isAnimationActive={visible.length <= MAX_DOTTED_POINTS}
               activeDot={{
                 r: 6,
                 stroke: '#3B82F6',
@@ -184,6 +270,10 @@ export default function LineChart({
                 fill: '#FFFFFF',
               }}
             />
+
+            {selection && (
+              <ReferenceArea x1={selection.from} x2={selection.to} fill="#3B82F6" fillOpacity={0.1} />
+            )}
           </AreaChart>
         </ResponsiveContainer>
       </div>
@@ -197,4 +287,6 @@ export default function LineChart({
       </div>
     </div>
   );
-} 
\ No newline at end of file
+}
+
+export default React.memo(LineChart);
\ No newline at end of file
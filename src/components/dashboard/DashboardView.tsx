@@ -0,0 +1,420 @@
+'use client';
+
+import React, { Suspense, use, useState, useCallback, useLayoutEffect, useMemo, useRef, useSyncExternalStore } from 'react';
+import MetricCard from '@/components/dashboard/MetricCard';
+import {
+  LazyLineChart as LineChart,
+  LazyBarChart as BarChart,
+  LazyDonutChart as DonutChart
+} from '@/components/charts/LazyCharts';
+import DataTable from '@/components/dashboard/DataTable';
+import { 
+  DASHBOARD_SECTIONS,
+  simulateLatency,
+  simulateNetworkError,
+  simulateServerError,
+  simulateDataError
+} from '@/lib/data';
+import { apiQueryKey, fetchDashboardSection } from '@/lib/api';
+import { dataConfigQuery } from '@/lib/dataConfig';
+import { UseDataFetchingResult, useDataFetching, useLiveDashboard } from '@/lib/hooks';
+import { markRefreshPhase, markRefreshCommitted } from '@/lib/perf';
+import { RefreshCw, AlertCircle, WifiOff, Server } from 'lucide-react';
+import {
+  DashboardSection,
+  DashboardStream,
+  DashboardSummary,
+  MetricCard as MetricCardType
+} from '@/types/dashboard';
+import { cn } from '@/lib/utils';
+
+interface DashboardViewProps {
+  // Sections streamed by the server page, and the data config they were
+  // generated for
+  stream?: DashboardStream;
+  streamKey?: string;
+}
+
+const EMPTY_DASHBOARD: DashboardSummary = {
+  metrics: [],
+  lineChartData: [],
+  barChartData: [],
+  donutChartData: [],
+  campaigns: [],
+  lastUpdated: ''
+};
+
+const METRIC_PLACEHOLDERS: MetricCardType[] = Array.from({ length: 4 }, (_, index) => ({
+  id: `placeholder-${index}`,
+  title: '',
+  value: 0,
+  change: 0,
+  icon: 'TrendingUp',
+  format: 'number'
+}));
+
+const subscribeToNothing = () => () => {};
+
+type ErrorSimulation = 'network' | 'server' | 'data';
+
+const SIMULATED_ERRORS: Record<ErrorSimulation, () => Promise<never>> = {
+  network: simulateNetworkError,
+  server: simulateServerError,
+  data: simulateDataError
+};
+
+interface RefreshCycle {
+  // Sections whose next fetch should ask the API to regenerate
+  fresh: Set<DashboardSection>;
+  // Sections the current Refresh click is still waiting for
+  pending: Set<DashboardSection>;
+}
+
+/**
+ * Fetch one section through its own request, so each widget loads, fails
+ * and retries without waiting on the others
+ */
+function useDashboardSection<K extends DashboardSection>(
+  section: K,
+  errorSimulation: ErrorSimulation | null,
+  refresh: React.RefObject<RefreshCycle>
+): UseDataFetchingResult<DashboardSummary[K]> {
+  return useDataFetching({
+    // Simulated failures are never cached
+    key: errorSimulation ? undefined : apiQueryKey(`dashboard/${section}`),
+    fetchFn: (signal) => {
+      if (errorSimulation) {
+        return SIMULATED_ERRORS[errorSimulation]();
+      }
+      // Refresh asks the API for new data; other fetches accept its cached copy
+      const fresh = refresh.current.fresh.delete(section);
+      return simulateLatency(500)
+        .then(() => fetchDashboardSection(section, { fresh, signal }))
+        .finally(() => {
+          const { pending } = refresh.current;
+          if (pending.delete(section) && pending.size === 0) {
+            markRefreshPhase('fetched');
+          }
+        });
+    },
+    dependencies: [errorSimulation],
+    onError: (error) => {
+      console.error(`Dashboard ${section} fetch error:`, error);
+    }
+  });
+}
+
+interface SectionErrorProps {
+  message: string;
+  onRetry: () => void;
+  className?: string;
+}
+
+function SectionError({ message, onRetry, className }: SectionErrorProps) {
+  return (
+    <div
+      role="alert"
+      className={cn(
+        "bg-white rounded-xl p-6 shadow-soft border border-gray-100",
+        "flex flex-col items-center justify-center gap-3 text-center",
+        className
+      )}
+    >
+      <AlertCircle className="w-6 h-6 text-error-600" aria-hidden="true" />
+      <p className="text-sm text-text-secondary">{message}</p>
+      <button
+        onClick={onRetry}
+        className="px-3 py-1 text-sm border border-gray-300 rounded-md hover:bg-gray-50 transition-colors"
+      >
+        Retry
+      </button>
+    </div>
+  );
+}
+
+/**
+ * Render ``children`` with the resolved ``value``, suspending until then
+ */
+function Streamed<T>({ value, children }: { value: Promise<T>; children: (resolved: T) => React.ReactNode }) {
+  return <>{children(use(value))}</>;
+}
+
+export default function DashboardView({ stream, streamKey }: DashboardViewProps) {
+  const [errorSimulation, setErrorSimulation] = useState<ErrorSimulation | null>(null);
+  const refresh = useRef<RefreshCycle>({ fresh: new Set(), pending: new Set() });
+
+  // Every section is requested in parallel and settles on its own
+  const sections: { [K in DashboardSection]: UseDataFetchingResult<DashboardSummary[K]> } = {
+    metrics: useDashboardSection('metrics', errorSimulation, refresh),
+    lineChartData: useDashboardSection('lineChartData', errorSimulation, refresh),
+    barChartData: useDashboardSection('barChartData', errorSimulation, refresh),
+    donutChartData: useDashboardSection('donutChartData', errorSimulation, refresh),
+    campaigns: useDashboardSection('campaigns', errorSimulation, refresh)
+  };
+  const isLoading = DASHBOARD_SECTIONS.some((key) => sections[key].loading);
+
+  // Live deltas apply once every section has loaded
+  const { metrics, lineChartData, barChartData, donutChartData, campaigns } = sections;
+  const dashboardData = useMemo<DashboardSummary | null>(() => (
+    metrics.data && lineChartData.data && barChartData.data && donutChartData.data && campaigns.data
+      ? {
+          metrics: metrics.data,
+          lineChartData: lineChartData.data,
+          barChartData: barChartData.data,
+          donutChartData: donutChartData.data,
+          campaigns: campaigns.data,
+          lastUpdated: ''
+        }
+      : null
+  ), [metrics.data, lineChartData.data, barChartData.data, donutChartData.data, campaigns.data]);
+
+  // Streamed deltas on top of the last fetch
+  const liveData = useLiveDashboard(dashboardData);
+
+  // Client data config; the server snapshot keeps hydration consistent with
+  // the streamed HTML before session settings are read
+  const configKey = useSyncExternalStore(subscribeToNothing, () => dataConfigQuery(), () => streamKey);
+
+  // Refresh-cycle timing: commit is marked before the browser paints, once
+  // the last refreshed section is in
+  useLayoutEffect(() => {
+    if (dashboardData && refresh.current.pending.size === 0) {
+      markRefreshCommitted();
+    }
+  }, [dashboardData]);
+
+  const handleRefresh = useCallback(() => {
+    markRefreshPhase('click');
+    refresh.current = { fresh: new Set(DASHBOARD_SECTIONS), pending: new Set(DASHBOARD_SECTIONS) };
+    setErrorSimulation(null);
+    metrics.refetch();
+    lineChartData.refetch();
+    barChartData.refetch();
+    donutChartData.refetch();
+    campaigns.refetch();
+  }, [metrics.refetch, lineChartData.refetch, barChartData.refetch, donutChartData.refetch, campaigns.refetch]);
+
+  const handleErrorSimulation = useCallback(async (errorType: ErrorSimulation) => {
+    setErrorSimulation(errorType);
+  }, []);
+
+  // The page-level error view is kept for when nothing could load; a single
+  // failing section only replaces its own widget
+  const error = DASHBOARD_SECTIONS.every((key) => sections[key].error)
+    ? sections.metrics.error
+    : null;
+  if (error) {
+    return (
+      <div className="flex items-center justify-center min-h-[400px]">
+        <div className="text-center max-w-md">
+          <div className="w-16 h-16 bg-error-100 rounded-full flex items-center justify-center mx-auto mb-4">
+            {errorSimulation === 'network' ? (
+              <WifiOff className="w-8 h-8 text-error-600" aria-hidden="true" />
+            ) : errorSimulation === 'server' ? (
+              <Server className="w-8 h-8 text-error-600" aria-hidden="true" />
+            ) : (
+              <AlertCircle className="w-8 h-8 text-error-600" aria-hidden="true" />
+            )}
+          </div>
+          <h3 className="text-lg font-semibold text-text-primary mb-2">
+            {errorSimulation === 'network' ? 'Network Error' : 
+             errorSimulation === 'server' ? 'Server Error' : 
+             'Unable to Load Dashboard'}
+          </h3>
+          <p className="text-text-secondary mb-6">
+            {error.message}
+          </p>
+          <div className="flex gap-3 justify-center">
+            <button
+              onClick={handleRefresh}
+              className="px-4 py-2 bg-primary-500 text-white rounded-lg hover:bg-primary-600 transition-colors"
+              aria-label="Retry loading dashboard data"
+            >
+              Try Again
+            </button>
+            <button
+              onClick={() => setErrorSimulation(null)}
+              className="px-4 py-2 border border-gray-300 rounded-lg hover:bg-gray-50 transition-colors"
+              aria-label="Dismiss error message"
+            >
+              Dismiss
+            </button>
+          </div>
+          
+          {/* Error simulation controls for testing */}
+          <div className="mt-6 p-4 bg-gray-50 rounded-lg">
+            <p className="text-sm text-text-secondary mb-3">Test Error Handling:</p>
+            <div className="flex gap-2 justify-center">
+              <button
+                onClick={() => handleErrorSimulation('network')}
+                className="px-3 py-1 text-xs bg-yellow-100 text-yellow-800 rounded hover:bg-yellow-200 transition-colors"
+              >
+                Network Error
+              </button>
+              <button
+                onClick={() => handleErrorSimulation('server')}
+                className="px-3 py-1 text-xs bg-red-100 text-red-800 rounded hover:bg-red-200 transition-colors"
+              >
+                Server Error
+              </button>
+              <button
+                onClick={() => handleErrorSimulation('data')}
+                className="px-3 py-1 text-xs bg-orange-100 text-orange-800 rounded hover:bg-orange-200 transition-colors"
+              >
+                Data Error
+              </button>
+            </div>
+          </div>
+        </div>
+      </div>
+    );
+  }
+
+  // One Suspense boundary per widget while the server stream is in use, so
+  // each appears as soon as its own data resolves. Until a section's client
+  // fetch lands, the stream stands in for it as long as the server rendered
+  // for the same data config.
+  const streamed = stream && configKey === streamKey ? stream : null;
+  const section = <K extends DashboardSection>(
+    key: K,
+    render: (value: DashboardSummary[K], loading: boolean) => React.ReactNode,
+    errorClassName?: string
+  ) => {
+    const { data, loading, error, refetch } = sections[key];
+    if (error) {
+      return <SectionError message={error.message} onRetry={refetch} className={errorClassName} />;
+    }
+    const value = liveData ? liveData[key] : data;
+    if (value === null && streamed) {
+      return (
+        <Suspense fallback={render(EMPTY_DASHBOARD[key], true)}>
+          <Streamed value={streamed[key]}>
+            {(resolved) => (resolved === null ? render(EMPTY_DASHBOARD[key], true) : render(resolved, false))}
+          </Streamed>
+        </Suspense>
+      );
+    }
+    return render(value ?? EMPTY_DASHBOARD[key], loading);
+  };
+
+  return (
+    <>
+      {/* Header Section */}
+      <div className="mb-8">
+        <div className="flex flex-col sm:flex-row sm:items-center sm:justify-between gap-4">
+          <div>
+            <h1 className="text-3xl font-bold text-text-primary">Dashboard Overview</h1>
+            <p className="text-text-secondary mt-1">
+              Monitor your marketing performance and campaign insights
+            </p>
+          </div>
+          
+          <div className="flex items-center gap-3">
+            <select 
+              className="px-3 py-2 border border-gray-300 rounded-lg focus:ring-2 focus:ring-primary-500 focus:border-transparent text-sm"
+              aria-label="Select time period"
+            >
+              <option>Last 7 days</option>
+              <option>Last 30 days</option>
+              <option>Last 90 days</option>
+            </select>
+            
+            <button
+              onClick={handleRefresh}
+              disabled={isLoading}
+              className="p-2 border border-gray-300 rounded-lg hover:bg-gray-50 disabled:opacity-50 disabled:cursor-not-allowed transition-colors"
+              title="Refresh data"
+              aria-label="Refresh dashboard data"
+            >
+              <RefreshCw className={cn(
+                "w-4 h-4 text-text-secondary",
+                isLoading && "animate-spin"
+              )} aria-hidden="true" />
+            </button>
+          </div>
+        </div>
+      </div>
+
+      {/* Metrics Grid */}
+      <div className="mb-8">
+        <h2 className="sr-only">Key Performance Metrics</h2>
+        <div className="grid-responsive">
+          {section('metrics', (metrics, loading) => (
+            (loading && metrics.length === 0 ? METRIC_PLACEHOLDERS : metrics).map((metric) => (
+              <MetricCard
+                key={metric.id}
+                title={metric.title}
+                value={metric.value}
+                change={metric.change}
+                icon={metric.icon}
+                format={metric.format}
+                description={metric.description}
+                loading={loading}
+              />
+            ))
+          ))}
+        </div>
+      </div>
+
+      {/* Charts Section */}
+      <div className="mb-8">
+        <h2 className="text-xl font-semibold text-text-primary mb-6">
+          Performance Analytics
+        </h2>
+        
+        <div className="grid-charts-responsive mb-6">
+          {/* Line Chart - 2/3 width on desktop */}
+          <div className="lg:col-span-2">
+            {section('lineChartData', (lineChartData, loading) => (
+              <LineChart
+                data={lineChartData}
+                title="Revenue Trend"
+                loading={loading}
+                height={300}
+              />
+            ), 'h-full min-h-[300px]')}
+          </div>
+          
+          {/* Donut Chart - 1/3 width on desktop */}
+          <div className="lg:col-span-1">
+            {section('donutChartData', (donutChartData, loading) => (
+              <DonutChart
+                data={donutChartData}
+                title="Device Distribution"
+                loading={loading}
+                height={300}
+              />
+            ), 'h-full min-h-[300px]')}
+          </div>
+        </div>
+        
+        {/* Bar Chart - Full width */}
+        <div className="w-full">
+          {section('barChartData', (barChartData, loading) => (
+            <BarChart
+              data={barChartData}
+              title="Traffic Sources"
+              loading={loading}
+              height={300}
+            />
+          ), 'min-h-[300px]')}
+        </div>
+      </div>
+
+      {/* Data Table Section */}
+      <div>
+        <h2 className="text-xl font-semibold text-text-primary mb-6">
+          Campaign Performance
+        </h2>
+        
+        {section('campaigns', (campaigns, loading) => (
+          <DataTable
+            data={campaigns}
+            loading={loading}
+            itemsPerPage={10}
+          />
+        ))}
+      </div>
+    </>
+  );
+} 
\ No newline at end of file
@@ -1,6 +1,6 @@
 'use client';
 
-import React, { useState, useMemo, useCallback } from 'react';
+import React, { useState, useMemo, useCallback, useEffect, useRef } from 'react';
 import { 
   ChevronUp, 
   ChevronDown, 
@@ -11,11 +11,122 @@ import {
   Play,
   Trash2
 } from 'lucide-react';
-import { CampaignTableProps } from '@/types/dashboard';
-import { formatCurrency, formatNumber, formatPercentage, getStatusColor, sortData, searchData, paginateData } from '@/lib/utils';
+import { CampaignData, CampaignPage, CampaignTableProps } from '@/types/dashboard';
+import { ApiError, fetchCampaignPage } from '@/lib/api';
+import { selectCampaigns } from '@/lib/campaignQuery';
+import { prepareSortIndex } from '@/lib/compute';
+import { formatColumn, formatCurrencyColumn } from '@/lib/format';
+import { formatNumber, formatPercentage, getStatusColor, paginateData } from '@/lib/utils';
 import { cn } from '@/lib/utils';
 
-export default function DataTable({
+// Delay before a typed search is applied (or sent to the server)
+const SEARCH_DEBOUNCE_MS = 200;
+// Pages longer than this are windowed unless `virtualized` says otherwise
+const VIRTUALIZE_THRESHOLD = 100;
+const DEFAULT_ROW_HEIGHT = 73;
+const DEFAULT_VIEWPORT_HEIGHT = 600;
+const OVERSCAN_ROWS = 8;
+
+// Display strings for a row's numeric cells
+interface CampaignCells {
+  clicks: string;
+  conversions: string;
+  cost: string;
+  cpc: string;
+}
+
+// Kept per campaign object, so a row whose campaign is unchanged gets the
+// same cells back and its memoized render is skipped
+const cellCache = new WeakMap<CampaignData, CampaignCells>();
+
+/**
+ * Cells for ``rows``; rows not formatted before are formatted column by
+ * column, one formatter lookup per column instead of per cell
+ */
+function formatCampaignCells(rows: CampaignData[]): CampaignCells[] {
+  const missing = rows.filter((row) => !cellCache.has(row));
+  if (missing.length > 0) {
+    const clicks = formatColumn(missing.map((row) => row.clicks), formatNumber);
+    const conversions = formatColumn(missing.map((row) => row.conversions), formatNumber);
+    const cost = formatCurrencyColumn(missing.map((row) => row.cost));
+    const cpc = formatCurrencyColumn(missing.map((row) => row.cpc));
+    missing.forEach((row, i) => {
+      cellCache.set(row, { clicks: clicks[i], conversions: conversions[i], cost: cost[i], cpc: cpc[i] });
+    });
+  }
+  return rows.map((row) => cellCache.get(row) as CampaignCells);
+}
+
+interface CampaignRowProps {
+  campaign: CampaignData;
+  cells: CampaignCells;
+  height?: number;
+}
+
+/**
+ * One campaign row; memoized so scrolling a virtualized table only renders
+ * the rows entering the window
+ */
+const CampaignRow = React.memo(function CampaignRow({ campaign, cells, height }: CampaignRowProps) {
+  return (
+    <tr className="hover:bg-gray-50 transition-colors" style={height ? { height } : undefined}>
+      <td className="px-6 py-4 whitespace-nowrap">
+        <div className="flex items-center">
+          <div className="flex-shrink-0">
+            <div className="w-2 h-2 rounded-full bg-primary-500"></div>
+          </div>
+          <div className="ml-4">
+            <div className="text-sm font-medium text-text-primary">
+              {campaign.name}
+            </div>
+            <div className="text-sm text-text-secondary">
+              {campaign.conversionRate}% conv. rate
+            </div>
+          </div>
+        </div>
+      </td>
+      <td className="px-6 py-4 whitespace-nowrap text-right text-sm text-text-primary">
+        {cells.clicks}
+      </td>
+      <td className="px-6 py-4 whitespace-nowrap text-right text-sm text-text-primary">
+        {cells.conversions}
+      </td>
+      <td className="px-6 py-4 whitespace-nowrap text-right text-sm text-text-primary">
+        {cells.cost}
+      </td>
+      <td className="px-6 py-4 whitespace-nowrap text-right text-sm text-text-primary">
+        {cells.cpc}
+      </td>
+      <td className="px-6 py-4 whitespace-nowrap text-center">
+        <span className={cn(
+          "inline-flex px-2 py-1 text-xs font-medium rounded-full",
+          getStatusColor(campaign.status)
+        )}>
+          {campaign.status.charAt(0).toUpperCase() + campaign.status.slice(1)}
+        </span>
+      </td>
+      <td className="px-6 py-4 whitespace-nowrap text-center text-sm">
+        <div className="flex items-center justify-center gap-2">
+          <button className="p-1 hover:bg-gray-100 rounded transition-colors">
+            <Edit className="w-4 h-4 text-gray-400" />
+          </button>
+          <button className="p-1 hover:bg-gray-100 rounded transition-colors">
+            {campaign.status === 'active' ? (
+              <Pause className="w-4 h-4 text-warning-500" />
+            ) : (
+              <Play className="w-4 h-4 text-success-500" />
+            )}
+          </button>
+          <button className="p-1 hover:bg-gray-100 rounded transition-colors">
+            <MoreHorizontal className="w-4 h-4 text-gray-400" />
+          </button>
+        </div>
+      </td>
+    </tr>
+  );
+});
+
+function DataTable({
   data,
   loading = false,
   error,
@@ -26,49 +137,180 @@ export default function DataTable({
   onSort,
   onPageChange,
   onSearch,
-  className
+  className,
+  serverMode = false,
+  filters,
+  onPageLoaded,
+  virtualized,
+  rowHeight = DEFAULT_ROW_HEIGHT,
+  viewportHeight = DEFAULT_VIEWPORT_HEIGHT
 }: CampaignTableProps) {
   const [searchQuery, setSearchQuery] = useState('');
   const [sortBy, setSortBy] = useState(initialSortBy || 'name');
   const [sortDirection, setSortDirection] = useState<'asc' | 'desc' | null>(initialSortDirection || null);
   const [currentPage, setCurrentPage] = useState(initialCurrentPage);
 
+  // Server mode state: the current page and the cursor it was requested with
+  const [serverPage, setServerPage] = useState<CampaignPage | null>(null);
+  const [serverError, setServerError] = useState<string | null>(null);
+  const [debouncedSearch, setDebouncedSearch] = useState('');
+  const [cursorState, setCursorState] = useState<{ key: string; cursor: string | null }>({ key: '', cursor: null });
+  const onPageLoadedRef = useRef(onPageLoaded);
+  onPageLoadedRef.current = onPageLoaded;
+
+  // The table's own search box takes precedence over the page-level filter;
+  // the input updates immediately, the query once typing pauses
+  const searchText = searchQuery.trim() || filters?.search?.trim() || '';
+  useEffect(() => {
+    const timeout = setTimeout(() => setDebouncedSearch(searchText), SEARCH_DEBOUNCE_MS);
+    return () => clearTimeout(timeout);
+  }, [searchText]);
+
+  const statusKey = filters?.statuses?.join(',') ?? '';
+  const queryKey = JSON.stringify([sortBy, sortDirection, debouncedSearch, statusKey, itemsPerPage]);
+  // A new sort, search or filter starts again from the first page
+  const cursor = cursorState.key === queryKey ? cursorState.cursor : null;
+
+  useEffect(() => {
+    if (!serverMode) return;
+    const controller = new AbortController();
+
+    fetchCampaignPage({
+      sortBy: sortBy as keyof CampaignData,
+      sortDirection,
+      search: debouncedSearch,
+      statuses: filters?.statuses,
+      cursor,
+      limit: itemsPerPage
+    }, { signal: controller.signal })
+      .then((page) => {
+        setServerPage(page);
+        setServerError(null);
+        onPageLoadedRef.current?.(page);
+      })
+      .catch((err) => {
+        if (controller.signal.aborted) return;
+        // The dataset was regenerated under this cursor: start over from the first page
+        if (err instanceof ApiError && err.status === 409 && cursor) {
+          setCursorState({ key: queryKey, cursor: null });
+          return;
+        }
+        setServerError(err instanceof Error ? err.message : 'Failed to load campaigns');
+      });
+
+    // Aborting also drops the response of a query that has been superseded
+    return () => controller.abort();
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+  }, [serverMode, queryKey, cursor]);
+
   // Filter and sort data
   const filteredData = useMemo(() => {
-    let result = data;
-    
-    // Apply search filter
-    if (searchQuery.trim()) {
-      result = searchData(result, searchQuery, ['name']);
-    }
+    if (serverMode) return [];
     
-    // Apply sorting
-    if (sortDirection) {
-      result = sortData(result, sortBy as keyof typeof data[0], sortDirection);
-    }
-    
-    return result;
-  }, [data, searchQuery, sortBy, sortDirection]);
+    // Indexed search and sort over the full dataset
+    return selectCampaigns(data, {
+      sortBy: sortBy as keyof CampaignData,
+      sortDirection,
+      search: debouncedSearch,
+      statuses: filters?.statuses
+    });
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+  }, [serverMode, data, debouncedSearch, statusKey, sortBy, sortDirection]);
 
   // Paginate data
   const { data: paginatedData, meta } = useMemo(() => {
+    if (serverMode) {
+      const matched = serverPage?.matchedItems ?? 0;
+      return {
+        data: serverPage?.items ?? [],
+        meta: {
+          currentPage: Math.floor((serverPage?.offset ?? 0) / itemsPerPage) + 1,
+          totalPages: Math.ceil(matched / itemsPerPage),
+          totalItems: matched,
+          itemsPerPage,
+          hasNextPage: Boolean(serverPage?.nextCursor),
+          hasPreviousPage: Boolean(serverPage?.prevCursor)
+        }
+      };
+    }
     return paginateData(filteredData, currentPage, itemsPerPage);
-  }, [filteredData, currentPage, itemsPerPage]);
+  }, [serverMode, serverPage, filteredData, currentPage, itemsPerPage]);
+  const displayPage = serverMode ? meta.currentPage : currentPage;
+
+  // Windowed rendering: only rows in (or near) the viewport are mounted and
+  // spacer rows keep the scroll height
+  const scrollRef = useRef<HTMLDivElement>(null);
+  const scrollFrame = useRef(0);
+  const [scrollTop, setScrollTop] = useState(0);
+  const isVirtual = virtualized ?? paginatedData.length > VIRTUALIZE_THRESHOLD;
+
+  const handleScroll = useCallback(() => {
+    if (scrollFrame.current) return;
+    scrollFrame.current = requestAnimationFrame(() => {
+      scrollFrame.current = 0;
+      setScrollTop(scrollRef.current?.scrollTop ?? 0);
+    });
+  }, []);
+
+  useEffect(() => () => cancelAnimationFrame(scrollFrame.current), []);
+
+  // A new page, sort, search, filter or page size starts at the top; live
+  // updates replace the row array too, but keep the scroll position
+  useEffect(() => {
+    if (scrollRef.current) scrollRef.current.scrollTop = 0;
+    setScrollTop(0);
+  }, [displayPage, sortBy, sortDirection, debouncedSearch, statusKey, itemsPerPage]);
+
+  const firstRow = isVirtual ? Math.max(0, Math.floor(scrollTop / rowHeight) - OVERSCAN_ROWS) : 0;
+  const lastRow = isVirtual
+    ? Math.min(paginatedData.length, firstRow + Math.ceil(viewportHeight / rowHeight) + 2 * OVERSCAN_ROWS)
+    : paginatedData.length;
+  const visibleRows = isVirtual ? paginatedData.slice(firstRow, lastRow) : paginatedData;
+  // Formatted once per page, so scrolling reuses the same strings
+  const pageCells = useMemo(() => formatCampaignCells(paginatedData), [paginatedData]);
+  const topSpacer = firstRow * rowHeight;
+  const bottomSpacer = (paginatedData.length - lastRow) * rowHeight;
+
+  // The last requested sort, which may still be waiting on the worker: clicks
+  // cycle from it, and only the newest request is applied
+  const requestedSort = useRef<{ column: string; direction: 'asc' | 'desc' | null }>({
+    column: sortBy,
+    direction: sortDirection
+  });
+  const sortRequest = useRef(0);
+  useEffect(() => () => {
+    sortRequest.current += 1;
+  }, []);
 
   // Handle sorting
   const handleSort = useCallback((column: string) => {
-    const newDirection = 
-      sortBy === column && sortDirection === 'asc' ? 'desc' :
-      sortBy === column && sortDirection === 'desc' ? null : 'asc';
+    const previous = requestedSort.current;
+    const newDirection =
+      previous.column === column && previous.direction === 'asc' ? 'desc' :
+      previous.column === column && previous.direction === 'desc' ? null : 'asc';
+    requestedSort.current = { column, direction: newDirection };
+    const request = ++sortRequest.current;
+
+    const applySort = () => {
+      // Superseded by a later click, or the table unmounted
+      if (request !== sortRequest.current) return;
+      setSortBy(column);
+      setSortDirection(newDirection);
+      setCurrentPage(1); // Reset to first page when sorting
+    };
     
-    setSortBy(column);
-    setSortDirection(newDirection);
-    setCurrentPage(1); // Reset to first page when sorting
+    // Large datasets build the column's sort index in the compute worker
+    // first, so the re-render only gathers rows
+    if (!serverMode && newDirection) {
+      prepareSortIndex(data, column as keyof CampaignData).then(applySort);
+    } else {
+      applySort();
+    }
     
     if (onSort) {
       onSort(column);
     }
-  }, [sortBy, sortDirection, onSort]);
+  }, [serverMode, data, onSort]);
 
   // Handle search
   const handleSearch = useCallback((query: string) => {
@@ -83,11 +325,15 @@ export default function DataTable({
   // Handle page change
   const handlePageChange = useCallback((page: number) => {
     setCurrentPage(page);
+    if (serverMode && serverPage) {
+      const target = page > meta.currentPage ? serverPage.nextCursor : serverPage.prevCursor;
+      setCursorState({ key: queryKey, cursor: target });
+    }
     
     if (onPageChange) {
       onPageChange(page);
     }
-  }, [onPageChange]);
+  }, [onPageChange, serverMode, serverPage, meta.currentPage, queryKey]);
 
   // Get sort icon
   const getSortIcon = (column: string) => {
@@ -103,7 +349,8 @@ export default function DataTable({
     return <ChevronUp className="w-4 h-4 text-gray-400" />;
   };
 
-  if (loading) {
+  // Earlier pages stay on screen while the next one loads
+  if (loading || (serverMode && !serverPage && !serverError)) {
     return (
       <div className={cn(
         "bg-white rounded-xl shadow-soft border border-gray-100",
@@ -122,7 +369,7 @@ export default function DataTable({
     );
   }
 
-  if (error) {
+  if (error || (serverMode && serverError)) {
     return (
       <div className={cn(
         "bg-white rounded-xl shadow-soft border border-gray-100 p-6",
@@ -131,7 +378,7 @@ export default function DataTable({
       )}>
         <div className="text-center">
           <div className="text-error-500 text-sm mb-1">Table Error</div>
-          <div className="text-text-secondary text-xs">{error}</div>
+          <div className="text-text-secondary text-xs">{error || serverError}</div>
         </div>
       </div>
     );
@@ -167,7 +414,12 @@ export default function DataTable({
       </div>
 
       {/* Table */}
-      <div className="overflow-x-auto">
+      <div
+        ref={scrollRef}
+        className={cn("overflow-x-auto", isVirtual && "overflow-y-auto")}
+        style={isVirtual ? { maxHeight: viewportHeight } : undefined}
+        onScroll={isVirtual ? handleScroll : undefined}
+      >
         <table className="w-full">
           <thead className="bg-gray-50 sticky top-0">
             <tr>
@@ -225,62 +477,16 @@ export default function DataTable({
             </tr>
           </thead>
           <tbody className="bg-white divide-y divide-gray-100">
-            {paginatedData.map((campaign) => (
-              <tr key={campaign.id} className="hover:bg-gray-50 transition-colors">
-                <td className="px-6 py-4 whitespace-nowrap">
-                  <div className="flex items-center">
-                    <div className="flex-shrink-0">
-                      <div className="w-2 h-2 rounded-full bg-primary-500"></div>
-                    </div>
-                    <div className="ml-4">
-                      <div className="text-sm font-medium text-text-primary">
-                        {campaign.name}
-                      </div>
-                      <div className="text-sm text-text-secondary">
-                        {campaign.conversionRate}% conv. rate
-                      </div>
-                    </div>
-                  </div>
-                </td>
-                <td className="px-6 py-4 whitespace-nowrap text-right text-sm text-text-primary">
-                  {formatNumber(campaign.clicks)}
-                </td>
-                <td className="px-6 py-4 whitespace-nowrap text-right text-sm text-text-primary">
-                  {formatNumber(campaign.conversions)}
-                </td>
-                <td className="px-6 py-4 whitespace-nowrap text-right text-sm text-text-primary">
-                  {formatCurrency(campaign.cost)}
-                </td>
-                <td className="px-6 py-4 whitespace-nowrap text-right text-sm text-text-primary">
-                  {formatCurrency(campaign.cpc)}
-                </td>
-                <td className="px-6 py-4 whitespace-nowrap text-center">
-                  <span className={cn(
-                    "inline-flex px-2 py-1 text-xs font-medium rounded-full",
-                    getStatusColor(campaign.status)
-                  )}>
-                    {campaign.status.charAt(0).toUpperCase() + campaign.status.slice(1)}
-                  </span>
-                </td>
-                <td className="px-6 py-4 whitespace-nowrap text-center text-sm">
-                  <div className="flex items-center justify-center gap-2">
-                    <button className="p-1 hover:bg-gray-100 rounded transition-colors">
-                      <Edit className="w-4 h-4 text-gray-400" />
-                    </button>
-                    <button className="p-1 hover:bg-gray-100 rounded transition-colors">
-                      {campaign.status === 'active' ? (
-                        <Pause className="w-4 h-4 text-warning-500" />
-                      ) : (
-                        <Play className="w-4 h-4 text-success-500" />
-                      )}
-                    </button>
-                    <button className="p-1 hover:bg-gray-100 rounded transition-colors">
-                      <MoreHorizontal className="w-4 h-4 text-gray-400" />
-                    </button>
-                  </div>
-                </td>
-              </tr>
+            {topSpacer > 0 && <tr aria-hidden="true" style={{ height: topSpacer }} />}
+            {visibleRows.map((campaign, index) => (
+              <CampaignRow
+                key={campaign.id}
+                campaign={campaign}
+                cells={pageCells[firstRow + index]}
+                height={isVirtual ? rowHeight : undefined}
+              />
             ))}
+            {bottomSpacer > 0 && <tr aria-hidden="true" style={{ height: bottomSpacer }} />}
           </tbody>
         </table>
       </div>
@@ -290,21 +496,21 @@ export default function DataTable({
         <div className="px-6 py-4 border-t border-gray-100">
           <div className="flex items-center justify-between">
             <div className="text-sm text-text-secondary">
-              Showing {((currentPage - 1) * itemsPerPage) + 1} to {Math.min(currentPage * itemsPerPage, meta.totalItems)} of {meta.totalItems} results
+              Showing {((displayPage - 1) * itemsPerPage) + 1} to {Math.min(displayPage * itemsPerPage, meta.totalItems)} of {meta.totalItems} results
             </div>
             <div className="flex items-center gap-2">
               <button
-                onClick={() => handlePageChange(currentPage - 1)}
+                onClick={() => handlePageChange(displayPage - 1)}
                 disabled={!meta.hasPreviousPage}
                 className="px-3 py-1 text-sm border border-gray-300 rounded-md hover:bg-gray-50 disabled:opacity-50 disabled:cursor-not-allowed transition-colors"
               >
                 Previous
               </button>
               <span className="px-3 py-1 text-sm text-text-primary">
-                Page {currentPage} of {meta.totalPages}
+                Page {displayPage} of {meta.totalPages}
               </span>
               <button
-                onClick={() => handlePageChange(currentPage + 1)}
+                onClick={() => handlePageChange(displayPage + 1)}
                 disabled={!meta.hasNextPage}
                 className="px-3 py-1 text-sm border border-gray-300 rounded-md hover:bg-gray-50 disabled:opacity-50 disabled:cursor-not-allowed transition-colors"
               >
@@ -319,10 +525,12 @@ export default function DataTable({
       {paginatedData.length === 0 && (
         <div className="px-6 py-12 text-center">
           <div className="text-text-secondary text-sm">
-            {searchQuery ? 'No campaigns match your search.' : 'No campaigns available.'}
+            {searchQuery || debouncedSearch ? 'No campaigns match your search.' : 'No campaigns available.'}
           </div>
         </div>
       )}
     </div>
   );
-} 
\ No newline at end of file
+}
+
+export default React.memo(DataTable);
\ No newline at end of file
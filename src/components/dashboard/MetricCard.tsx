@@ -22,7 +22,7 @@ const iconMap = {
   Minus
 };
 
-export default function MetricCard({
+function MetricCard({
   title,
   value,
   change,
@@ -134,4 +134,6 @@ export default function MetricCard({
       </div>
     </div>
   );
-} 
\ No newline at end of file
+}
+
+export default React.memo(MetricCard);
\ No newline at end of file
@@ -0,0 +1,113 @@
+/**
+ * Client for the data API routes (src/app/api).
+ *
+ * The current data configuration (seed, sizes, test mode) is forwarded as
+ * query params. Responses are kept with their ETag and revalidated with
+ * If-None-Match, so an unchanged dataset costs a 304 and no JSON parsing.
+ */
+
+import {
+  CampaignData,
+  CampaignPage,
+  CampaignQuery,
+  DashboardSection,
+  DashboardSummary,
+  SeriesData
+} from '@/types/dashboard';
+import { campaignQueryParams } from './campaignQuery';
+import { dataConfigQuery } from './dataConfig';
+
+interface FetchOptions {
+  // Ask the server to regenerate rather than serve its cached copy
+  fresh?: boolean;
+  signal?: AbortSignal;
+}
+
+const responses = new Map<string, { etag: string; data: unknown }>();
+
+/**
+ * Non-OK API response; ``status`` is the HTTP status code
+ */
+export class ApiError extends Error {
+  constructor(message: string, readonly status: number) {
+    super(message);
+    this.name = 'ApiError';
+  }
+}
+
+/**
+ * useDataFetching cache key for an endpoint under the current data config
+ */
+export function apiQueryKey(name: string): string {
+  const query = dataConfigQuery();
+  return query ? `${name}?${query}` : name;
+}
+
+async function getJson<T>(
+  path: string,
+  { fresh = false, signal }: FetchOptions = {},
+  extraParams?: URLSearchParams
+): Promise<T> {
+  const params = new URLSearchParams(dataConfigQuery());
+  extraParams?.forEach((value, key) => params.set(key, value));
+  const query = params.toString();
+  const url = query ? `${path}?${query}` : path;
+  const cached = responses.get(url);
+
+  const response = await fetch(fresh ? `${url}${query ? '&' : '?'}fresh=1` : url, {
+    cache: 'no-store',
+    headers: cached && !fresh ? { 'If-None-Match': cached.etag } : undefined,
+    signal
+  });
+  if (response.status === 304 && cached) {
+    return cached.data as T;
+  }
+  if (!response.ok) {
+    throw new ApiError('Failed to fetch data from server. Please try again later.', response.status);
+  }
+
+  const data = await response.json() as T;
+  const etag = response.headers.get('ETag');
+  if (etag) {
+    responses.set(url, { etag, data });
+  }
+  return data;
+}
+
+/**
+ * Complete dashboard data
+ */
+export function fetchDashboard(options?: FetchOptions): Promise<DashboardSummary> {
+  return getJson<DashboardSummary>('/api/dashboard', options);
+}
+
+/**
+ * One dashboard section, fetched independently of the others
+ */
+export function fetchDashboardSection<K extends DashboardSection>(
+  section: K,
+  options?: FetchOptions
+): Promise<DashboardSummary[K]> {
+  return getJson<DashboardSummary[K]>(`/api/dashboard/${section}`, options);
+}
+
+/**
+ * All campaigns
+ */
+export function fetchCampaigns(options?: FetchOptions): Promise<CampaignData[]> {
+  return getJson<CampaignData[]>('/api/campaigns', options);
+}
+
+/**
+ * One page of campaigns, sorted, searched and filtered on the server
+ */
+export function fetchCampaignPage(query: CampaignQuery, options?: FetchOptions): Promise<CampaignPage> {
+  return getJson<CampaignPage>('/api/campaigns/query', options, campaignQueryParams(query));
+}
+
+/**
+ * Line, bar and donut chart series
+ */
+export function fetchSeries(options?: FetchOptions): Promise<SeriesData> {
+  return getJson<SeriesData>('/api/series', options);
+}
@@ -0,0 +1,161 @@
+/**
+ * In-memory TTL cache for the data API routes.
+ *
+ * Each payload is serialized once and stored with an ETag, so repeat requests
+ * cost a map lookup: a 304 when the client already holds that version, the
+ * cached body otherwise. Concurrent misses for the same key share one
+ * generation.
+ */
+
+import { createHash } from 'crypto';
+import { CampaignData } from '@/types/dashboard';
+import { generateCampaignData } from './data';
+import { DataConfig, dataConfigQuery } from './dataConfig';
+
+interface CacheEntry {
+  body: string;
+  etag: string;
+  expires: number;
+}
+
+export const API_CACHE_TTL_MS = Number(process.env.DATA_CACHE_TTL_MS) || 60000;
+const MAX_ENTRIES = 100;
+
+const entries = new Map<string, CacheEntry>();
+const pending = new Map<string, Promise<CacheEntry>>();
+const values = new Map<string, { value: unknown; expires: number }>();
+const datasetVersions = new WeakMap<CampaignData[], string>();
+let datasetGeneration = 0;
+
+function evictOldest<T>(map: Map<string, T>) {
+  while (map.size > MAX_ENTRIES) {
+    map.delete(map.keys().next().value as string);
+  }
+}
+
+function cacheKey(name: string, config: DataConfig): string {
+  const query = dataConfigQuery(config);
+  return query ? `${name}?${query}` : name;
+}
+
+function createEntry(payload: unknown, ttlMs: number): CacheEntry {
+  const body = JSON.stringify(payload);
+  const etag = `"${createHash('sha1').update(body).digest('base64url')}"`;
+  return { body, etag, expires: Date.now() + ttlMs };
+}
+
+/**
+ * Cached entry for ``key``, generating it when missing, expired or ``fresh``
+ */
+export async function getCached(
+  key: string,
+  factory: () => unknown | Promise<unknown>,
+  { fresh = false, ttlMs = API_CACHE_TTL_MS }: { fresh?: boolean; ttlMs?: number } = {}
+): Promise<{ entry: CacheEntry; hit: boolean }> {
+  const cached = entries.get(key);
+  if (cached && !fresh && cached.expires > Date.now()) {
+    return { entry: cached, hit: true };
+  }
+
+  let generating = pending.get(key);
+  if (!generating) {
+    generating = Promise.resolve()
+      .then(factory)
+      .then((payload) => createEntry(payload, ttlMs))
+      .finally(() => pending.delete(key));
+    pending.set(key, generating);
+  }
+  const entry = await generating;
+
+  // Re-insert so Map order tracks recency, then drop the oldest entries
+  entries.delete(key);
+  entries.set(key, entry);
+  evictOldest(entries);
+  return { entry, hit: false };
+}
+
+/**
+ * Unserialized value with the same TTL, for data that routes query into
+ * (the same array instance is returned until it expires)
+ */
+export function getCachedValue<T>(
+  key: string,
+  factory: () => T,
+  { fresh = false, ttlMs = API_CACHE_TTL_MS }: { fresh?: boolean; ttlMs?: number } = {}
+): T {
+  const cached = values.get(key);
+  if (cached && !fresh && cached.expires > Date.now()) {
+    return cached.value as T;
+  }
+  const value = factory();
+  values.delete(key);
+  values.set(key, { value, expires: Date.now() + ttlMs });
+  evictOldest(values);
+  return value;
+}
+
+/**
+ * Full campaign dataset for ``config``, shared by the campaign routes;
+ * ``fresh`` regenerates it (and so retires cursors into unseeded data)
+ */
+export function campaignDataset(config: DataConfig, { fresh = false }: { fresh?: boolean } = {}): CampaignData[] {
+  return getCachedValue(cacheKey('campaigns', config), () => {
+    const campaigns = generateCampaignData({}, config);
+    // Seeded datasets regenerate identically, so their cursors outlive the TTL
+    datasetVersions.set(
+      campaigns,
+      config.seed === null ? `${Date.now().toString(36)}${(++datasetGeneration).toString(36)}` : 'seeded'
+    );
+    return campaigns;
+  }, { fresh });
+}
+
+/**
+ * Version of a dataset returned by ``campaignDataset``; changes whenever
+ * unseeded data is regenerated
+ */
+export function campaignDatasetVersion(campaigns: CampaignData[]): string {
+  return datasetVersions.get(campaigns) ?? 'seeded';
+}
+
+/**
+ * Payload the ``name`` route would serve under ``config``, for server
+ * components. Shares the route's entry, so a client revalidating afterwards
+ * receives the same data.
+ */
+export async function cachedPayload<T>(
+  name: string,
+  config: DataConfig,
+  factory: () => T | Promise<T>
+): Promise<T> {
+  const { entry } = await getCached(cacheKey(name, config), factory);
+  return JSON.parse(entry.body) as T;
+}
+
+/**
+ * JSON response for one dataset under ``config``, honouring If-None-Match.
+ * ``?fresh=1`` regenerates the payload (used by the dashboard Refresh button).
+ */
+export async function cachedJsonResponse(
+  request: Request,
+  name: string,
+  config: DataConfig,
+  factory: () => unknown | Promise<unknown>
+): Promise<Response> {
+  const url = new URL(request.url);
+  const { entry, hit } = await getCached(cacheKey(name, config), factory, { fresh: url.searchParams.get('fresh') === '1' });
+
+  const headers = {
+    'Cache-Control': 'private, no-cache',
+    ETag: entry.etag,
+    'X-Cache': hit ? 'HIT' : 'MISS'
+  };
+  const ifNoneMatch = request.headers.get('if-none-match');
+  if (ifNoneMatch && ifNoneMatch.split(',').some((tag) => tag.trim() === entry.etag)) {
+    return new Response(null, { status: 304, headers });
+  }
+  return new Response(entry.body, {
+    status: 200,
+    headers: { ...headers, 'Content-Type': 'application/json' }
+  });
+}
@@ -0,0 +1,155 @@
+/**
+ * Campaign queries: sorting, search, status filters and cursor pagination.
+ *
+ * Shared by the /api/campaigns/query route, which runs them against the full
+ * dataset, and by DataTable's server mode, which only ever receives one page.
+ */
+
+import { CampaignData, CampaignPage, CampaignQuery, CampaignStatus } from '@/types/dashboard';
+import { STATUS_DICTIONARY, getCampaignStore } from './campaignStore';
+import { getSearchIndex } from './searchIndex';
+import { getSortIndex } from './utils';
+
+export const CAMPAIGN_STATUSES: CampaignStatus[] = STATUS_DICTIONARY;
+export const SORTABLE_CAMPAIGN_KEYS: (keyof CampaignData)[] = [
+  'name', 'clicks', 'conversions', 'cost', 'cpc', 'status', 'startDate', 'endDate', 'conversionRate', 'roi'
+];
+export const CAMPAIGN_SEARCH_FIELDS: (keyof CampaignData)[] = ['name', 'status', 'startDate', 'endDate'];
+export const MAX_PAGE_SIZE = 500;
+
+// Sorted/filtered views kept per dataset, so paging through one query is a slice
+const MAX_VIEWS_PER_DATASET = 20;
+const views = new WeakMap<CampaignData[], Map<string, CampaignData[]>>();
+const statusCountCache = new WeakMap<CampaignData[], Record<CampaignStatus, number>>();
+
+/**
+ * Opaque cursor for a position in a query's result over dataset ``version``
+ */
+export function encodeCursor(offset: number, version: string): string {
+  return `o${offset.toString(36)}.${version}`;
+}
+
+/**
+ * Whether ``cursor`` (if any) was issued for dataset ``version``; offsets
+ * into a regenerated dataset would point at different rows
+ */
+export function cursorMatchesVersion(cursor: string | null | undefined, version: string): boolean {
+  if (!cursor) return true;
+  const separator = cursor.indexOf('.');
+  return separator >= 0 && cursor.slice(separator + 1) === version;
+}
+
+function decodeCursor(cursor: string | null | undefined): number {
+  if (!cursor || cursor[0] !== 'o') return 0;
+  const offset = parseInt(cursor.slice(1).split('.')[0], 36);
+  return Number.isFinite(offset) && offset > 0 ? offset : 0;
+}
+
+/**
+ * Query params for ``query`` (defaults omitted)
+ */
+export function campaignQueryParams(query: CampaignQuery): URLSearchParams {
+  const params = new URLSearchParams();
+  if (query.sortBy && query.sortDirection) {
+    params.set('sort', query.sortBy);
+    params.set('dir', query.sortDirection);
+  }
+  if (query.search?.trim()) params.set('q', query.search.trim());
+  if (query.statuses?.length) params.set('status', query.statuses.join(','));
+  if (query.cursor) params.set('cursor', query.cursor);
+  params.set('limit', String(query.limit));
+  return params;
+}
+
+/**
+ * Parse and validate a query sent by ``campaignQueryParams``
+ */
+export function parseCampaignQuery(params: URLSearchParams): CampaignQuery {
+  const sortBy = params.get('sort') as keyof CampaignData | null;
+  const dir = params.get('dir');
+  const limit = Math.floor(Number(params.get('limit') ?? 10));
+  return {
+    sortBy: sortBy && SORTABLE_CAMPAIGN_KEYS.includes(sortBy) ? sortBy : undefined,
+    sortDirection: dir === 'asc' || dir === 'desc' ? dir : null,
+    search: params.get('q') ?? '',
+    statuses: (params.get('status') ?? '')
+      .split(',')
+      .filter((status): status is CampaignStatus => CAMPAIGN_STATUSES.includes(status as CampaignStatus)),
+    cursor: params.get('cursor'),
+    // An empty page would hand back its own offset as nextCursor
+    limit: Number.isFinite(limit) ? Math.min(MAX_PAGE_SIZE, Math.max(1, limit)) : 10
+  };
+}
+
+function countStatuses(campaigns: CampaignData[]): Record<CampaignStatus, number> {
+  let counts = statusCountCache.get(campaigns);
+  if (!counts) {
+    counts = getCampaignStore(campaigns).summarize().statusCounts;
+    statusCountCache.set(campaigns, counts);
+  }
+  return counts;
+}
+
+/**
+ * Campaigns matching the search and status filters of ``query``, in its sort
+ * order. Uses the dataset's cached search and sort indexes, so each call is a
+ * single pass over row positions.
+ */
+export function selectCampaigns(
+  campaigns: CampaignData[],
+  query: Pick<CampaignQuery, 'sortBy' | 'sortDirection' | 'search' | 'statuses'>
+): CampaignData[] {
+  const mask = getSearchIndex(campaigns, CAMPAIGN_SEARCH_FIELDS).match(query.search ?? '');
+  const store = getCampaignStore(campaigns);
+  const wanted = store.statusMask(query.statuses);
+  const order = query.sortBy && query.sortDirection
+    ? getSortIndex(campaigns, query.sortBy, query.sortDirection)
+    : null;
+
+  const result: CampaignData[] = [];
+  for (let i = 0; i < campaigns.length; i++) {
+    const position = order ? order[i] : i;
+    if (mask && !mask[position]) continue;
+    if (wanted && !wanted[store.status[position]]) continue;
+    result.push(campaigns[position]);
+  }
+  return result;
+}
+
+function viewFor(campaigns: CampaignData[], query: CampaignQuery): CampaignData[] {
+  const key = JSON.stringify([query.sortBy, query.sortDirection, query.search?.trim().toLowerCase(), query.statuses]);
+  let cache = views.get(campaigns);
+  if (!cache) {
+    cache = new Map();
+    views.set(campaigns, cache);
+  }
+  const cached = cache.get(key);
+  if (cached) return cached;
+
+  const result = selectCampaigns(campaigns, query);
+  cache.set(key, result);
+  if (cache.size > MAX_VIEWS_PER_DATASET) {
+    cache.delete(cache.keys().next().value as string);
+  }
+  return result;
+}
+
+/**
+ * Run ``query`` against the full dataset and return one page plus counts;
+ * cursors are issued for dataset ``version``
+ */
+export function queryCampaigns(campaigns: CampaignData[], query: CampaignQuery, version: string): CampaignPage {
+  const view = viewFor(campaigns, query);
+  const offset = Math.min(decodeCursor(query.cursor), view.length);
+  const end = Math.min(offset + query.limit, view.length);
+
+  return {
+    items: view.slice(offset, end),
+    offset,
+    totalItems: campaigns.length,
+    matchedItems: view.length,
+    nextCursor: end < view.length ? encodeCursor(end, version) : null,
+    prevCursor: offset > 0 ? encodeCursor(Math.max(0, offset - query.limit), version) : null,
+    statusCounts: countStatuses(campaigns)
+  };
+}
@@ -0,0 +1,177 @@
+/**
+ * Columnar view of campaign metrics.
+ *
+ * Each metric is a typed-array column and status is dictionary-encoded, so
+ * filters, sums and per-status group-bys run as tight loops over numbers
+ * instead of walking row objects. Columns are built once per dataset array.
+ */
+
+import { CampaignData, CampaignStatus } from '@/types/dashboard';
+
+export const STATUS_DICTIONARY: CampaignStatus[] = ['active', 'paused', 'completed', 'draft'];
+export const CAMPAIGN_METRICS = ['clicks', 'conversions', 'cost', 'cpc', 'roi', 'conversionRate'] as const;
+
+export type CampaignMetric = typeof CAMPAIGN_METRICS[number];
+export type MetricTotals = Record<CampaignMetric, number>;
+
+export interface CampaignFilter {
+  statuses?: CampaignStatus[];
+  // Inclusive bounds per metric
+  min?: Partial<MetricTotals>;
+  max?: Partial<MetricTotals>;
+}
+
+export interface CampaignSummary {
+  count: number;
+  totals: MetricTotals;
+  statusCounts: Record<CampaignStatus, number>;
+}
+
+const STATUS_CODES = new Map(STATUS_DICTIONARY.map((status, code) => [status, code]));
+
+export class CampaignStore {
+  readonly size: number;
+  readonly clicks: Int32Array;
+  readonly conversions: Int32Array;
+  readonly cost: Float64Array;
+  readonly cpc: Float64Array;
+  readonly roi: Float64Array;
+  readonly conversionRate: Float64Array;
+  readonly status: Uint8Array;
+
+  constructor(campaigns: readonly CampaignData[]) {
+    const size = campaigns.length;
+    this.size = size;
+    this.clicks = new Int32Array(size);
+    this.conversions = new Int32Array(size);
+    this.cost = new Float64Array(size);
+    this.cpc = new Float64Array(size);
+    this.roi = new Float64Array(size);
+    this.conversionRate = new Float64Array(size);
+    this.status = new Uint8Array(size);
+
+    for (let i = 0; i < size; i++) {
+      const campaign = campaigns[i];
+      this.clicks[i] = campaign.clicks;
+      this.conversions[i] = campaign.conversions;
+      this.cost[i] = campaign.cost;
+      this.cpc[i] = campaign.cpc;
+      this.roi[i] = campaign.roi ?? 0;
+      this.conversionRate[i] = campaign.conversionRate ?? 0;
+      this.status[i] = STATUS_CODES.get(campaign.status) ?? 0;
+    }
+  }
+
+  /** Typed-array column for ``metric`` */
+  column(metric: CampaignMetric): Int32Array | Float64Array {
+    return this[metric];
+  }
+
+  /** Row positions matching every condition of ``filter``, ascending */
+  filter(filter: CampaignFilter): Uint32Array {
+    const statusMask = this.statusMask(filter.statuses);
+    const bounds = CAMPAIGN_METRICS
+      .filter((metric) => filter.min?.[metric] !== undefined || filter.max?.[metric] !== undefined)
+      .map((metric) => ({
+        values: this.column(metric),
+        min: filter.min?.[metric] ?? -Infinity,
+        max: filter.max?.[metric] ?? Infinity
+      }));
+
+    const positions = new Uint32Array(this.size);
+    let count = 0;
+    rows: for (let i = 0; i < this.size; i++) {
+      if (statusMask && !statusMask[this.status[i]]) continue;
+      for (const { values, min, max } of bounds) {
+        const value = values[i];
+        if (value < min || value > max) continue rows;
+      }
+      positions[count++] = i;
+    }
+    return positions.slice(0, count);
+  }
+
+  /** Sum of ``metric`` over ``positions`` (all rows when omitted) */
+  sum(metric: CampaignMetric, positions?: ArrayLike<number>): number {
+    const values = this.column(metric);
+    let total = 0;
+    if (positions) {
+      for (let i = 0; i < positions.length; i++) total += values[positions[i]];
+    } else {
+      for (let i = 0; i < this.size; i++) total += values[i];
+    }
+    return total;
+  }
+
+  /** Row count and sum of ``metric`` per status */
+  groupByStatus(metric: CampaignMetric, positions?: ArrayLike<number>): Record<CampaignStatus, { count: number; sum: number }> {
+    const values = this.column(metric);
+    const counts = new Float64Array(STATUS_DICTIONARY.length);
+    const sums = new Float64Array(STATUS_DICTIONARY.length);
+    const length = positions ? positions.length : this.size;
+    for (let i = 0; i < length; i++) {
+      const row = positions ? positions[i] : i;
+      const code = this.status[row];
+      counts[code] += 1;
+      sums[code] += values[row];
+    }
+    return Object.fromEntries(
+      STATUS_DICTIONARY.map((status, code) => [status, { count: counts[code], sum: sums[code] }])
+    ) as Record<CampaignStatus, { count: number; sum: number }>;
+  }
+
+  /** Row count, metric totals and status counts in one pass */
+  summarize(positions?: ArrayLike<number>): CampaignSummary {
+    const counts = new Float64Array(STATUS_DICTIONARY.length);
+    let clicks = 0;
+    let conversions = 0;
+    let cost = 0;
+    let cpc = 0;
+    let roi = 0;
+    let conversionRate = 0;
+    const length = positions ? positions.length : this.size;
+    for (let i = 0; i < length; i++) {
+      const row = positions ? positions[i] : i;
+      counts[this.status[row]] += 1;
+      clicks += this.clicks[row];
+      conversions += this.conversions[row];
+      cost += this.cost[row];
+      cpc += this.cpc[row];
+      roi += this.roi[row];
+      conversionRate += this.conversionRate[row];
+    }
+
+    return {
+      count: length,
+      totals: { clicks, conversions, cost, cpc, roi, conversionRate },
+      statusCounts: Object.fromEntries(
+        STATUS_DICTIONARY.map((status, code) => [status, counts[code]])
+      ) as Record<CampaignStatus, number>
+    };
+  }
+
+  /** Lookup table of wanted status codes, or null for every status */
+  statusMask(statuses?: CampaignStatus[]): Uint8Array | null {
+    if (!statuses?.length) return null;
+    const mask = new Uint8Array(STATUS_DICTIONARY.length);
+    statuses.forEach((status) => {
+      const code = STATUS_CODES.get(status);
+      if (code !== undefined) mask[code] = 1;
+    });
+    return mask;
+  }
+}
+
+const stores = new WeakMap<readonly CampaignData[], CampaignStore>();
+
+/**
+ * Columnar store for ``campaigns``, built once per array
+ */
+export function getCampaignStore(campaigns: readonly CampaignData[]): CampaignStore {
+  let store = stores.get(campaigns);
+  if (!store) {
+    store = new CampaignStore(campaigns);
+    stores.set(campaigns, store);
+  }
+  return store;
+}
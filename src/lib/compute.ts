@@ -0,0 +1,132 @@
+/**
+ * Worker-backed versions of the heavy utils.ts helpers.
+ *
+ * Same arguments as sortData/aggregateData, but asynchronous. Below
+ * WORKER_THRESHOLD rows (or where workers are unavailable) they run inline;
+ * above it the work goes to a shared compute worker, so the main thread
+ * only extracts the column and applies the result. Sort indexes built by
+ * the worker are stored in the utils.ts cache, so later sortData calls on
+ * the same data are a gather.
+ */
+
+import { aggregateData, hasSortIndex, primeSortIndex, sortData } from './utils';
+
+export const WORKER_THRESHOLD = 20000;
+
+export type ComputeRequest =
+  | { id: number; op: 'sortIndex'; values: Float64Array | string[] }
+  | { id: number; op: 'sumByGroup'; groups: string[]; values: Float64Array };
+
+export interface ComputeResponse {
+  id: number;
+  result?: unknown;
+  error?: string;
+}
+
+type WithoutId<T> = T extends unknown ? Omit<T, 'id'> : never;
+type PendingRequest = { resolve: (value: unknown) => void; reject: (error: Error) => void };
+
+let worker: Worker | null = null;
+let workerFailed = false;
+let nextId = 0;
+const pending = new Map<number, PendingRequest>();
+
+function getWorker(): Worker | null {
+  if (worker || workerFailed) return worker;
+  if (typeof Worker === 'undefined') {
+    workerFailed = true;
+    return null;
+  }
+  try {
+    worker = new Worker(new URL('./compute.worker.ts', import.meta.url));
+  } catch {
+    workerFailed = true;
+    return null;
+  }
+  worker.onmessage = (event: MessageEvent<ComputeResponse>) => {
+    const request = pending.get(event.data.id);
+    if (!request) return;
+    pending.delete(event.data.id);
+    if (event.data.error) request.reject(new Error(event.data.error));
+    else request.resolve(event.data.result);
+  };
+  worker.onerror = () => {
+    // Fail everything in flight and run inline from now on
+    workerFailed = true;
+    worker?.terminate();
+    worker = null;
+    pending.forEach((request) => request.reject(new Error('Compute worker failed')));
+    pending.clear();
+  };
+  return worker;
+}
+
+function run<T>(request: WithoutId<ComputeRequest>, transfer: Transferable[]): Promise<T> | null {
+  const target = getWorker();
+  if (!target) return null;
+  const id = ++nextId;
+  return new Promise<T>((resolve, reject) => {
+    pending.set(id, { resolve: resolve as (value: unknown) => void, reject });
+    target.postMessage({ ...request, id }, transfer);
+  });
+}
+
+function offloads(rows: number): boolean {
+  return rows >= WORKER_THRESHOLD && getWorker() !== null;
+}
+
+/**
+ * Build the sort index for ``data`` and ``key`` (in the worker for large
+ * arrays) unless it is cached already
+ */
+export async function prepareSortIndex<T>(data: readonly T[], key: keyof T): Promise<void> {
+  if (hasSortIndex(data, key) || !offloads(data.length)) return;
+
+  const column = data.map((item) => item[key]);
+  let values: Float64Array | string[];
+  if (column.every((value) => typeof value === 'number')) {
+    values = Float64Array.from(column as unknown as number[]);
+  } else if (column.every((value) => typeof value === 'string')) {
+    values = column as unknown as string[];
+  } else {
+    return; // Mixed columns are sorted inline by sortData
+  }
+
+  try {
+    const index = await run<Uint32Array>(
+      { op: 'sortIndex', values },
+      values instanceof Float64Array ? [values.buffer] : []
+    );
+    if (index) primeSortIndex(data, key, index);
+  } catch {
+    // sortData builds the index inline instead
+  }
+}
+
+/**
+ * ``sortData`` with the index built off the main thread for large arrays
+ */
+export async function sortDataAsync<T>(data: T[], key: keyof T, direction: 'asc' | 'desc' | null): Promise<T[]> {
+  if (direction) await prepareSortIndex(data, key);
+  return sortData(data, key, direction);
+}
+
+/**
+ * ``aggregateData`` summed in the worker for large arrays
+ */
+export async function aggregateDataAsync<T>(
+  data: T[],
+  groupBy: keyof T,
+  aggregateField: keyof T
+): Promise<Record<string, number>> {
+  if (!offloads(data.length)) return aggregateData(data, groupBy, aggregateField);
+
+  const groups = data.map((item) => String(item[groupBy]));
+  const values = Float64Array.from(data, (item) => Number(item[aggregateField]) || 0);
+  try {
+    return (await run<Record<string, number>>({ op: 'sumByGroup', groups, values }, [values.buffer]))
+      ?? aggregateData(data, groupBy, aggregateField);
+  } catch {
+    return aggregateData(data, groupBy, aggregateField);
+  }
+}
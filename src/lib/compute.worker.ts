@@ -0,0 +1,30 @@
+/// <reference lib="webworker" />
+
+/**
+ * Compute worker: runs the kernels from computeKernels.ts off the main
+ * thread. Numeric inputs and index results travel as transferred typed
+ * arrays.
+ */
+
+import type { ComputeRequest, ComputeResponse } from './compute';
+import { buildSortIndex, sumByGroup } from './computeKernels';
+
+const scope = self as unknown as DedicatedWorkerGlobalScope;
+
+function reply(response: ComputeResponse, transfer: Transferable[] = []) {
+  scope.postMessage(response, transfer);
+}
+
+scope.onmessage = (event: MessageEvent<ComputeRequest>) => {
+  const request = event.data;
+  try {
+    if (request.op === 'sortIndex') {
+      const index = buildSortIndex(request.values);
+      reply({ id: request.id, result: index }, [index.buffer]);
+    } else {
+      reply({ id: request.id, result: sumByGroup(request.groups, request.values) });
+    }
+  } catch (error) {
+    reply({ id: request.id, error: error instanceof Error ? error.message : String(error) });
+  }
+};
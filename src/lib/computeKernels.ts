@@ -0,0 +1,65 @@
+/**
+ * Pure compute kernels shared by the main thread (utils.ts) and the compute
+ * worker, so both produce identical results.
+ */
+
+/**
+ * Row positions in ascending order of ``values``: strings by localeCompare,
+ * numbers numerically, ties (and mixed types) by position
+ */
+export function buildSortIndex(values: ArrayLike<unknown>): Uint32Array {
+  const index = new Uint32Array(values.length);
+  for (let i = 0; i < index.length; i++) index[i] = i;
+  index.sort((a, b) => {
+    const aVal = values[a];
+    const bVal = values[b];
+
+    if (typeof aVal === 'string' && typeof bVal === 'string') {
+      // V8's localeCompare fast path beats a shared Intl.Collator here
+      return aVal.localeCompare(bVal) || a - b;
+    }
+
+    if (typeof aVal === 'number' && typeof bVal === 'number') {
+      return aVal - bVal || a - b;
+    }
+
+    return a - b;
+  });
+  return index;
+}
+
+function sameSortKey(a: unknown, b: unknown): boolean {
+  if (a === b) return true;
+  return typeof a === 'string' && typeof b === 'string' && a.localeCompare(b) === 0;
+}
+
+/**
+ * Descending counterpart of an ascending ``index`` over ``values``: key order
+ * reversed, but rows with equal keys stay in position order, as they would
+ * with a stable sort and a flipped comparator
+ */
+export function descendingSortIndex(ascending: Uint32Array, values: ArrayLike<unknown>): Uint32Array {
+  const index = new Uint32Array(ascending.length);
+  let out = 0;
+  let end = ascending.length;
+  while (end > 0) {
+    // Find the run of equal keys ending at ``end`` and copy it forwards
+    let start = end - 1;
+    while (start > 0 && sameSortKey(values[ascending[start - 1]], values[ascending[end - 1]])) start--;
+    for (let i = start; i < end; i++) index[out++] = ascending[i];
+    end = start;
+  }
+  return index;
+}
+
+/**
+ * Sum of ``values`` per distinct entry of ``groups``
+ */
+export function sumByGroup(groups: ArrayLike<string>, values: ArrayLike<number>): Record<string, number> {
+  const totals: Record<string, number> = {};
+  for (let i = 0; i < groups.length; i++) {
+    const group = groups[i];
+    totals[group] = (totals[group] || 0) + (values[i] || 0);
+  }
+  return totals;
+}
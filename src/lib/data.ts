@@ -3,55 +3,89 @@ import {
   LineChartData, 
   BarChartData, 
   DonutChartData, 
-  CampaignData 
+  CampaignData,
+  DashboardDelta,
+  DashboardSection,
+  DashboardSummary
 } from '@/types/dashboard';
+import { DataConfig, SeriesGranularity, dataRng, getDataConfig, simulatedDelay } from './dataConfig';
+import { Rng, randomInt } from './random';
+
+const DAY_MS = 24 * 60 * 60 * 1000;
+
+// Seeded runs end on a fixed day so the same seed yields the same dates
+const SEEDED_END_DATE = Date.UTC(2025, 0, 1);
+
+/**
+ * Last day covered by generated data (ms since epoch)
+ */
+function endTime(config: DataConfig): number {
+  if (config.endDate) return Date.parse(config.endDate);
+  return config.seed === null ? Date.now() : SEEDED_END_DATE;
+}
+
+/**
+ * Series date label for ``time`` (day, or hour for hourly series)
+ */
+function seriesDate(time: number, pointsPerDay: number): string {
+  const iso = new Date(time).toISOString();
+  return pointsPerDay === 1 ? iso.slice(0, 10) : `${iso.slice(0, 13)}:00`;
+}
+
+/**
+ * CPC, conversion rate and ROI (assuming average order value of $100),
+ * rounded for display
+ */
+export function campaignRates(clicks: number, conversions: number, cost: number) {
+  const revenue = conversions * 100;
+  return {
+    cpc: Math.round((cost / clicks) * 100) / 100, // Round to 2 decimal places
+    conversionRate: Math.round((conversions / clicks) * 100 * 10) / 10, // Round to 1 decimal place
+    roi: Math.round(((revenue - cost) / cost) * 100 * 10) / 10 // Round to 1 decimal place
+  };
+}
+
+/**
+ * Wait for the simulated network latency (zero in test mode)
+ */
+export function simulateLatency(defaultMs: number): Promise<void> {
+  const delay = simulatedDelay(defaultMs);
+  return delay > 0 ? new Promise(resolve => setTimeout(resolve, delay)) : Promise.resolve();
+}
 
 /**
  * Simulate API delay and potential errors
  */
 async function simulateApiCall<T>(data: T, shouldFail: boolean = false, delay: number = 500): Promise<T> {
-  return new Promise((resolve, reject) => {
-    setTimeout(() => {
-      if (shouldFail) {
-        reject(new Error('Failed to fetch data from server. Please try again later.'));
-      } else {
-        resolve(data);
-      }
-    }, delay);
-  });
+  await simulateLatency(delay);
+  if (shouldFail) {
+    throw new Error('Failed to fetch data from server. Please try again later.');
+  }
+  return data;
 }
 
 /**
  * Simulate network error
  */
 export async function simulateNetworkError(): Promise<never> {
-  return new Promise((_, reject) => {
-    setTimeout(() => {
-      reject(new Error('Network connection failed. Please check your internet connection and try again.'));
-    }, 1000);
-  });
+  await simulateLatency(1000);
+  throw new Error('Network connection failed. Please check your internet connection and try again.');
 }
 
 /**
  * Simulate server error
  */
 export async function simulateServerError(): Promise<never> {
-  return new Promise((_, reject) => {
-    setTimeout(() => {
-      reject(new Error('Server is temporarily unavailable. Please try again in a few minutes.'));
-    }, 1000);
-  });
+  await simulateLatency(1000);
+  throw new Error('Server is temporarily unavailable. Please try again in a few minutes.');
 }
 
 /**
  * Simulate data corruption error
  */
 export async function simulateDataError(): Promise<never> {
-  return new Promise((_, reject) => {
-    setTimeout(() => {
-      reject(new Error('Unable to load dashboard data. The data format is invalid or corrupted.'));
-    }, 1000);
-  });
+  await simulateLatency(1000);
+  throw new Error('Unable to load dashboard data. The data format is invalid or corrupted.');
 }
 
 /**
@@ -107,28 +141,34 @@ export async function fetchMetricsData(shouldFail: boolean = false): Promise<Met
 }
 
 /**
- * Generate 30 days of revenue data for line chart
+ * Generate revenue data for line chart (30 daily points unless configured
+ * otherwise); hourly points are dated YYYY-MM-DDTHH:00
  */
-export function generateLineChartData(): LineChartData[] {
-  const data: LineChartData[] = [];
-  const today = new Date();
+export function generateLineChartData(
+  options: { days?: number; granularity?: SeriesGranularity } = {},
+  config: DataConfig = getDataConfig()
+): LineChartData[] {
+  const days = options.days ?? config.days;
+  const pointsPerDay = (options.granularity ?? config.granularity) === 'hourly' ? 24 : 1;
+  const random = dataRng('line', config);
+  const end = endTime(config);
+  const total = days * pointsPerDay;
+  const data: LineChartData[] = new Array(total);
   
-  for (let i = 29; i >= 0; i--) {
-    const date = new Date(today);
-    date.setDate(date.getDate() - i);
+  for (let i = total - 1; i >= 0; i--) {
     
     // Generate realistic revenue data with some variation
-    const baseRevenue = 1200;
-    const variation = Math.random() * 800 - 400; // ±400 variation
-    const seasonalFactor = 1 + Math.sin((i / 29) * Math.PI * 2) * 0.2; // Weekly pattern
-    const revenue = Math.max(500, Math.round(baseRevenue * seasonalFactor + variation));
+    const baseRevenue = 1200 / pointsPerDay;
+    const variation = (random() * 800 - 400) / pointsPerDay; // ±400 variation per day
+    const seasonalFactor = 1 + Math.sin((i / pointsPerDay / 29) * Math.PI * 2) * 0.2; // Monthly pattern
+    const revenue = Math.max(Math.round(500 / pointsPerDay), Math.round(baseRevenue * seasonalFactor + variation));
     
-    data.push({
-      date: date.toISOString().split('T')[0],
+    data[total - 1 - i] = {
+      date: seriesDate(end - i * (DAY_MS / pointsPerDay), pointsPerDay),
       revenue: revenue,
-      visitors: Math.round(revenue * (0.8 + Math.random() * 0.4)), // Related visitor data
-      conversions: Math.round(revenue * (0.05 + Math.random() * 0.03)) // Related conversion data
-    });
+      visitors: Math.round(revenue * (0.8 + random() * 0.4)), // Related visitor data
+      conversions: Math.round(revenue * (0.05 + random() * 0.03)) // Related conversion data
+    };
   }
   
   return data;
@@ -143,10 +183,16 @@ export async function fetchLineChartData(shouldFail: boolean = false): Promise<L
 }
 
 /**
- * Generate traffic sources data for bar chart
+ * Generate traffic sources data for bar chart; sources beyond the six named
+ * ones get random visitor counts
  */
-export function generateBarChartData(): BarChartData[] {
-  const sources = [
+export function generateBarChartData(
+  options: { sources?: number } = {},
+  config: DataConfig = getDataConfig()
+): BarChartData[] {
+  const count = options.sources ?? config.trafficSources;
+  const random = dataRng('sources', config);
+  const named = [
     { name: 'Google Ads', visitors: 4500, color: '#3B82F6' },
     { name: 'Facebook', visitors: 3200, color: '#6366F1' },
     { name: 'Direct Traffic', visitors: 2800, color: '#10B981' },
@@ -154,6 +200,14 @@ export function generateBarChartData(): BarChartData[] {
     { name: 'Email Marketing', visitors: 1800, color: '#EF4444' },
     { name: 'Social Media', visitors: 1200, color: '#8B5CF6' }
   ];
+  const sources = named.slice(0, count);
+  for (let index = sources.length; index < count; index++) {
+    sources.push({
+      name: `Source ${index + 1}`,
+      visitors: randomInt(random, 100, 1900),
+      color: `hsl(${Math.round((index * 137.5) % 360)}, 65%, 55%)`
+    });
+  }
   
   const totalVisitors = sources.reduce((sum, source) => sum + source.visitors, 0);
   
@@ -214,9 +268,17 @@ export async function fetchDonutChartData(shouldFail: boolean = false): Promise<
 }
 
 /**
- * Generate realistic campaign data
+ * Generate realistic campaign data (25 campaigns unless configured
+ * otherwise); names repeat with a #n suffix past the first 25
  */
-export function generateCampaignData(): CampaignData[] {
+export function generateCampaignData(
+  options: { count?: number } = {},
+  config: DataConfig = getDataConfig()
+): CampaignData[] {
+  const count = options.count ?? config.campaignCount;
+  const random = dataRng('campaigns', config);
+  const end = endTime(config);
+  const startWindow = Math.max(90, config.days);
   const campaignNames = [
     'Summer Sale 2024',
     'Brand Awareness Q4',
@@ -247,40 +309,38 @@ export function generateCampaignData(): CampaignData[] {
   
   const statuses: ('active' | 'paused' | 'completed' | 'draft')[] = ['active', 'paused', 'completed', 'draft'];
   
-  return campaignNames.map((name, index) => {
-    const clicks = Math.floor(Math.random() * 4900) + 100; // 100-5000 clicks
-    const conversions = Math.floor(Math.random() * 490) + 10; // 10-500 conversions
-    const cost = Math.floor(Math.random() * 1450) + 50; // $50-$1500 cost
-    const cpc = cost / clicks; // Calculate CPC
-    
-    // Calculate conversion rate
-    const conversionRate = (conversions / clicks) * 100;
-    
-    // Calculate ROI (assuming average order value of $100)
-    const revenue = conversions * 100;
-    const roi = ((revenue - cost) / cost) * 100;
+  const campaigns: CampaignData[] = new Array(count);
+  
+  for (let index = 0; index < count; index++) {
+    const round = Math.floor(index / campaignNames.length);
+    const name = round === 0
+      ? campaignNames[index]
+      : `${campaignNames[index % campaignNames.length]} #${round + 1}`;
+    const clicks = randomInt(random, 100, 4900); // 100-5000 clicks
+    const conversions = randomInt(random, 10, 490); // 10-500 conversions
+    const cost = randomInt(random, 50, 1450); // $50-$1500 cost
+    const { cpc, conversionRate, roi } = campaignRates(clicks, conversions, cost);
     
     // Generate realistic dates
-    const startDate = new Date();
-    startDate.setDate(startDate.getDate() - Math.floor(Math.random() * 90)); // Random date within last 90 days
-    
-    const endDate = new Date(startDate);
-    endDate.setDate(endDate.getDate() + Math.floor(Math.random() * 30) + 7); // 7-37 days duration
+    const startTime = end - randomInt(random, 0, startWindow) * DAY_MS; // Within the last 90+ days
+    const endDate = startTime + randomInt(random, 7, 30) * DAY_MS; // 7-37 days duration
     
-    return {
+    campaigns[index] = {
       id: `campaign-${index + 1}`,
       name: name,
       clicks: clicks,
       conversions: conversions,
       cost: cost,
-      cpc: Math.round(cpc * 100) / 100, // Round to 2 decimal places
-      status: statuses[Math.floor(Math.random() * statuses.length)],
-      startDate: startDate.toISOString().split('T')[0],
-      endDate: endDate.toISOString().split('T')[0],
-      conversionRate: Math.round(conversionRate * 10) / 10, // Round to 1 decimal place
-      roi: Math.round(roi * 10) / 10 // Round to 1 decimal place
+      cpc: cpc,
+      status: statuses[randomInt(random, 0, statuses.length)],
+      startDate: new Date(startTime).toISOString().split('T')[0],
+      endDate: new Date(endDate).toISOString().split('T')[0],
+      conversionRate: conversionRate,
+      roi: roi
     };
-  });
+  }
+  
+  return campaigns;
 }
 
 /**
@@ -291,16 +351,41 @@ export async function fetchCampaignData(shouldFail: boolean = false): Promise<Ca
   return simulateApiCall(data, shouldFail);
 }
 
+export const DASHBOARD_SECTIONS: DashboardSection[] = [
+  'metrics',
+  'lineChartData',
+  'barChartData',
+  'donutChartData',
+  'campaigns'
+];
+
+/**
+ * Generate one dashboard section on its own
+ */
+export function generateDashboardSection<K extends DashboardSection>(
+  section: K,
+  config: DataConfig = getDataConfig()
+): DashboardSummary[K] {
+  const generators: { [S in DashboardSection]: () => DashboardSummary[S] } = {
+    metrics: () => generateMetricsData(),
+    lineChartData: () => generateLineChartData({}, config),
+    barChartData: () => generateBarChartData({}, config),
+    donutChartData: () => generateDonutChartData(),
+    campaigns: () => generateCampaignData({}, config)
+  };
+  return generators[section]();
+}
+
 /**
  * Generate complete dashboard data
  */
-export function generateDashboardData() {
+export function generateDashboardData(config: DataConfig = getDataConfig()): DashboardSummary {
   return {
-    metrics: generateMetricsData(),
-    lineChartData: generateLineChartData(),
-    barChartData: generateBarChartData(),
-    donutChartData: generateDonutChartData(),
-    campaigns: generateCampaignData(),
+    metrics: generateDashboardSection('metrics', config),
+    lineChartData: generateDashboardSection('lineChartData', config),
+    barChartData: generateDashboardSection('barChartData', config),
+    donutChartData: generateDashboardSection('donutChartData', config),
+    campaigns: generateDashboardSection('campaigns', config),
     lastUpdated: new Date().toISOString()
   };
 }
@@ -313,15 +398,66 @@ export async function fetchDashboardData(shouldFail: boolean = false) {
   return simulateApiCall(data, shouldFail);
 }
 
+// Real-time updates continue one seeded sequence rather than restarting it
+let realtimeRng: Rng | null = null;
+
 /**
  * Generate random data for real-time updates simulation
  */
 export function generateRandomData() {
+  if (!realtimeRng) realtimeRng = dataRng('realtime');
+  const random = realtimeRng;
   return {
-    revenue: Math.floor(Math.random() * 2000) + 500,
-    users: Math.floor(Math.random() * 1000) + 500,
-    conversions: Math.floor(Math.random() * 100) + 10,
-    growth: (Math.random() * 20 - 10).toFixed(1) // -10 to +10
+    revenue: randomInt(random, 500, 2000),
+    users: randomInt(random, 500, 1000),
+    conversions: randomInt(random, 10, 100),
+    growth: (random() * 20 - 10).toFixed(1) // -10 to +10
+  };
+}
+
+/**
+ * Live update feed for one /api/live connection. Each call returns the next
+ * delta: new metric values, additions to the latest series point and to a
+ * few campaign rows.
+ */
+export function createLiveFeed(config: DataConfig = getDataConfig()): () => DashboardDelta {
+  const random = dataRng('live', config);
+  const pointsPerDay = config.granularity === 'hourly' ? 24 : 1;
+  const metrics = new Map(generateMetricsData().map((metric) => [metric.id, metric.value]));
+  let seq = 0;
+
+  return () => {
+    const revenue = randomInt(random, 50, 200);
+    const conversions = randomInt(random, 0, 6);
+    metrics.set('revenue', (metrics.get('revenue') ?? 0) + revenue);
+    metrics.set('users', (metrics.get('users') ?? 0) + randomInt(random, -20, 41));
+    metrics.set('conversions', (metrics.get('conversions') ?? 0) + conversions);
+    metrics.set('growth', Math.round(((metrics.get('growth') ?? 0) + random() * 0.4 - 0.2) * 10) / 10);
+
+    const campaigns: DashboardDelta['campaigns'] = [];
+    const changed = Math.min(config.campaignCount, randomInt(random, 1, 3));
+    for (let i = 0; i < changed; i++) {
+      campaigns.push({
+        id: `campaign-${randomInt(random, 1, config.campaignCount)}`,
+        clicks: randomInt(random, 5, 45),
+        conversions: randomInt(random, 0, 5),
+        cost: randomInt(random, 1, 20)
+      });
+    }
+
+    seq += 1;
+    return {
+      seq,
+      metrics: Array.from(metrics, ([id, value]) => ({ id, value })),
+      series: {
+        date: seriesDate(endTime(config), pointsPerDay),
+        revenue,
+        visitors: Math.round(revenue * (0.8 + random() * 0.4)),
+        conversions
+      },
+      campaigns,
+      generatedAt: new Date().toISOString()
+    };
   };
 }
 
@@ -0,0 +1,250 @@
+/**
+ * Synthetic data configuration.
+ *
+ * By default the generators in data.ts behave as before: unseeded, 25
+ * campaigns, 30 daily points and 6 traffic sources. For load testing the
+ * sizes and seed can be overridden, lowest to highest precedence, by:
+ *
+ *   1. build-time env vars  NEXT_PUBLIC_DATA_SEED, NEXT_PUBLIC_DATA_CAMPAIGNS,
+ *      NEXT_PUBLIC_DATA_DAYS, NEXT_PUBLIC_DATA_GRANULARITY,
+ *      NEXT_PUBLIC_DATA_SOURCES, NEXT_PUBLIC_DATA_END
+ *   2. sessionStorage ('aidash:data-config'), so settings survive navigation;
+ *      mirrored into a session cookie so server-rendered pages match
+ *   3. URL query params     ?seed=42&campaigns=100000&days=730&granularity=hourly&sources=12&end=2025-01-01
+ *
+ * Test mode (NEXT_PUBLIC_TEST_MODE=1 or ?testMode=1) removes the simulated
+ * API latency and seeds every generator, so end-to-end runs are limited by
+ * rendering speed and produce the same data each time. NEXT_PUBLIC_DATA_LATENCY
+ * or ?latency=<ms> sets an explicit latency instead.
+ */
+
+import { Rng, createRng, hashSeed } from './random';
+
+export type SeriesGranularity = 'daily' | 'hourly';
+
+export interface DataConfig {
+  seed: number | null;
+  campaignCount: number;
+  days: number;
+  granularity: SeriesGranularity;
+  trafficSources: number;
+  endDate: string | null;
+  testMode: boolean;
+  latencyMs: number | null;
+}
+
+export const DEFAULT_DATA_CONFIG: DataConfig = {
+  seed: null,
+  campaignCount: 25,
+  days: 30,
+  granularity: 'daily',
+  trafficSources: 6,
+  endDate: null,
+  testMode: false,
+  latencyMs: null
+};
+
+export const MAX_CAMPAIGNS = 1000000;
+export const MAX_DAYS = 3650;
+export const MAX_TRAFFIC_SOURCES = 1000;
+export const MAX_LATENCY_MS = 60000;
+
+// Seed used by test mode when no explicit seed is configured
+export const TEST_MODE_SEED = 1;
+
+const STORAGE_KEY = 'aidash:data-config';
+export const CONFIG_COOKIE = 'aidash-data-config';
+
+type RawConfig = Partial<Record<keyof DataConfig, string | number | boolean | null | undefined>>;
+
+// NEXT_PUBLIC_* values are inlined at build time, so each must be read literally
+const ENV_CONFIG: RawConfig = {
+  seed: process.env.NEXT_PUBLIC_DATA_SEED,
+  campaignCount: process.env.NEXT_PUBLIC_DATA_CAMPAIGNS,
+  days: process.env.NEXT_PUBLIC_DATA_DAYS,
+  granularity: process.env.NEXT_PUBLIC_DATA_GRANULARITY,
+  trafficSources: process.env.NEXT_PUBLIC_DATA_SOURCES,
+  endDate: process.env.NEXT_PUBLIC_DATA_END,
+  testMode: process.env.NEXT_PUBLIC_TEST_MODE,
+  latencyMs: process.env.NEXT_PUBLIC_DATA_LATENCY
+};
+
+const QUERY_PARAMS: Record<keyof DataConfig, string> = {
+  seed: 'seed',
+  campaignCount: 'campaigns',
+  days: 'days',
+  granularity: 'granularity',
+  trafficSources: 'sources',
+  endDate: 'end',
+  testMode: 'testMode',
+  latencyMs: 'latency'
+};
+
+let cached: DataConfig | null = null;
+
+function parseCount(value: string | number | boolean | null | undefined, min: number, max: number): number | undefined {
+  if (value == null || value === '' || typeof value === 'boolean') return undefined;
+  const parsed = Math.floor(Number(value));
+  return Number.isFinite(parsed) ? Math.min(max, Math.max(min, parsed)) : undefined;
+}
+
+function parseConfig(raw: RawConfig): Partial<DataConfig> {
+  const config: Partial<DataConfig> = {};
+  const seed = parseCount(raw.seed, 0, 0xffffffff);
+  if (seed !== undefined) config.seed = seed;
+  const campaignCount = parseCount(raw.campaignCount, 0, MAX_CAMPAIGNS);
+  if (campaignCount !== undefined) config.campaignCount = campaignCount;
+  const days = parseCount(raw.days, 1, MAX_DAYS);
+  if (days !== undefined) config.days = days;
+  if (raw.granularity === 'daily' || raw.granularity === 'hourly') config.granularity = raw.granularity;
+  const trafficSources = parseCount(raw.trafficSources, 1, MAX_TRAFFIC_SOURCES);
+  if (trafficSources !== undefined) config.trafficSources = trafficSources;
+  if (typeof raw.endDate === 'string' && !Number.isNaN(Date.parse(raw.endDate))) config.endDate = raw.endDate;
+  const testMode = parseFlag(raw.testMode);
+  if (testMode !== undefined) config.testMode = testMode;
+  const latencyMs = parseCount(raw.latencyMs, 0, MAX_LATENCY_MS);
+  if (latencyMs !== undefined) config.latencyMs = latencyMs;
+  return config;
+}
+
+function parseFlag(value: string | number | boolean | null | undefined): boolean | undefined {
+  if (value === true || value === 1 || value === '1' || value === 'true') return true;
+  if (value === false || value === 0 || value === '0' || value === 'false') return false;
+  return undefined;
+}
+
+function withTestDefaults(config: DataConfig): DataConfig {
+  return config.testMode && config.seed === null ? { ...config, seed: TEST_MODE_SEED } : config;
+}
+
+function readStorage(): Partial<DataConfig> {
+  try {
+    return parseStored(window.sessionStorage.getItem(STORAGE_KEY) ?? undefined);
+  } catch {
+    return {};
+  }
+}
+
+function writeStorage(config: Partial<DataConfig>) {
+  const stored = JSON.stringify(config);
+  try {
+    window.sessionStorage.setItem(STORAGE_KEY, stored);
+  } catch {
+    // Storage unavailable (private mode, quota); the URL still applies
+  }
+  document.cookie = `${CONFIG_COOKIE}=${encodeURIComponent(stored)}; path=/; SameSite=Lax`;
+}
+
+function parseStored(stored: string | undefined): Partial<DataConfig> {
+  try {
+    return stored ? parseConfig(JSON.parse(stored)) : {};
+  } catch {
+    return {};
+  }
+}
+
+function parseParams(params: URLSearchParams): Partial<DataConfig> {
+  const raw: RawConfig = {};
+  (Object.keys(QUERY_PARAMS) as (keyof DataConfig)[]).forEach((key) => {
+    raw[key] = params.get(QUERY_PARAMS[key]);
+  });
+  return parseConfig(raw);
+}
+
+/**
+ * Resolve the active data configuration (cached after the first call)
+ */
+export function getDataConfig(): DataConfig {
+  if (cached) return cached;
+
+  const config = { ...DEFAULT_DATA_CONFIG, ...parseConfig(ENV_CONFIG) };
+  if (typeof window === 'undefined') {
+    return withTestDefaults(config);
+  }
+
+  const fromQuery = parseParams(new URLSearchParams(window.location.search));
+  const persisted = { ...readStorage(), ...fromQuery };
+  if (Object.keys(fromQuery).length > 0) {
+    writeStorage(persisted);
+  }
+  cached = withTestDefaults({ ...config, ...persisted });
+  return cached;
+}
+
+/**
+ * Configuration sent by a client as query params (used by the API routes)
+ */
+export function dataConfigFromParams(params: URLSearchParams): DataConfig {
+  return withTestDefaults({ ...DEFAULT_DATA_CONFIG, ...parseConfig(ENV_CONFIG), ...parseParams(params) });
+}
+
+/**
+ * Configuration for a server render: env, then the session cookie written by
+ * setDataConfig, then the page's query params (the client's own precedence)
+ */
+export function serverDataConfig(params: URLSearchParams, cookie?: string): DataConfig {
+  return withTestDefaults({
+    ...DEFAULT_DATA_CONFIG,
+    ...parseConfig(ENV_CONFIG),
+    ...parseStored(cookie),
+    ...parseParams(params)
+  });
+}
+
+/**
+ * Query string reproducing ``config`` (only values that differ from the defaults)
+ */
+export function dataConfigQuery(config: DataConfig = getDataConfig()): string {
+  const params = new URLSearchParams();
+  (Object.keys(QUERY_PARAMS) as (keyof DataConfig)[]).forEach((key) => {
+    const value = config[key];
+    if (value !== null && value !== DEFAULT_DATA_CONFIG[key]) {
+      params.set(QUERY_PARAMS[key], value === true ? '1' : String(value));
+    }
+  });
+  return params.toString();
+}
+
+/**
+ * Override part of the configuration for this session
+ */
+export function setDataConfig(overrides: Partial<DataConfig>): DataConfig {
+  cached = withTestDefaults({ ...getDataConfig(), ...overrides });
+  if (typeof window !== 'undefined') {
+    writeStorage({ ...readStorage(), ...overrides });
+  }
+  return cached;
+}
+
+/**
+ * Drop session overrides and fall back to env/defaults
+ */
+export function resetDataConfig() {
+  cached = null;
+  if (typeof window !== 'undefined') {
+    try {
+      window.sessionStorage.removeItem(STORAGE_KEY);
+    } catch {
+      // Nothing persisted
+    }
+    document.cookie = `${CONFIG_COOKIE}=; path=/; max-age=0`;
+  }
+}
+
+/**
+ * Random source for one data stream: Math.random when unseeded, otherwise a
+ * fresh generator so each call reproduces the same sequence
+ */
+export function dataRng(stream: string, config: DataConfig = getDataConfig()): Rng {
+  return config.seed === null ? Math.random : createRng(hashSeed(config.seed, stream));
+}
+
+/**
+ * Simulated API latency: the configured value, zero in test mode, otherwise
+ * the caller's default
+ */
+export function simulatedDelay(defaultMs: number): number {
+  const { latencyMs, testMode } = getDataConfig();
+  if (latencyMs !== null) return latencyMs;
+  return testMode ? 0 : defaultMs;
+}
@@ -0,0 +1,53 @@
+/**
+ * Largest-Triangle-Three-Buckets downsampling for line charts.
+ *
+ * Keeps the first and last point and, from each of ``threshold - 2`` equal
+ * buckets in between, the point forming the largest triangle with the
+ * previously kept point and the average of the next bucket. The output is a
+ * subset of real points, so peaks and tooltips stay truthful.
+ */
+
+export function lttb<T>(data: readonly T[], threshold: number, value: (point: T) => number): T[] {
+  const length = data.length;
+  const target = Math.max(3, Math.floor(threshold));
+  if (target >= length) return data as T[];
+
+  const values = new Float64Array(length);
+  for (let i = 0; i < length; i++) values[i] = value(data[i]);
+
+  const sampled: T[] = [data[0]];
+  const every = (length - 2) / (target - 2);
+  let kept = 0;
+
+  for (let bucket = 0; bucket < target - 2; bucket++) {
+    // Average of the next bucket (just the last point for the final one)
+    const nextStart = Math.floor((bucket + 1) * every) + 1;
+    const nextEnd = Math.min(Math.floor((bucket + 2) * every) + 1, length);
+    let avgX = 0;
+    let avgY = 0;
+    for (let j = nextStart; j < nextEnd; j++) {
+      avgX += j;
+      avgY += values[j];
+    }
+    avgX /= nextEnd - nextStart;
+    avgY /= nextEnd - nextStart;
+
+    const start = Math.floor(bucket * every) + 1;
+    const end = Math.floor((bucket + 1) * every) + 1;
+    const keptY = values[kept];
+    let maxArea = -1;
+    let chosen = start;
+    for (let j = start; j < end; j++) {
+      const area = Math.abs((kept - avgX) * (values[j] - keptY) - (kept - j) * (avgY - keptY));
+      if (area > maxArea) {
+        maxArea = area;
+        chosen = j;
+      }
+    }
+    sampled.push(data[chosen]);
+    kept = chosen;
+  }
+
+  sampled.push(data[length - 1]);
+  return sampled;
+}
@@ -0,0 +1,118 @@
+/**
+ * Cached Intl formatters and whole-column formatting.
+ *
+ * Constructing an Intl.NumberFormat or Intl.DateTimeFormat costs far more
+ * than formatting with one, so instances are kept in a small LRU keyed by
+ * locale and options. The column helpers resolve the formatter once per call
+ * and reuse the string for repeated values, which is the common case for
+ * dates, statuses and rounded metrics.
+ */
+
+export type DateFormat = 'short' | 'long' | 'iso';
+
+const MAX_FORMATTERS = 64;
+
+const DATE_OPTIONS: Record<Exclude<DateFormat, 'iso'>, Intl.DateTimeFormatOptions> = {
+  short: { month: 'short', day: 'numeric', year: 'numeric' },
+  long: { weekday: 'long', year: 'numeric', month: 'long', day: 'numeric' }
+};
+
+const formatters = new Map<string, Intl.NumberFormat | Intl.DateTimeFormat>();
+
+function cached<F extends Intl.NumberFormat | Intl.DateTimeFormat>(key: string, create: () => F): F {
+  const existing = formatters.get(key);
+  if (existing) {
+    // Re-insert so Map order tracks recency
+    formatters.delete(key);
+    formatters.set(key, existing);
+    return existing as F;
+  }
+  const formatter = create();
+  formatters.set(key, formatter);
+  if (formatters.size > MAX_FORMATTERS) {
+    formatters.delete(formatters.keys().next().value as string);
+  }
+  return formatter;
+}
+
+/**
+ * Shared Intl.NumberFormat for ``locale`` and ``options``
+ */
+export function getNumberFormat(locale?: string, options: Intl.NumberFormatOptions = {}): Intl.NumberFormat {
+  return cached(`n|${locale ?? ''}|${JSON.stringify(options)}`, () => new Intl.NumberFormat(locale, options));
+}
+
+/**
+ * Shared Intl.DateTimeFormat for ``locale`` and ``options``
+ */
+export function getDateTimeFormat(locale?: string, options: Intl.DateTimeFormatOptions = {}): Intl.DateTimeFormat {
+  return cached(`d|${locale ?? ''}|${JSON.stringify(options)}`, () => new Intl.DateTimeFormat(locale, options));
+}
+
+/**
+ * Currency formatter (whole units, up to two decimals), keyed without
+ * serializing options since it sits on the per-cell path
+ */
+export function getCurrencyFormat(locale: string = 'en-US', currency: string = 'USD'): Intl.NumberFormat {
+  return cached(`c|${locale}|${currency}`, () => new Intl.NumberFormat(locale, {
+    style: 'currency',
+    currency,
+    minimumFractionDigits: 0,
+    maximumFractionDigits: 2
+  }));
+}
+
+function toDate(date: string | number | Date): Date {
+  return date instanceof Date ? date : new Date(date);
+}
+
+/**
+ * Format one date as ``format``; ``iso`` is the UTC calendar date
+ */
+export function formatDateValue(date: string | number | Date, format: DateFormat = 'short', locale: string = 'en-US'): string {
+  const value = toDate(date);
+  if (format === 'iso') return value.toISOString().split('T')[0];
+  return getDateTimeFormat(locale, DATE_OPTIONS[format]).format(value);
+}
+
+/**
+ * Apply ``format`` to every value, formatting each distinct value once
+ */
+export function formatColumn<V>(values: ArrayLike<V>, format: (value: V) => string): string[] {
+  const out: string[] = new Array(values.length);
+  const seen = new Map<V, string>();
+  for (let i = 0; i < values.length; i++) {
+    const value = values[i];
+    let text = seen.get(value);
+    if (text === undefined) {
+      text = format(value);
+      seen.set(value, text);
+    }
+    out[i] = text;
+  }
+  return out;
+}
+
+/**
+ * Currency strings for a whole column
+ */
+export function formatCurrencyColumn(values: ArrayLike<number>, locale?: string, currency?: string): string[] {
+  const formatter = getCurrencyFormat(locale, currency);
+  return formatColumn(values, (value) => formatter.format(value));
+}
+
+/**
+ * Date strings for a whole column; date-only strings repeat a lot, so this
+ * mostly costs one lookup per cell
+ */
+export function formatDateColumn(
+  values: ArrayLike<string | number | Date>,
+  format: DateFormat = 'short',
+  locale: string = 'en-US'
+): string[] {
+  if (format === 'iso') {
+    return formatColumn(values, (value) => toDate(value).toISOString().split('T')[0]);
+  }
+  const formatter = getDateTimeFormat(locale, DATE_OPTIONS[format]);
+  return formatColumn(values, (value) => formatter.format(toDate(value)));
+}
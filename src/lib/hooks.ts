@@ -1,51 +1,127 @@
 'use client';
 
-import { useState, useEffect } from 'react';
+import { useState, useEffect, useRef, useCallback } from 'react';
+import { DashboardDelta, DashboardSummary } from '@/types/dashboard';
+import { getDataConfig, simulatedDelay } from './dataConfig';
+import { applyDashboardDelta, liveUrl } from './live';
+import { DEFAULT_QUERY_TTL_MS, fetchQuery, getQueryData, isAbortError } from './queryCache';
 
 interface UseDataFetchingOptions<T> {
-  fetchFn: () => Promise<T>;
+  fetchFn: (signal: AbortSignal) => Promise<T>;
   dependencies?: any[];
   onError?: (error: Error) => void;
+  // Shared cache key; without one nothing is cached or deduplicated
+  key?: string;
+  // Cached data younger than this is used without revalidating (default 0)
+  staleTime?: number;
+  // How long cached data may be shown at all
+  ttl?: number;
 }
 
-interface UseDataFetchingResult<T> {
+export interface UseDataFetchingResult<T> {
   data: T | null;
   loading: boolean;
   error: Error | null;
   refetch: () => void;
 }
 
+// Number of fetches currently in flight across all hook instances
+let pendingFetches = 0;
+
+/**
+ * Mirror fetch activity on <html data-fetch-state> so end-to-end tests can
+ * wait for data instead of sleeping
+ */
+function trackPendingFetch(delta: 1 | -1) {
+  pendingFetches = Math.max(0, pendingFetches + delta);
+  if (typeof document !== 'undefined') {
+    document.documentElement.dataset.fetchState = pendingFetches > 0 ? 'loading' : 'idle';
+  }
+}
+
+/**
+ * Fetch data for a component. With a ``key`` the result goes through the
+ * shared query cache: cached data is shown at once and revalidated in the
+ * background, and identical requests from other components are shared.
+ * Only the latest request may update state; ``refetch`` bypasses the cache
+ * and aborts the request it replaces.
+ */
 export function useDataFetching<T>({
   fetchFn,
   dependencies = [],
-  onError
+  onError,
+  key,
+  staleTime = 0,
+  ttl = DEFAULT_QUERY_TTL_MS
 }: UseDataFetchingOptions<T>): UseDataFetchingResult<T> {
-  const [data, setData] = useState<T | null>(null);
-  const [loading, setLoading] = useState(true);
+  const [cached] = useState(() => (key ? getQueryData<T>(key, ttl) : undefined));
+  const [data, setData] = useState<T | null>(cached ? cached.data : null);
+  const [loading, setLoading] = useState(!cached);
   const [error, setError] = useState<Error | null>(null);
 
-  const fetchData = async () => {
-    try {
+  // Latest callbacks, so a request started now uses the current closure
+  const fetchRef = useRef(fetchFn);
+  fetchRef.current = fetchFn;
+  const onErrorRef = useRef(onError);
+  onErrorRef.current = onError;
+  const requestId = useRef(0);
+  const controller = useRef<AbortController | null>(null);
+
+  const fetchData = useCallback(async (force: boolean) => {
+    const id = ++requestId.current;
+    const hit = key && !force ? getQueryData<T>(key, ttl) : undefined;
+    if (hit) {
+      setData(hit.data);
+      setError(null);
+      setLoading(false);
+      if (Date.now() - hit.updatedAt < staleTime) return;
+    } else {
       setLoading(true);
       setError(null);
-      const result = await fetchFn();
-      setData(result);
+    }
+
+    let request: Promise<T>;
+    if (key) {
+      request = fetchQuery(key, fetchRef.current, { force });
+    } else {
+      controller.current?.abort();
+      controller.current = new AbortController();
+      request = fetchRef.current(controller.current.signal);
+    }
+
+    trackPendingFetch(1);
+    try {
+      const result = await request;
+      if (id === requestId.current) setData(result);
     } catch (err) {
+      if (id !== requestId.current) return;
+      if (isAbortError(err)) {
+        // A shared request was replaced by another component's refetch
+        if (key) fetchData(false);
+        return;
+      }
       const error = err instanceof Error ? err : new Error('An unknown error occurred');
       setError(error);
-      onError?.(error);
+      onErrorRef.current?.(error);
     } finally {
-      setLoading(false);
+      if (id === requestId.current) setLoading(false);
+      trackPendingFetch(-1);
     }
-  };
+  }, [key, staleTime, ttl]);
 
   useEffect(() => {
-    fetchData();
-  }, dependencies);
+    fetchData(false);
+  }, [fetchData, ...dependencies]);
 
-  const refetch = () => {
-    fetchData();
-  };
+  // Results arriving after unmount are dropped
+  useEffect(() => () => {
+    requestId.current += 1;
+    controller.current?.abort();
+  }, []);
+
+  const refetch = useCallback(() => {
+    fetchData(true);
+  }, [fetchData]);
 
   return { data, loading, error, refetch };
 }
@@ -56,19 +132,22 @@ export function useRealTimeData<T>(
   updateInterval: number = 30000
 ): [T, () => void] {
   const [data, setData] = useState<T>(initialData);
-  const [isUpdating, setIsUpdating] = useState(false);
+  // Refs rather than state: the interval below must see the latest values,
+  // not the ones captured when it was created
+  const pendingUpdate = useRef<ReturnType<typeof setTimeout> | null>(null);
+  const latestData = useRef(initialData);
+  latestData.current = initialData;
 
   const updateData = () => {
-    if (isUpdating) return;
+    if (pendingUpdate.current !== null) return;
     
-    setIsUpdating(true);
     // Simulate API call delay
-    setTimeout(() => {
+    pendingUpdate.current = setTimeout(() => {
+      pendingUpdate.current = null;
       // For now, just return the same data structure with slight variations
       // In a real app, this would be an API call
-      setData(initialData);
-      setIsUpdating(false);
-    }, 1000);
+      setData(latestData.current);
+    }, simulatedDelay(1000));
   };
 
   useEffect(() => {
@@ -76,5 +155,85 @@ export function useRealTimeData<T>(
     return () => clearInterval(interval);
   }, [updateInterval]);
 
+  // Drop an in-flight update on unmount so it cannot set state afterwards
+  useEffect(() => () => {
+    if (pendingUpdate.current !== null) {
+      clearTimeout(pendingUpdate.current);
+    }
+  }, []);
+
   return [data, updateData];
-} 
\ No newline at end of file
+} 
+
+/**
+ * Dashboard data kept current by /api/live: each streamed delta is merged
+ * into the latest state instead of refetching the whole payload. A new
+ * ``data`` (fetch or refresh) replaces the merged state. Off in test mode,
+ * where data must stay deterministic and the network must go idle.
+ */
+export function useLiveDashboard(data: DashboardSummary | null): DashboardSummary | null {
+  const [state, setState] = useState({ base: data, value: data });
+  if (state.base !== data) {
+    setState({ base: data, value: data });
+  }
+  const enabled = data !== null && !getDataConfig().testMode && typeof EventSource !== 'undefined';
+
+  useEffect(() => {
+    if (!enabled) return;
+    const source = new EventSource(liveUrl());
+    source.addEventListener('delta', (event) => {
+      const delta: DashboardDelta = JSON.parse((event as MessageEvent).data);
+      setState((current) => current.value
+        ? { base: current.base, value: applyDashboardDelta(current.value, delta) }
+        : current);
+    });
+    return () => source.close();
+  }, [enabled]);
+
+  return state.base === data ? state.value : data;
+}
+
+// How far ahead of the viewport an element counts as approaching it
+const NEAR_VIEWPORT_MARGIN = '300px';
+// Upper bound on waiting for idle time before giving up and loading anyway
+const IDLE_TIMEOUT_MS = 2000;
+
+/**
+ * Becomes true once the referenced element comes within
+ * ``NEAR_VIEWPORT_MARGIN`` of the viewport, or once the browser is idle,
+ * whichever comes first, and then stays true. Used to start loading deferred
+ * code just before it is needed without leaving off-screen parts unloaded.
+ */
+export function useNearViewport<E extends Element>() {
+  const ref = useRef<E>(null);
+  const [near, setNear] = useState(false);
+
+  useEffect(() => {
+    if (near) return;
+    const reveal = () => setNear(true);
+    const element = ref.current;
+    if (!element || typeof IntersectionObserver === 'undefined') {
+      reveal();
+      return;
+    }
+
+    const observer = new IntersectionObserver(
+      (entries) => {
+        if (entries.some((entry) => entry.isIntersecting)) reveal();
+      },
+      { rootMargin: NEAR_VIEWPORT_MARGIN }
+    );
+    observer.observe(element);
+    const idle = typeof requestIdleCallback === 'function'
+      ? requestIdleCallback(reveal, { timeout: IDLE_TIMEOUT_MS })
+      : window.setTimeout(reveal, IDLE_TIMEOUT_MS);
+
+    return () => {
+      observer.disconnect();
+      if (typeof cancelIdleCallback === 'function') cancelIdleCallback(idle);
+      else window.clearTimeout(idle);
+    };
+  }, [near]);
+
+  return { ref, near };
+}
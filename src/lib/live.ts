@@ -0,0 +1,83 @@
+/**
+ * Client side of /api/live: merging streamed deltas into dashboard data.
+ *
+ * Only the objects a delta touches are replaced, so memoized widgets whose
+ * props keep their identity (other metric cards, unchanged charts and table
+ * rows) skip re-rendering.
+ */
+
+import { CampaignData, DashboardDelta, DashboardSummary } from '@/types/dashboard';
+import { campaignRates } from './data';
+import { dataConfigQuery } from './dataConfig';
+
+export const LIVE_ENDPOINT = '/api/live';
+
+/**
+ * Stream URL for the current data configuration
+ */
+export function liveUrl(): string {
+  const query = dataConfigQuery();
+  return query ? `${LIVE_ENDPOINT}?${query}` : LIVE_ENDPOINT;
+}
+
+function mergeCampaigns(campaigns: CampaignData[], changes: DashboardDelta['campaigns']): CampaignData[] {
+  if (changes.length === 0) return campaigns;
+  const byId = new Map<string, CampaignData>();
+  for (const change of changes) {
+    // Ids are campaign-<n>, so the row is found without a scan
+    const index = Number(change.id.slice(change.id.lastIndexOf('-') + 1)) - 1;
+    const current = byId.get(change.id) ?? campaigns[index];
+    if (!current || current.id !== change.id) continue;
+    const clicks = current.clicks + change.clicks;
+    const conversions = current.conversions + change.conversions;
+    const cost = current.cost + change.cost;
+    byId.set(change.id, { ...current, clicks, conversions, cost, ...campaignRates(clicks, conversions, cost) });
+  }
+  if (byId.size === 0) return campaigns;
+
+  const next = campaigns.slice();
+  byId.forEach((campaign) => {
+    next[Number(campaign.id.slice(campaign.id.lastIndexOf('-') + 1)) - 1] = campaign;
+  });
+  return next;
+}
+
+/**
+ * ``data`` with ``delta`` applied; untouched parts keep their identity
+ */
+export function applyDashboardDelta(data: DashboardSummary, delta: DashboardDelta): DashboardSummary {
+  const values = new Map(delta.metrics.map((metric) => [metric.id, metric.value]));
+  const metrics = data.metrics.some((metric) => values.has(metric.id) && values.get(metric.id) !== metric.value)
+    ? data.metrics.map((metric) => {
+        const value = values.get(metric.id);
+        return value === undefined || value === metric.value ? metric : { ...metric, value };
+      })
+    : data.metrics;
+
+  let lineChartData = data.lineChartData;
+  const point = delta.series;
+  const last = lineChartData[lineChartData.length - 1];
+  if (point && last) {
+    if (point.date === last.date) {
+      lineChartData = lineChartData.slice(0, -1);
+      lineChartData.push({
+        date: last.date,
+        revenue: last.revenue + point.revenue,
+        visitors: (last.visitors ?? 0) + (point.visitors ?? 0),
+        conversions: (last.conversions ?? 0) + (point.conversions ?? 0)
+      });
+    } else if (point.date > last.date) {
+      // A new bucket: slide the window forward
+      lineChartData = lineChartData.slice(1);
+      lineChartData.push(point);
+    }
+  }
+
+  return {
+    ...data,
+    metrics,
+    lineChartData,
+    campaigns: mergeCampaigns(data.campaigns, delta.campaigns),
+    lastUpdated: delta.generatedAt
+  };
+}
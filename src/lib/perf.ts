@@ -0,0 +1,62 @@
+/**
+ * User Timing instrumentation for the dashboard refresh cycle.
+ *
+ * A cycle is click -> fetch resolved -> React commit -> next paint. Each phase
+ * is recorded with performance.mark and the spans between them with
+ * performance.measure, so they show up in DevTools and can be read by the
+ * refresh benchmark (testsprite_tests/harness/bench_refresh.py).
+ */
+
+export type RefreshPhase = 'click' | 'fetched' | 'commit' | 'painted';
+
+export const REFRESH_MEASURES = {
+  fetch: 'refresh:fetch',
+  commit: 'refresh:commit',
+  paint: 'refresh:paint',
+  total: 'refresh:total'
+} as const;
+
+const markName = (phase: RefreshPhase) => `refresh:${phase}:mark`;
+
+// Only instrument cycles started by a refresh click, not the initial load
+let cycleInProgress = false;
+
+function canMeasure(): boolean {
+  return typeof performance !== 'undefined' && typeof performance.mark === 'function';
+}
+
+/**
+ * Record a refresh phase; the final phase emits the measures for the cycle
+ */
+export function markRefreshPhase(phase: RefreshPhase) {
+  if (!canMeasure()) return;
+
+  if (phase === 'click') {
+    cycleInProgress = true;
+    performance.mark(markName('click'));
+    return;
+  }
+  if (!cycleInProgress) return;
+
+  performance.mark(markName(phase));
+
+  if (phase === 'painted') {
+    cycleInProgress = false;
+    performance.measure(REFRESH_MEASURES.fetch, markName('click'), markName('fetched'));
+    performance.measure(REFRESH_MEASURES.commit, markName('fetched'), markName('commit'));
+    performance.measure(REFRESH_MEASURES.paint, markName('commit'), markName('painted'));
+    performance.measure(REFRESH_MEASURES.total, markName('click'), markName('painted'));
+  }
+}
+
+/**
+ * Mark the commit of refreshed data and the first frame painted after it
+ */
+export function markRefreshCommitted() {
+  if (!cycleInProgress) return;
+  markRefreshPhase('commit');
+  // Two frames: the first runs before paint, the second after it
+  requestAnimationFrame(() => {
+    requestAnimationFrame(() => markRefreshPhase('painted'));
+  });
+}
@@ -0,0 +1,106 @@
+/**
+ * Keyed client-side query cache behind useDataFetching.
+ *
+ * Concurrent fetches of one key share a single request, a forced fetch
+ * aborts the request it supersedes, and results are kept for a TTL so pages
+ * can show them immediately while revalidating. Least recently used keys are
+ * evicted past MAX_QUERIES.
+ */
+
+export const DEFAULT_QUERY_TTL_MS = 5 * 60 * 1000;
+const MAX_QUERIES = 50;
+
+interface QueryEntry {
+  data?: unknown;
+  updatedAt: number;
+  promise?: Promise<unknown>;
+  controller?: AbortController;
+}
+
+const entries = new Map<string, QueryEntry>();
+
+function touch(key: string): QueryEntry {
+  const entry = entries.get(key) ?? { updatedAt: 0 };
+  entries.delete(key);
+  entries.set(key, entry);
+  return entry;
+}
+
+function evict() {
+  entries.forEach((entry, key) => {
+    if (entries.size > MAX_QUERIES && !entry.promise) {
+      entries.delete(key);
+    }
+  });
+}
+
+/**
+ * Cached result for ``key`` if it is younger than ``ttlMs``
+ */
+export function getQueryData<T>(
+  key: string,
+  ttlMs: number = DEFAULT_QUERY_TTL_MS
+): { data: T; updatedAt: number } | undefined {
+  const entry = entries.get(key);
+  if (!entry || entry.updatedAt === 0 || Date.now() - entry.updatedAt > ttlMs) {
+    return undefined;
+  }
+  touch(key);
+  return { data: entry.data as T, updatedAt: entry.updatedAt };
+}
+
+/**
+ * Fetch ``key``, joining a request already in flight unless ``force`` is set,
+ * in which case that request is aborted and replaced
+ */
+export function fetchQuery<T>(
+  key: string,
+  fetchFn: (signal: AbortSignal) => Promise<T>,
+  { force = false }: { force?: boolean } = {}
+): Promise<T> {
+  const entry = touch(key);
+  if (entry.promise && !force) {
+    return entry.promise as Promise<T>;
+  }
+
+  entry.controller?.abort();
+  const controller = new AbortController();
+  const promise: Promise<T> = fetchFn(controller.signal)
+    .then((data) => {
+      // A superseded request must not overwrite a newer result
+      if (entry.promise === promise) {
+        entry.data = data;
+        entry.updatedAt = Date.now();
+      }
+      return data;
+    })
+    .finally(() => {
+      if (entry.promise === promise) {
+        entry.promise = undefined;
+        entry.controller = undefined;
+      }
+    });
+
+  entry.promise = promise;
+  entry.controller = controller;
+  evict();
+  return promise;
+}
+
+/**
+ * Drop cached data for ``key`` (or every key) so the next fetch goes out
+ */
+export function invalidateQuery(key?: string) {
+  if (key === undefined) {
+    entries.clear();
+  } else {
+    entries.delete(key);
+  }
+}
+
+/**
+ * True for the rejection of an aborted request
+ */
+export function isAbortError(error: unknown): boolean {
+  return error instanceof Error && error.name === 'AbortError';
+}
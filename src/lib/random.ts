@@ -0,0 +1,40 @@
+/**
+ * Seedable pseudo-random number generation for reproducible synthetic data.
+ *
+ * The algorithms are mirrored in testsprite_tests/harness/datagen.py; keep
+ * the two in sync so Python fixtures can predict generated values.
+ */
+
+export type Rng = () => number;
+
+/**
+ * Mulberry32: small, fast 32-bit generator returning floats in [0, 1)
+ */
+export function createRng(seed: number): Rng {
+  let state = seed >>> 0;
+  return () => {
+    state = (state + 0x6d2b79f5) >>> 0;
+    let t = Math.imul(state ^ (state >>> 15), 1 | state);
+    t = (t + Math.imul(t ^ (t >>> 7), 61 | t)) ^ t;
+    return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+  };
+}
+
+/**
+ * Derive an independent seed per data stream (FNV-1a over the stream name)
+ */
+export function hashSeed(seed: number, stream: string): number {
+  let hash = (2166136261 ^ (seed >>> 0)) >>> 0;
+  for (let i = 0; i < stream.length; i++) {
+    hash ^= stream.charCodeAt(i);
+    hash = Math.imul(hash, 16777619) >>> 0;
+  }
+  return hash;
+}
+
+/**
+ * Random integer in [min, min + span)
+ */
+export function randomInt(rng: Rng, min: number, span: number): number {
+  return Math.floor(rng() * span) + min;
+}
@@ -0,0 +1,240 @@
+/**
+ * Time rollups of the revenue series.
+ *
+ * Points are folded into day, week and month buckets as they are added, so
+ * the analytics and reports date ranges are answered from pre-aggregated
+ * buckets instead of the raw (possibly hourly) series. A range is served at
+ * the coarsest level that still gives the chart enough points; its partial
+ * edge buckets are assembled from the largest whole buckets that fit, so a
+ * query touches roughly one bucket per output point.
+ */
+
+import { LineChartData, TimeRange } from '@/types/dashboard';
+
+export const ROLLUP_LEVELS = ['day', 'week', 'month'] as const;
+export const ROLLUP_FIELDS = ['revenue', 'visitors', 'conversions'] as const;
+
+export type RollupLevel = typeof ROLLUP_LEVELS[number];
+export type RollupField = typeof ROLLUP_FIELDS[number];
+export type RollupTotals = Record<RollupField, number> & { points: number };
+
+export interface RollupSeries {
+  level: RollupLevel;
+  data: LineChartData[];
+}
+
+export const TIME_RANGE_DAYS: Record<TimeRange, number> = {
+  '7d': 7,
+  '30d': 30,
+  '90d': 90,
+  '1y': 365
+};
+
+const DAY_MS = 24 * 60 * 60 * 1000;
+
+// A coarser level is only used when the range spans at least this many of its buckets
+const MIN_BUCKETS = 12;
+
+/**
+ * UTC midnight of a series date (YYYY-MM-DD, optionally followed by a time)
+ */
+export function dayStart(date: string): number {
+  return Date.UTC(Number(date.slice(0, 4)), Number(date.slice(5, 7)) - 1, Number(date.slice(8, 10)));
+}
+
+function dayLabel(time: number): string {
+  return new Date(time).toISOString().slice(0, 10);
+}
+
+/**
+ * Start of the ``level`` bucket holding ``day``; weeks start on Monday
+ */
+function bucketStart(level: RollupLevel, day: number): number {
+  if (level === 'day') return day;
+  const date = new Date(day);
+  if (level === 'week') return day - ((date.getUTCDay() + 6) % 7) * DAY_MS;
+  return Date.UTC(date.getUTCFullYear(), date.getUTCMonth(), 1);
+}
+
+function nextBucket(level: RollupLevel, start: number): number {
+  if (level === 'day') return start + DAY_MS;
+  if (level === 'week') return start + 7 * DAY_MS;
+  const date = new Date(start);
+  return Date.UTC(date.getUTCFullYear(), date.getUTCMonth() + 1, 1);
+}
+
+function emptyTotals(): RollupTotals {
+  return { revenue: 0, visitors: 0, conversions: 0, points: 0 };
+}
+
+/**
+ * Buckets of one level as parallel columns, sorted by start time
+ */
+class RollupBuckets {
+  readonly starts: number[] = [];
+  readonly revenue: number[] = [];
+  readonly visitors: number[] = [];
+  readonly conversions: number[] = [];
+  readonly points: number[] = [];
+
+  /** Index of the bucket starting at ``start``, or -1 */
+  indexOf(start: number): number {
+    const index = this.lowerBound(start);
+    return this.starts[index] === start ? index : -1;
+  }
+
+  add(start: number, point: LineChartData): void {
+    const last = this.starts.length - 1;
+    // Points almost always land in the newest bucket or open the next one
+    const index = last >= 0 && this.starts[last] === start ? last : this.lowerBound(start);
+    if (this.starts[index] !== start) {
+      this.starts.splice(index, 0, start);
+      ROLLUP_FIELDS.forEach((field) => this[field].splice(index, 0, 0));
+      this.points.splice(index, 0, 0);
+    }
+    this.revenue[index] += point.revenue;
+    this.visitors[index] += point.visitors ?? 0;
+    this.conversions[index] += point.conversions ?? 0;
+    this.points[index] += 1;
+  }
+
+  /** Add the bucket at ``index`` into ``totals`` */
+  accumulate(index: number, totals: RollupTotals): void {
+    totals.revenue += this.revenue[index];
+    totals.visitors += this.visitors[index];
+    totals.conversions += this.conversions[index];
+    totals.points += this.points[index];
+  }
+
+  private lowerBound(start: number): number {
+    let low = 0;
+    let high = this.starts.length;
+    while (low < high) {
+      const mid = (low + high) >>> 1;
+      if (this.starts[mid] < start) low = mid + 1;
+      else high = mid;
+    }
+    return low;
+  }
+}
+
+export class RollupCube {
+  private readonly levels: Record<RollupLevel, RollupBuckets> = {
+    day: new RollupBuckets(),
+    week: new RollupBuckets(),
+    month: new RollupBuckets()
+  };
+
+  constructor(points: readonly LineChartData[] = []) {
+    points.forEach((point) => this.add(point));
+  }
+
+  /** First and last day with data (UTC midnight), or null when empty */
+  get extent(): [number, number] | null {
+    const { starts } = this.levels.day;
+    return starts.length ? [starts[0], starts[starts.length - 1]] : null;
+  }
+
+  /**
+   * Add one point to its day, week and month; values are summed into any
+   * bucket the point's date already has, matching live series deltas
+   */
+  add(point: LineChartData): void {
+    const day = dayStart(point.date);
+    ROLLUP_LEVELS.forEach((level) => this.levels[level].add(bucketStart(level, day), point));
+  }
+
+  /** Coarsest level giving at least MIN_BUCKETS points between two days */
+  levelFor(start: number, end: number): RollupLevel {
+    const first = new Date(start);
+    const last = new Date(end);
+    const months = (last.getUTCFullYear() - first.getUTCFullYear()) * 12 + last.getUTCMonth() - first.getUTCMonth() + 1;
+    if (months >= MIN_BUCKETS) return 'month';
+    const weeks = (bucketStart('week', end) - bucketStart('week', start)) / (7 * DAY_MS) + 1;
+    return weeks >= MIN_BUCKETS ? 'week' : 'day';
+  }
+
+  /** Sums over the days ``start`` to ``end`` inclusive (UTC midnights) */
+  totals(start: number, end: number): RollupTotals {
+    const totals = emptyTotals();
+    const stop = end + DAY_MS;
+    let cursor = start;
+    while (cursor < stop) {
+      const level = this.widestBucketAt(cursor, stop);
+      const index = this.levels[level].indexOf(cursor);
+      if (index >= 0) this.levels[level].accumulate(index, totals);
+      cursor = nextBucket(level, cursor);
+    }
+    return totals;
+  }
+
+  /**
+   * Series for the days ``start`` to ``end`` at ``level`` (chosen from the
+   * span when omitted); edge buckets are clipped to the range and dated by
+   * their first day in it, and empty buckets are left out
+   */
+  series(start: number, end: number, level: RollupLevel = this.levelFor(start, end)): LineChartData[] {
+    const buckets = this.levels[level];
+    const stop = end + DAY_MS;
+    const data: LineChartData[] = [];
+    for (let bucket = bucketStart(level, start); bucket < stop; bucket = nextBucket(level, bucket)) {
+      const from = Math.max(bucket, start);
+      const to = Math.min(nextBucket(level, bucket), stop);
+      let totals: RollupTotals;
+      if (from === bucket && to === nextBucket(level, bucket)) {
+        const index = buckets.indexOf(bucket);
+        if (index < 0) continue;
+        totals = emptyTotals();
+        buckets.accumulate(index, totals);
+      } else {
+        totals = this.totals(from, to - DAY_MS);
+      }
+      if (totals.points === 0) continue;
+      data.push({
+        date: dayLabel(from),
+        revenue: totals.revenue,
+        visitors: totals.visitors,
+        conversions: totals.conversions
+      });
+    }
+    return data;
+  }
+
+  /** The last ``days`` days up to the newest data point */
+  lastDays(days: number): RollupSeries {
+    const extent = this.extent;
+    if (!extent) return { level: 'day', data: [] };
+    const end = extent[1];
+    const start = end - (days - 1) * DAY_MS;
+    const level = this.levelFor(start, end);
+    return { level, data: this.series(start, end, level) };
+  }
+
+  /**
+   * Widest bucket starting at ``cursor`` that ends by ``stop``; a week is
+   * skipped when it would cross into a whole month that also fits
+   */
+  private widestBucketAt(cursor: number, stop: number): RollupLevel {
+    const monthEnd = nextBucket('month', bucketStart('month', cursor));
+    if (bucketStart('month', cursor) === cursor && monthEnd <= stop) return 'month';
+    const weekEnd = nextBucket('week', cursor);
+    if (bucketStart('week', cursor) === cursor && weekEnd <= stop) {
+      if (weekEnd <= monthEnd || nextBucket('month', monthEnd) > stop) return 'week';
+    }
+    return 'day';
+  }
+}
+
+const cubes = new WeakMap<readonly LineChartData[], RollupCube>();
+
+/**
+ * Rollup cube for ``series``, built once per array
+ */
+export function getRollupCube(series: readonly LineChartData[]): RollupCube {
+  let cube = cubes.get(series);
+  if (!cube) {
+    cube = new RollupCube(series);
+    cubes.set(series, cube);
+  }
+  return cube;
+}
@@ -0,0 +1,178 @@
+/**
+ * Substring search over a fixed set of fields without scanning every row.
+ *
+ * Distinct field values are interned and indexed by trigram, so a query only
+ * verifies the values that contain all of its trigrams and then marks the
+ * rows holding them. Dates, statuses and the base campaign names repeat a
+ * lot, which keeps the index far smaller than the rows.
+ */
+
+const GRAM_SIZE = 3;
+// Above this share of changed rows, rebuilding beats patching
+const MAX_PATCHED_SHARE = 0.25;
+
+function gramsOf(value: string): Set<string> {
+  const grams = new Set<string>();
+  for (let i = 0; i + GRAM_SIZE <= value.length; i++) {
+    grams.add(value.slice(i, i + GRAM_SIZE));
+  }
+  return grams;
+}
+
+export class SearchIndex<T> {
+  private values: string[] = [];
+  private valueIds = new Map<string, number>();
+  private valueRows: number[][] = [];
+  private grams = new Map<string, number[]>();
+  private rowValues: number[][] = [];
+
+  constructor(private readonly fields: (keyof T)[], rows: readonly T[] = []) {
+    this.add(rows);
+  }
+
+  /** Number of indexed rows */
+  get size(): number {
+    return this.rowValues.length;
+  }
+
+  /** Index ``rows`` after the ones already indexed */
+  add(rows: readonly T[]): void {
+    for (const row of rows) {
+      const position = this.rowValues.length;
+      const ids = this.valuesOf(row);
+      ids.forEach((id) => this.valueRows[id].push(position));
+      this.rowValues.push(ids);
+    }
+  }
+
+  /** Re-index the row at ``position`` after it was replaced by ``row`` */
+  update(position: number, row: T): void {
+    for (const id of this.rowValues[position]) {
+      const rows = this.valueRows[id];
+      rows.splice(rows.indexOf(position), 1);
+    }
+    const ids = this.valuesOf(row);
+    for (const id of ids) {
+      // Keep row lists ascending
+      const rows = this.valueRows[id];
+      let low = 0;
+      let high = rows.length;
+      while (low < high) {
+        const mid = (low + high) >>> 1;
+        if (rows[mid] < position) low = mid + 1;
+        else high = mid;
+      }
+      rows.splice(low, 0, position);
+    }
+    this.rowValues[position] = ids;
+  }
+
+  /**
+   * Rows with a field containing ``query`` (case-insensitive) as a mask over
+   * row positions, or null when the query is empty and everything matches
+   */
+  match(query: string): Uint8Array | null {
+    const term = query.trim().toLowerCase();
+    if (!term) return null;
+
+    const mask = new Uint8Array(this.size);
+    for (const id of this.candidates(term)) {
+      if (this.values[id].includes(term)) {
+        this.valueRows[id].forEach((position) => { mask[position] = 1; });
+      }
+    }
+    return mask;
+  }
+
+  /** Same result as ``searchData(data, query, fields)`` for the indexed rows */
+  search(data: readonly T[], query: string): T[] {
+    const mask = this.match(query);
+    return mask ? data.filter((_, position) => mask[position] === 1) : data.slice();
+  }
+
+  private candidates(term: string): Iterable<number> {
+    if (term.length < GRAM_SIZE) {
+      return this.values.keys();
+    }
+    // The rarest trigram bounds the candidates; includes() checks the rest
+    let smallest: number[] | undefined;
+    for (const gram of gramsOf(term)) {
+      const ids = this.grams.get(gram);
+      if (!ids) return [];
+      if (!smallest || ids.length < smallest.length) smallest = ids;
+    }
+    return smallest ?? [];
+  }
+
+  private valuesOf(row: T): number[] {
+    const ids = new Set<number>();
+    for (const field of this.fields) {
+      ids.add(this.intern(String(row[field]).toLowerCase()));
+    }
+    return Array.from(ids);
+  }
+
+  private intern(value: string): number {
+    const existing = this.valueIds.get(value);
+    if (existing !== undefined) return existing;
+
+    const id = this.values.length;
+    this.values.push(value);
+    this.valueIds.set(value, id);
+    this.valueRows.push([]);
+    for (const gram of gramsOf(value)) {
+      const ids = this.grams.get(gram);
+      if (ids) ids.push(id);
+      else this.grams.set(gram, [id]);
+    }
+    return id;
+  }
+}
+
+const indexes = new WeakMap<readonly unknown[], Map<string, SearchIndex<unknown>>>();
+const latest = new Map<string, { data: readonly unknown[]; index: SearchIndex<unknown> }>();
+
+function patchable<T>(previous: readonly T[], data: readonly T[]): number[] | null {
+  if (data.length < previous.length) return null;
+  const changed: number[] = [];
+  for (let i = 0; i < previous.length; i++) {
+    if (data[i] !== previous[i]) {
+      changed.push(i);
+      if (changed.length > previous.length * MAX_PATCHED_SHARE) return null;
+    }
+  }
+  return changed;
+}
+
+/**
+ * Search index of ``fields`` over ``data``, built once per array. When
+ * ``data`` replaces the previously indexed array with a few changed or
+ * appended rows, that index is patched and moved over instead of rebuilt.
+ */
+export function getSearchIndex<T>(data: readonly T[], fields: (keyof T)[]): SearchIndex<T> {
+  const key = fields.map(String).join('\u0000');
+  let byFields = indexes.get(data);
+  const cached = byFields?.get(key);
+  if (cached) return cached as SearchIndex<T>;
+
+  const previous = latest.get(key) as { data: readonly T[]; index: SearchIndex<T> } | undefined;
+  const changed = previous ? patchable(previous.data, data) : null;
+  let index: SearchIndex<T>;
+  if (previous && changed) {
+    index = previous.index;
+    changed.forEach((position) => index.update(position, data[position]));
+    index.add(data.slice(previous.data.length));
+    // The old array no longer matches this index
+    indexes.get(previous.data)?.delete(key);
+  } else {
+    index = new SearchIndex(fields, data);
+  }
+
+  if (!byFields) {
+    byFields = new Map();
+    indexes.set(data, byFields);
+  }
+  byFields.set(key, index as SearchIndex<unknown>);
+  latest.set(key, { data, index: index as SearchIndex<unknown> });
+  return index;
+}
@@ -1,5 +1,8 @@
 import { type ClassValue, clsx } from "clsx";
 import { twMerge } from "tailwind-merge";
+import { buildSortIndex, descendingSortIndex } from "./computeKernels";
+import { dataRng } from "./dataConfig";
+import { formatDateValue, getCurrencyFormat, getDateTimeFormat } from "./format";
 
 /**
  * Utility function to merge Tailwind CSS classes with proper conflict resolution
@@ -9,19 +12,15 @@ export function cn(...inputs: ClassValue[]) {
 }
 
 /**
- * Format currency values with proper locale support
+ * Format currency values with proper locale support (the Intl formatter is
+ * shared, see format.ts)
  */
 export function formatCurrency(
   value: number,
   locale: string = 'en-US',
   currency: string = 'USD'
 ): string {
-  return new Intl.NumberFormat(locale, {
-    style: 'currency',
-    currency: currency,
-    minimumFractionDigits: 0,
-    maximumFractionDigits: 2,
-  }).format(value);
+  return getCurrencyFormat(locale, currency).format(value);
 }
 
 /**
@@ -61,24 +60,13 @@ export function formatDate(
   
   switch (format) {
     case 'short':
-      return dateObj.toLocaleDateString('en-US', {
-        month: 'short',
-        day: 'numeric',
-        year: 'numeric',
-      });
     case 'long':
-      return dateObj.toLocaleDateString('en-US', {
-        weekday: 'long',
-        year: 'numeric',
-        month: 'long',
-        day: 'numeric',
-      });
+    case 'iso':
+      return formatDateValue(dateObj, format);
     case 'relative':
       return getRelativeTimeString(dateObj);
-    case 'iso':
-      return dateObj.toISOString().split('T')[0];
     default:
-      return dateObj.toLocaleDateString();
+      return getDateTimeFormat().format(dateObj);
   }
 }
 
@@ -97,6 +85,58 @@ function getRelativeTimeString(date: Date): string {
   return `${Math.floor(diffInSeconds / 31536000)}y ago`;
 }
 
+// Ascending permutations per dataset and column; arrays are treated as
+// immutable, so a new array (not a mutation) is what invalidates an index
+const sortIndexes = new WeakMap<readonly unknown[], Map<PropertyKey, Uint32Array>>();
+// Descending permutations, derived from the ascending ones
+const descendingIndexes = new WeakMap<readonly unknown[], Map<PropertyKey, Uint32Array>>();
+
+function columnIndexes(cache: typeof sortIndexes, data: readonly unknown[]): Map<PropertyKey, Uint32Array> {
+  let columns = cache.get(data);
+  if (!columns) {
+    columns = new Map();
+    cache.set(data, columns);
+  }
+  return columns;
+}
+
+/**
+ * Row positions of ``data`` in ``key`` order, built once per array and
+ * direction; equal keys keep their original order either way
+ */
+export function getSortIndex<T>(data: readonly T[], key: keyof T, direction: 'asc' | 'desc' = 'asc'): Uint32Array {
+  const ascending = columnIndexes(sortIndexes, data);
+  let index = ascending.get(key);
+  if (!index) {
+    index = buildSortIndex(data.map((item) => item[key]));
+    ascending.set(key, index);
+  }
+  if (direction === 'asc') return index;
+
+  const descending = columnIndexes(descendingIndexes, data);
+  let reversed = descending.get(key);
+  if (!reversed) {
+    reversed = descendingSortIndex(index, data.map((item) => item[key]));
+    descending.set(key, reversed);
+  }
+  return reversed;
+}
+
+/**
+ * Whether the sort index for ``data`` and ``key`` is already built
+ */
+export function hasSortIndex<T>(data: readonly T[], key: keyof T): boolean {
+  return sortIndexes.get(data)?.has(key) ?? false;
+}
+
+/**
+ * Store a sort index built elsewhere (the compute worker) for ``data``
+ */
+export function primeSortIndex<T>(data: readonly T[], key: keyof T, index: Uint32Array) {
+  columnIndexes(sortIndexes, data).set(key, index);
+  descendingIndexes.get(data)?.delete(key);
+}
+
 /**
  * Generic sorting function for arrays
  */
@@ -106,23 +146,13 @@ export function sortData<T>(
   direction: 'asc' | 'desc' | null
 ): T[] {
   if (!direction) return data;
-  
-  return [...data].sort((a, b) => {
-    const aVal = a[key];
-    const bVal = b[key];
-    
-    if (typeof aVal === 'string' && typeof bVal === 'string') {
-      return direction === 'asc' 
-        ? aVal.localeCompare(bVal)
-        : bVal.localeCompare(aVal);
-    }
-    
-    if (typeof aVal === 'number' && typeof bVal === 'number') {
-      return direction === 'asc' ? aVal - bVal : bVal - aVal;
-    }
-    
-    return 0;
-  });
+
+  const index = getSortIndex(data, key, direction);
+  const result = new Array<T>(index.length);
+  for (let i = 0; i < index.length; i++) {
+    result[i] = data[index[i]];
+  }
+  return result;
 }
 
 /**
@@ -218,11 +248,12 @@ export function generateColors(count: number): string[] {
     '#EC4899', // Pink
   ];
   
-  // If we need more colors, generate them
+  // If we need more colors, generate them (seeded in test mode)
+  const random = dataRng('colors');
   while (colors.length < count) {
-    const hue = Math.floor(Math.random() * 360);
-    const saturation = 60 + Math.floor(Math.random() * 20);
-    const lightness = 50 + Math.floor(Math.random() * 20);
+    const hue = Math.floor(random() * 360);
+    const saturation = 60 + Math.floor(random() * 20);
+    const lightness = 50 + Math.floor(random() * 20);
     colors.push(`hsl(${hue}, ${saturation}%, ${lightness}%)`);
   }
   
@@ -62,6 +62,33 @@ export interface CampaignData {
   roi?: number;
 }
 
+export type CampaignStatus = CampaignData['status'];
+
+/**
+ * Campaign query sent to /api/campaigns/query
+ */
+export interface CampaignQuery {
+  sortBy?: keyof CampaignData;
+  sortDirection?: 'asc' | 'desc' | null;
+  search?: string;
+  statuses?: CampaignStatus[];
+  cursor?: string | null;
+  limit: number;
+}
+
+/**
+ * One page of a campaign query with counts for the whole result
+ */
+export interface CampaignPage {
+  items: CampaignData[];
+  offset: number;
+  totalItems: number; // All campaigns in the dataset
+  matchedItems: number; // Campaigns matching the search and status filters
+  nextCursor: string | null;
+  prevCursor: string | null;
+  statusCounts: Record<CampaignStatus, number>;
+}
+
 /**
  * Dashboard filters for data filtering and date range selection
  */
@@ -103,6 +130,15 @@ export interface TableProps {
   onPageChange?: (page: number) => void;
   onSearch?: (query: string) => void;
   className?: string;
+  // Server mode: rows are queried page by page from /api/campaigns/query and
+  // `data` is ignored
+  serverMode?: boolean;
+  filters?: { search?: string; statuses?: CampaignStatus[] };
+  onPageLoaded?: (page: CampaignPage) => void;
+  // Mount only the rows in view; defaults to on for pages over 100 rows
+  virtualized?: boolean;
+  rowHeight?: number;
+  viewportHeight?: number;
 }
 
 /**
@@ -162,6 +198,45 @@ export interface DashboardSummary {
   lastUpdated: string;
 }
 
+/**
+ * Independently loaded part of the dashboard (one widget or widget group)
+ */
+export type DashboardSection = Exclude<keyof DashboardSummary, 'lastUpdated'>;
+
+/**
+ * Dashboard sections as separately resolving promises, streamed from the
+ * server-rendered page into one Suspense boundary per widget (null when the
+ * server could not load that section)
+ */
+export type DashboardStream = {
+  [K in DashboardSection]: Promise<DashboardSummary[K] | null>;
+};
+
+/**
+ * Incremental update pushed by /api/live
+ */
+export interface DashboardDelta {
+  seq: number;
+  metrics: Array<Pick<MetricCard, 'id' | 'value'>>; // New values
+  series: LineChartData | null; // Added to the point with this date, or appended
+  campaigns: Array<Pick<CampaignData, 'id' | 'clicks' | 'conversions' | 'cost'>>; // Added to these rows
+  generatedAt: string;
+}
+
+/**
+ * Date range selectable on the analytics and reports pages
+ */
+export type TimeRange = '7d' | '30d' | '90d' | '1y';
+
+/**
+ * Chart series served by /api/series
+ */
+export interface SeriesData {
+  lineChartData: LineChartData[];
+  barChartData: BarChartData[];
+  donutChartData: DonutChartData[];
+}
+
 /**
  * API response wrapper
  */
@@ -1,105 +1,75 @@
 import asyncio
 from playwright import async_api
+from harness import BASE_URL, run_standalone, ready_click, settle, wait_until_ready
 
-async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
+async def run_test(context):
+    # Open a new page in the browser context
+    page = await context.new_page()
+
+    # Navigate to your target URL and wait until the network request is committed
+    await page.goto(BASE_URL, wait_until="commit", timeout=10000)
+
+    # Wait for the main page to reach DOMContentLoaded state (optional for stability)
     try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
+        await page.wait_for_load_state("domcontentloaded", timeout=3000)
+    except async_api.Error:
+        pass
+
+    # Iterate through all iframes and wait for them to load as well
+    for frame in page.frames:
         try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
+            await frame.wait_for_load_state("domcontentloaded", timeout=3000)
         except async_api.Error:
             pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
-        
-        # Interact with the page elements to simulate user flow
-        # Click the 'Collapse sidebar' button to manually collapse the sidebar and verify layout adjustment for tablet view
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div[2]/aside/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
 
-        # Simulate viewing the dashboard on a mobile device to verify mobile responsiveness and sidebar accessibility
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div[2]/div/header/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+    # Interact with the page elements to simulate user flow
+    # Click the 'Collapse sidebar' button to manually collapse the sidebar and verify layout adjustment for tablet view
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div[2]/aside/div/button').nth(0)
+    await ready_click(page, elem)
+
+
+    # Simulate viewing the dashboard on a mobile device to verify mobile responsiveness and sidebar accessibility
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div[2]/div/header/div/button').nth(0)
+    await ready_click(page, elem)
+
+
+    # Assert that sidebar, header, and main content panels are visible and have no overlap or cutoff on desktop
+    sidebar = frame.locator('aside')
+    header = frame.locator('header')
+    main_content = frame.locator('main')
+    assert await sidebar.is_visible()
+    assert await header.is_visible()
+    assert await main_content.is_visible()
+    sidebar_box = await sidebar.bounding_box()
+    header_box = await header.bounding_box()
+    main_box = await main_content.bounding_box()
+    assert sidebar_box is not None and header_box is not None and main_box is not None
+    # Check no horizontal overlap: sidebar right edge <= main content left edge
+    assert sidebar_box['x'] + sidebar_box['width'] <= main_box['x']
+    # Check header is at top and spans full width
+    page_width = await frame.evaluate('() => window.innerWidth')
+    assert header_box['y'] == 0
+    assert header_box['width'] == page_width
+    # Resize to tablet size and assert sidebar collapses and header adjusts
+    await frame.set_viewport_size({'width': 768, 'height': 1024})
+    await wait_until_ready(frame, replaced_ms=1000)
+    collapsed_sidebar = frame.locator('aside.collapsed, aside[aria-expanded="false"]')
+    assert await collapsed_sidebar.count() > 0
+    # Assert header adjusts for tablet usability (e.g., smaller height or different layout)
+    tablet_header_height = await header.evaluate('el => el.offsetHeight')
+    assert tablet_header_height < header_box['height']
+    # Simulate mobile device viewport and assert sidebar accessible via header menu
+    await frame.set_viewport_size({'width': 375, 'height': 667})
+    await wait_until_ready(frame, replaced_ms=1000)
+    mobile_menu_button = frame.locator('header button[aria-label="Open sidebar menu"]')
+    assert await mobile_menu_button.is_visible()
+    # Verify no horizontal scrolling on mobile
+    scroll_width = await frame.evaluate('() => document.documentElement.scrollWidth')
+    client_width = await frame.evaluate('() => document.documentElement.clientWidth')
+    assert scroll_width <= client_width
+    await settle(page)
 
-        # Assert that sidebar, header, and main content panels are visible and have no overlap or cutoff on desktop
-        sidebar = frame.locator('aside')
-        header = frame.locator('header')
-        main_content = frame.locator('main')
-        assert await sidebar.is_visible()
-        assert await header.is_visible()
-        assert await main_content.is_visible()
-        sidebar_box = await sidebar.bounding_box()
-        header_box = await header.bounding_box()
-        main_box = await main_content.bounding_box()
-        assert sidebar_box is not None and header_box is not None and main_box is not None
-        # Check no horizontal overlap: sidebar right edge <= main content left edge
-        assert sidebar_box['x'] + sidebar_box['width'] <= main_box['x']
-        # Check header is at top and spans full width
-        page_width = await frame.evaluate('() => window.innerWidth')
-        assert header_box['y'] == 0
-        assert header_box['width'] == page_width
-        # Resize to tablet size and assert sidebar collapses and header adjusts
-        await frame.set_viewport_size({'width': 768, 'height': 1024})
-        await frame.wait_for_timeout(1000)
-        collapsed_sidebar = frame.locator('aside.collapsed, aside[aria-expanded="false"]')
-        assert await collapsed_sidebar.count() > 0
-        # Assert header adjusts for tablet usability (e.g., smaller height or different layout)
-        tablet_header_height = await header.evaluate('el => el.offsetHeight')
-        assert tablet_header_height < header_box['height']
-        # Simulate mobile device viewport and assert sidebar accessible via header menu
-        await frame.set_viewport_size({'width': 375, 'height': 667})
-        await frame.wait_for_timeout(1000)
-        mobile_menu_button = frame.locator('header button[aria-label="Open sidebar menu"]')
-        assert await mobile_menu_button.is_visible()
-        # Verify no horizontal scrolling on mobile
-        scroll_width = await frame.evaluate('() => document.documentElement.scrollWidth')
-        client_width = await frame.evaluate('() => document.documentElement.clientWidth')
-        assert scroll_width <= client_width
-        await asyncio.sleep(5)
-    
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+if __name__ == "__main__":
+    asyncio.run(run_standalone(run_test))
@@ -1,119 +1,89 @@
 import asyncio
 from playwright import async_api
+from harness import BASE_URL, run_standalone, ready_click, settle
 
-async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
+async def run_test(context):
+    # Open a new page in the browser context
+    page = await context.new_page()
+
+    # Navigate to your target URL and wait until the network request is committed
+    await page.goto(BASE_URL, wait_until="commit", timeout=10000)
+
+    # Wait for the main page to reach DOMContentLoaded state (optional for stability)
     try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
+        await page.wait_for_load_state("domcontentloaded", timeout=3000)
+    except async_api.Error:
+        pass
+
+    # Iterate through all iframes and wait for them to load as well
+    for frame in page.frames:
         try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
+            await frame.wait_for_load_state("domcontentloaded", timeout=3000)
         except async_api.Error:
             pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
-        
-        # Interact with the page elements to simulate user flow
-        # Scroll down to locate the charts section on the dashboard
-        await page.mouse.wheel(0, window.innerHeight)
-        
-
-        # Scroll down to reveal the bar chart for traffic sources
-        await page.mouse.wheel(0, window.innerHeight)
-        
-
-        # Hover over data points on line chart, bar chart, and donut chart to check interactive tooltips
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div[2]/div/main/div/div[3]/div/div/div/div[2]/div/div/div').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div[2]/div/main/div/div[3]/div/div[2]/div/div[2]/div/div/div').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Scroll down to locate the bar chart for traffic sources and validate its rendering and labels
-        await page.mouse.wheel(0, window.innerHeight)
-        
-
-        # Hover over the bar chart area and donut chart segments to check if tooltips display accurate data
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div[2]/div/main/div/div[3]/div[2]/div/div[2]/div/div/div').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div[2]/aside').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Click on the 'Analytics' menu item to navigate to the dashboard charts section where charts are expected to be displayed
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div[2]/aside/nav/ul/li[3]/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Scroll down to reveal the charts section on the Analytics dashboard
-        await page.mouse.wheel(0, window.innerHeight)
-        
-
-        # Scroll down to bring donut and bar charts fully into view for validation of rendering, legends, and tooltips
-        await page.mouse.wheel(0, window.innerHeight)
-        
-
-        # Hover over the donut chart segments and bar chart area to check if tooltips display accurate and well-formatted data
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div[2]/div/main/div/div[3]/div/div[2]/div/div[2]/div/div/div').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div[2]/div/main/div/div[3]/div/div[2]/div/div[2]/div/div/div').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        assert False, 'Test plan execution failed: generic failure assertion as expected result is unknown'
-        await asyncio.sleep(5)
-    
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+
+    # Interact with the page elements to simulate user flow
+    # Scroll down to locate the charts section on the dashboard
+    await page.mouse.wheel(0, window.innerHeight)
+
+
+    # Scroll down to reveal the bar chart for traffic sources
+    await page.mouse.wheel(0, window.innerHeight)
+
+
+    # Hover over data points on line chart, bar chart, and donut chart to check interactive tooltips
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div[2]/div/main/div/div[3]/div/div/div/div[2]/div/div/div').nth(0)
+    await ready_click(page, elem)
+
+
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div[2]/div/main/div/div[3]/div/div[2]/div/div[2]/div/div/div').nth(0)
+    await ready_click(page, elem)
+
+
+    # Scroll down to locate the bar chart for traffic sources and validate its rendering and labels
+    await page.mouse.wheel(0, window.innerHeight)
+
+
+    # Hover over the bar chart area and donut chart segments to check if tooltips display accurate data
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div[2]/div/main/div/div[3]/div[2]/div/div[2]/div/div/div').nth(0)
+    await ready_click(page, elem)
+
+
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div[2]/aside').nth(0)
+    await ready_click(page, elem)
+
+
+    # Click on the 'Analytics' menu item to navigate to the dashboard charts section where charts are expected to be displayed
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div[2]/aside/nav/ul/li[3]/a').nth(0)
+    await ready_click(page, elem)
+
+
+    # Scroll down to reveal the charts section on the Analytics dashboard
+    await page.mouse.wheel(0, window.innerHeight)
+
+
+    # Scroll down to bring donut and bar charts fully into view for validation of rendering, legends, and tooltips
+    await page.mouse.wheel(0, window.innerHeight)
+
+
+    # Hover over the donut chart segments and bar chart area to check if tooltips display accurate and well-formatted data
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div[2]/div/main/div/div[3]/div/div[2]/div/div[2]/div/div/div').nth(0)
+    await ready_click(page, elem)
+
+
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div[2]/div/main/div/div[3]/div/div[2]/div/div[2]/div/div/div').nth(0)
+    await ready_click(page, elem)
+
+
+    assert False, 'Test plan execution failed: generic failure assertion as expected result is unknown'
+    await settle(page)
+
+if __name__ == "__main__":
+    asyncio.run(run_standalone(run_test))
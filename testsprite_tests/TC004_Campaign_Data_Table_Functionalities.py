@@ -1,90 +1,60 @@
 import asyncio
 from playwright import async_api
+from harness import BASE_URL, run_standalone, ready_click, ready_fill, settle
 
-async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
+async def run_test(context):
+    # Open a new page in the browser context
+    page = await context.new_page()
+
+    # Navigate to your target URL and wait until the network request is committed
+    await page.goto(BASE_URL, wait_until="commit", timeout=10000)
+
+    # Wait for the main page to reach DOMContentLoaded state (optional for stability)
     try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
+        await page.wait_for_load_state("domcontentloaded", timeout=3000)
+    except async_api.Error:
+        pass
+
+    # Iterate through all iframes and wait for them to load as well
+    for frame in page.frames:
         try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
+            await frame.wait_for_load_state("domcontentloaded", timeout=3000)
         except async_api.Error:
             pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
-        
-        # Interact with the page elements to simulate user flow
-        # Click on the 'Campaigns' menu item to open the campaign data table section.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div[2]/aside/nav/ul/li[2]/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Sort the table by the 'Campaign Name' column in ascending order.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div[2]/div/main/div/div[3]/div/div[2]/table/thead/tr/th').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Sort the table by 'Campaign Name' column in descending order to verify sorting toggle.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div[2]/div/main/div/div[3]/div/div[2]/table/thead/tr/th').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Enter a search term in the campaign search input to filter the table rows and verify the results.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div[2]/div/main/div/div[2]/div/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Summer')
-        
-
-        # Test sorting by another column, e.g., 'Clicks', to verify sorting functionality on performance metrics.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div[2]/div/main/div/div[3]/div/div[2]/table/thead/tr/th[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        assert False, 'Test plan execution failed: generic failure assertion.'
-        await asyncio.sleep(5)
-    
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+
+    # Interact with the page elements to simulate user flow
+    # Click on the 'Campaigns' menu item to open the campaign data table section.
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div[2]/aside/nav/ul/li[2]/a').nth(0)
+    await ready_click(page, elem)
+
+
+    # Sort the table by the 'Campaign Name' column in ascending order.
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div[2]/div/main/div/div[3]/div/div[2]/table/thead/tr/th').nth(0)
+    await ready_click(page, elem)
+
+
+    # Sort the table by 'Campaign Name' column in descending order to verify sorting toggle.
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div[2]/div/main/div/div[3]/div/div[2]/table/thead/tr/th').nth(0)
+    await ready_click(page, elem)
+
+
+    # Enter a search term in the campaign search input to filter the table rows and verify the results.
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div[2]/div/main/div/div[2]/div/div/div/input').nth(0)
+    await ready_fill(page, elem, 'Summer')
+
+
+    # Test sorting by another column, e.g., 'Clicks', to verify sorting functionality on performance metrics.
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div[2]/div/main/div/div[3]/div/div[2]/table/thead/tr/th[2]').nth(0)
+    await ready_click(page, elem)
+
+
+    assert False, 'Test plan execution failed: generic failure assertion.'
+    await settle(page)
+
+if __name__ == "__main__":
+    asyncio.run(run_standalone(run_test))
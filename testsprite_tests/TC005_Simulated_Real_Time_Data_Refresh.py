@@ -1,106 +1,76 @@
 import asyncio
 from playwright import async_api
+from harness import BASE_URL, run_standalone, ready_click, settle
 
-async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
+async def run_test(context):
+    # Open a new page in the browser context
+    page = await context.new_page()
+
+    # Navigate to your target URL and wait until the network request is committed
+    await page.goto(BASE_URL, wait_until="commit", timeout=10000)
+
+    # Wait for the main page to reach DOMContentLoaded state (optional for stability)
     try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
+        await page.wait_for_load_state("domcontentloaded", timeout=3000)
+    except async_api.Error:
+        pass
+
+    # Iterate through all iframes and wait for them to load as well
+    for frame in page.frames:
         try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
+            await frame.wait_for_load_state("domcontentloaded", timeout=3000)
         except async_api.Error:
             pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
-        
-        # Interact with the page elements to simulate user flow
-        # Trigger the data refresh action on the dashboard by clicking the refresh button
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div[2]/div/main/div/div/div/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
 
-        # Assert metric cards update their displayed values and trend icons accordingly
-        metric_cards = frame.locator('.metric-card')
-        assert await metric_cards.count() > 0, 'No metric cards found on dashboard'
-        for i in range(await metric_cards.count()):
-            card_text = await metric_cards.nth(i).inner_text()
-            assert card_text.strip() != '', f'Metric card {i} is empty'
-            # Optionally check for trend icons presence
-            trend_icon = metric_cards.nth(i).locator('.trend-icon')
-            assert await trend_icon.count() > 0, f'Trend icon missing in metric card {i}'
-        
+    # Interact with the page elements to simulate user flow
+    # Trigger the data refresh action on the dashboard by clicking the refresh button
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div[2]/div/main/div/div/div/div[2]/button').nth(0)
+    await ready_click(page, elem)
+
+
+    # Assert metric cards update their displayed values and trend icons accordingly
+    metric_cards = frame.locator('.metric-card')
+    assert await metric_cards.count() > 0, 'No metric cards found on dashboard'
+    for i in range(await metric_cards.count()):
+        card_text = await metric_cards.nth(i).inner_text()
+        assert card_text.strip() != '', f'Metric card {i} is empty'
+        # Optionally check for trend icons presence
+        trend_icon = metric_cards.nth(i).locator('.trend-icon')
+        assert await trend_icon.count() > 0, f'Trend icon missing in metric card {i}'
+
 # Validate charts redraw with updated data smoothly and maintain interactive elements functionality
-        charts = frame.locator('.chart-container')
-        assert await charts.count() > 0, 'No charts found on dashboard'
-        for i in range(await charts.count()):
-            chart = charts.nth(i)
-            # Check chart is visible
-            assert await chart.is_visible(), f'Chart {i} is not visible'
-            # Check chart has svg or canvas element for redraw
-            svg_or_canvas = chart.locator('svg, canvas')
-            assert await svg_or_canvas.count() > 0, f'Chart {i} missing svg or canvas element'
-            # Optionally check interactive elements like tooltips or legends
-            tooltip = chart.locator('.tooltip')
-            # Tooltip may or may not be visible initially, so just check presence
-            assert await tooltip.count() >= 0
-            legend = chart.locator('.legend')
-            assert await legend.count() >= 0
-        
+    charts = frame.locator('.chart-container')
+    assert await charts.count() > 0, 'No charts found on dashboard'
+    for i in range(await charts.count()):
+        chart = charts.nth(i)
+        # Check chart is visible
+        assert await chart.is_visible(), f'Chart {i} is not visible'
+        # Check chart has svg or canvas element for redraw
+        svg_or_canvas = chart.locator('svg, canvas')
+        assert await svg_or_canvas.count() > 0, f'Chart {i} missing svg or canvas element'
+        # Optionally check interactive elements like tooltips or legends
+        tooltip = chart.locator('.tooltip')
+        # Tooltip may or may not be visible initially, so just check presence
+        assert await tooltip.count() >= 0
+        legend = chart.locator('.legend')
+        assert await legend.count() >= 0
+
 # Ensure the campaign data table reflects any new or updated campaign entries post-refresh
-        campaign_table = frame.locator('table.campaign-data')
-        assert await campaign_table.count() == 1, 'Campaign data table not found'
-        rows = campaign_table.locator('tbody tr')
-        assert await rows.count() > 0, 'No campaign entries found in table'
-        
+    campaign_table = frame.locator('table.campaign-data')
+    assert await campaign_table.count() == 1, 'Campaign data table not found'
+    rows = campaign_table.locator('tbody tr')
+    assert await rows.count() > 0, 'No campaign entries found in table'
+
 # Check for a visible loading or refresh indicator during data update
-        loading_indicator = frame.locator('.loading-indicator, .refresh-spinner')
-        assert await loading_indicator.is_visible(), 'Loading or refresh indicator not visible during data update'
-        
+    loading_indicator = frame.locator('.loading-indicator, .refresh-spinner')
+    assert await loading_indicator.is_visible(), 'Loading or refresh indicator not visible during data update'
+
 # Verify the refresh completes within acceptable timeframe (under 3 seconds)
-        # Assuming the refresh action was triggered before this assertion block
-        # We can measure time before and after refresh if needed, here we check for disappearance of loading indicator
-        await frame.wait_for_selector('.loading-indicator, .refresh-spinner', state='hidden', timeout=3000)
-        await asyncio.sleep(5)
-    
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+    # Assuming the refresh action was triggered before this assertion block
+    # We can measure time before and after refresh if needed, here we check for disappearance of loading indicator
+    await frame.wait_for_selector('.loading-indicator, .refresh-spinner', state='hidden', timeout=3000)
+    await settle(page)
+
+if __name__ == "__main__":
+    asyncio.run(run_standalone(run_test))
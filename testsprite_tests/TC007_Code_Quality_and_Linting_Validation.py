@@ -1,76 +1,46 @@
 import asyncio
 from playwright import async_api
+from harness import BASE_URL, run_standalone, ready_click, settle
 
-async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
+async def run_test(context):
+    # Open a new page in the browser context
+    page = await context.new_page()
+
+    # Navigate to your target URL and wait until the network request is committed
+    await page.goto(BASE_URL, wait_until="commit", timeout=10000)
+
+    # Wait for the main page to reach DOMContentLoaded state (optional for stability)
     try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
+        await page.wait_for_load_state("domcontentloaded", timeout=3000)
+    except async_api.Error:
+        pass
+
+    # Iterate through all iframes and wait for them to load as well
+    for frame in page.frames:
         try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
+            await frame.wait_for_load_state("domcontentloaded", timeout=3000)
         except async_api.Error:
             pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
-        
-        # Interact with the page elements to simulate user flow
-        # Run ESLint across the full codebase
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div[2]/aside/nav/ul/li[5]/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
 
-        # Run ESLint across the full codebase
-        await page.goto('http://localhost:3000/api/run-eslint', timeout=10000)
-        
+    # Interact with the page elements to simulate user flow
+    # Run ESLint across the full codebase
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div[2]/aside/nav/ul/li[5]/a').nth(0)
+    await ready_click(page, elem)
+
+
+    # Run ESLint across the full codebase
+    await page.goto(f'{BASE_URL}/api/run-eslint', timeout=10000)
+
+
+    # Open terminal or command interface to run ESLint command directly
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div[2]/div/header/div[3]/div/button').nth(0)
+    await ready_click(page, elem)
+
 
-        # Open terminal or command interface to run ESLint command directly
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div[2]/div/header/div[3]/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+    assert False, 'Test plan execution failed: Expected result unknown, forcing failure.'
+    await settle(page)
 
-        assert False, 'Test plan execution failed: Expected result unknown, forcing failure.'
-        await asyncio.sleep(5)
-    
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+if __name__ == "__main__":
+    asyncio.run(run_standalone(run_test))
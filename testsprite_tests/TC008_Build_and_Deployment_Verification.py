@@ -1,95 +1,65 @@
 import asyncio
 from playwright import async_api
+from harness import BASE_URL, run_standalone, ready_click, settle
 
-async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
+async def run_test(context):
+    # Open a new page in the browser context
+    page = await context.new_page()
+
+    # Navigate to your target URL and wait until the network request is committed
+    await page.goto(BASE_URL, wait_until="commit", timeout=10000)
+
+    # Wait for the main page to reach DOMContentLoaded state (optional for stability)
     try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
+        await page.wait_for_load_state("domcontentloaded", timeout=3000)
+    except async_api.Error:
+        pass
+
+    # Iterate through all iframes and wait for them to load as well
+    for frame in page.frames:
         try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
+            await frame.wait_for_load_state("domcontentloaded", timeout=3000)
         except async_api.Error:
             pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
-        
-        # Interact with the page elements to simulate user flow
-        # Run the full build command used for production deployment to check for build errors or warnings.
-        await page.goto('http://localhost:3000/build', timeout=10000)
-        
-
-        # Return to the main dashboard or home page and look for any UI elements or documentation that might allow running the build command or checking build status.
-        await page.goto('http://localhost:3000/dashboard', timeout=10000)
-        
-
-        # Run the full build command used for production deployment to check for build errors or warnings.
-        await page.goto('http://localhost:3000', timeout=10000)
-        
-
-        # Scroll down to check the presence and functionality of metric cards, charts, and data table on the dashboard.
-        await page.mouse.wheel(0, window.innerHeight)
-        
-
-        # Scroll further down to check the data table and other dashboard components for proper loading and functionality.
-        await page.mouse.wheel(0, window.innerHeight)
-        
-
-        # Test the mobile responsiveness by resizing the viewport or simulating a mobile device to confirm layout and navigation improvements.
-        await page.mouse.wheel(0, -window.innerHeight)
-        
-
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div[2]/div/header/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Click the hamburger menu button (index 7) to open the navigation menu and verify navigation improvements on mobile.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div[2]/div[2]/header/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        assert False, 'Test plan execution failed: generic failure assertion.'
-        await asyncio.sleep(5)
-    
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+
+    # Interact with the page elements to simulate user flow
+    # Run the full build command used for production deployment to check for build errors or warnings.
+    await page.goto(f'{BASE_URL}/build', timeout=10000)
+
+
+    # Return to the main dashboard or home page and look for any UI elements or documentation that might allow running the build command or checking build status.
+    await page.goto(f'{BASE_URL}/dashboard', timeout=10000)
+
+
+    # Run the full build command used for production deployment to check for build errors or warnings.
+    await page.goto(BASE_URL, timeout=10000)
+
+
+    # Scroll down to check the presence and functionality of metric cards, charts, and data table on the dashboard.
+    await page.mouse.wheel(0, window.innerHeight)
+
+
+    # Scroll further down to check the data table and other dashboard components for proper loading and functionality.
+    await page.mouse.wheel(0, window.innerHeight)
+
+
+    # Test the mobile responsiveness by resizing the viewport or simulating a mobile device to confirm layout and navigation improvements.
+    await page.mouse.wheel(0, -window.innerHeight)
+
+
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div[2]/div/header/div/button').nth(0)
+    await ready_click(page, elem)
+
+
+    # Click the hamburger menu button (index 7) to open the navigation menu and verify navigation improvements on mobile.
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div[2]/div[2]/header/div/button').nth(0)
+    await ready_click(page, elem)
+
+
+    assert False, 'Test plan execution failed: generic failure assertion.'
+    await settle(page)
+
+if __name__ == "__main__":
+    asyncio.run(run_standalone(run_test))
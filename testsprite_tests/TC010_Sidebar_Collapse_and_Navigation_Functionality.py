@@ -1,174 +1,144 @@
 import asyncio
 from playwright import async_api
+from harness import BASE_URL, run_standalone, ready_click, settle, wait_until_ready
 
-async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
+async def run_test(context):
+    # Open a new page in the browser context
+    page = await context.new_page()
+
+    # Navigate to your target URL and wait until the network request is committed
+    await page.goto(BASE_URL, wait_until="commit", timeout=10000)
+
+    # Wait for the main page to reach DOMContentLoaded state (optional for stability)
     try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
+        await page.wait_for_load_state("domcontentloaded", timeout=3000)
+    except async_api.Error:
+        pass
+
+    # Iterate through all iframes and wait for them to load as well
+    for frame in page.frames:
         try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
+            await frame.wait_for_load_state("domcontentloaded", timeout=3000)
         except async_api.Error:
             pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
-        
-        # Interact with the page elements to simulate user flow
-        # Click sidebar toggle button to collapse the sidebar
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div[2]/aside/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Click on each navigation item in the sidebar to verify main content updates
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div[2]/aside/nav/ul/li/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Click on another navigation item to verify if navigation links are consistently not updating main content
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div[2]/aside/nav/ul/li[2]/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Click on 'Analytics' navigation item to verify main content update
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div[2]/aside/nav/ul/li[3]/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Click on 'Reports' navigation item to verify main content update
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div[2]/aside/nav/ul/li[4]/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Click on 'Settings' navigation item to verify main content update
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div[2]/aside/nav/ul/li[5]/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Click sidebar toggle button to collapse the sidebar in mobile viewport
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div[2]/aside/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div[2]/div/header/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Click on 'Dashboard' navigation item to verify main content update on mobile viewport
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div[2]/aside/nav/ul/li/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Click on 'Campaigns' navigation item to verify main content update on mobile viewport
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div[2]/aside/nav/ul/li[2]/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Click on 'Analytics' navigation item to verify main content update on mobile viewport
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div[2]/aside/nav/ul/li[3]/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Click on 'Reports' navigation item to verify main content update on mobile viewport
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div[2]/aside/nav/ul/li[4]/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Click sidebar toggle button to collapse the sidebar on Reports page
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div[2]/aside/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Click sidebar toggle button to expand the sidebar on Reports page
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div[2]/aside/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Assert sidebar collapses visually by checking a CSS class or style change indicating collapse
-        sidebar = frame.locator('xpath=html/body/div[2]/aside')
-        collapsed_class = await sidebar.get_attribute('class')
-        assert 'collapsed' in collapsed_class or 'collapsed' in await sidebar.get_attribute('class'), 'Sidebar did not collapse as expected after toggle click'
-        # Click toggle again to expand sidebar and assert expansion
-        toggle_button = frame.locator('xpath=html/body/div[2]/aside/div/button').nth(0)
-        await toggle_button.click()
-        expanded_class = await sidebar.get_attribute('class')
-        assert 'collapsed' not in expanded_class, 'Sidebar did not expand as expected after toggle click'
-        # Define expected sections for navigation
-        expected_sections = ['Dashboard', 'Campaigns', 'Analytics', 'Reports', 'Settings']
-        # Verify main content updates to selected dashboard section after clicking each nav item
-        for i, section in enumerate(expected_sections):
-            nav_item = frame.locator(f'xpath=html/body/div[2]/aside/nav/ul/li[{i+1}]/a').nth(0)
-            await nav_item.click()
-            await page.wait_for_timeout(1000)
-            # Check if the main content section matches the clicked navigation item
-            main_section_text = await frame.locator('xpath=html/body/div[2]/main/h1').text_content()
-            assert section in main_section_text, f'Main content did not update to {section} section after navigation click'
-        # Simulate mobile viewport navigation and assert functionality
-        await page.set_viewport_size({'width': 375, 'height': 667})  # iPhone 6/7/8 size
-        # Open sidebar if collapsed in mobile
-        mobile_toggle = frame.locator('xpath=html/body/div[2]/div/header/div/button').nth(0)
-        await mobile_toggle.click()
-        for i, section in enumerate(expected_sections):
-            nav_item = frame.locator(f'xpath=html/body/div[2]/aside/nav/ul/li[{i+1}]/a').nth(0)
-            await nav_item.click()
-            await page.wait_for_timeout(1000)
-            main_section_text = await frame.locator('xpath=html/body/div[2]/main/h1').text_content()
-            assert section in main_section_text, f'Main content did not update to {section} section on mobile after navigation click'
-        # Reset viewport to desktop size
-        await page.set_viewport_size({'width': 1280, 'height': 720})
-        await asyncio.sleep(5)
-    
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+
+    # Interact with the page elements to simulate user flow
+    # Click sidebar toggle button to collapse the sidebar
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div[2]/aside/div/button').nth(0)
+    await ready_click(page, elem)
+
+
+    # Click on each navigation item in the sidebar to verify main content updates
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div[2]/aside/nav/ul/li/a').nth(0)
+    await ready_click(page, elem)
+
+
+    # Click on another navigation item to verify if navigation links are consistently not updating main content
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div[2]/aside/nav/ul/li[2]/a').nth(0)
+    await ready_click(page, elem)
+
+
+    # Click on 'Analytics' navigation item to verify main content update
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div[2]/aside/nav/ul/li[3]/a').nth(0)
+    await ready_click(page, elem)
+
+
+    # Click on 'Reports' navigation item to verify main content update
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div[2]/aside/nav/ul/li[4]/a').nth(0)
+    await ready_click(page, elem)
+
+
+    # Click on 'Settings' navigation item to verify main content update
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div[2]/aside/nav/ul/li[5]/a').nth(0)
+    await ready_click(page, elem)
+
+
+    # Click sidebar toggle button to collapse the sidebar in mobile viewport
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div[2]/aside/div/button').nth(0)
+    await ready_click(page, elem)
+
+
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div[2]/div/header/div/button').nth(0)
+    await ready_click(page, elem)
+
+
+    # Click on 'Dashboard' navigation item to verify main content update on mobile viewport
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div[2]/aside/nav/ul/li/a').nth(0)
+    await ready_click(page, elem)
+
+
+    # Click on 'Campaigns' navigation item to verify main content update on mobile viewport
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div[2]/aside/nav/ul/li[2]/a').nth(0)
+    await ready_click(page, elem)
+
+
+    # Click on 'Analytics' navigation item to verify main content update on mobile viewport
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div[2]/aside/nav/ul/li[3]/a').nth(0)
+    await ready_click(page, elem)
+
+
+    # Click on 'Reports' navigation item to verify main content update on mobile viewport
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div[2]/aside/nav/ul/li[4]/a').nth(0)
+    await ready_click(page, elem)
+
+
+    # Click sidebar toggle button to collapse the sidebar on Reports page
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div[2]/aside/div/button').nth(0)
+    await ready_click(page, elem)
+
+
+    # Click sidebar toggle button to expand the sidebar on Reports page
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div[2]/aside/div/button').nth(0)
+    await ready_click(page, elem)
+
+
+    # Assert sidebar collapses visually by checking a CSS class or style change indicating collapse
+    sidebar = frame.locator('xpath=html/body/div[2]/aside')
+    collapsed_class = await sidebar.get_attribute('class')
+    assert 'collapsed' in collapsed_class or 'collapsed' in await sidebar.get_attribute('class'), 'Sidebar did not collapse as expected after toggle click'
+    # Click toggle again to expand sidebar and assert expansion
+    toggle_button = frame.locator('xpath=html/body/div[2]/aside/div/button').nth(0)
+    await toggle_button.click()
+    expanded_class = await sidebar.get_attribute('class')
+    assert 'collapsed' not in expanded_class, 'Sidebar did not expand as expected after toggle click'
+    # Define expected sections for navigation
+    expected_sections = ['Dashboard', 'Campaigns', 'Analytics', 'Reports', 'Settings']
+    # Verify main content updates to selected dashboard section after clicking each nav item
+    for i, section in enumerate(expected_sections):
+        nav_item = frame.locator(f'xpath=html/body/div[2]/aside/nav/ul/li[{i+1}]/a').nth(0)
+        await nav_item.click()
+        await wait_until_ready(page, replaced_ms=1000)
+        # Check if the main content section matches the clicked navigation item
+        main_section_text = await frame.locator('xpath=html/body/div[2]/main/h1').text_content()
+        assert section in main_section_text, f'Main content did not update to {section} section after navigation click'
+    # Simulate mobile viewport navigation and assert functionality
+    await page.set_viewport_size({'width': 375, 'height': 667})  # iPhone 6/7/8 size
+    # Open sidebar if collapsed in mobile
+    mobile_toggle = frame.locator('xpath=html/body/div[2]/div/header/div/button').nth(0)
+    await mobile_toggle.click()
+    for i, section in enumerate(expected_sections):
+        nav_item = frame.locator(f'xpath=html/body/div[2]/aside/nav/ul/li[{i+1}]/a').nth(0)
+        await nav_item.click()
+        await wait_until_ready(page, replaced_ms=1000)
+        main_section_text = await frame.locator('xpath=html/body/div[2]/main/h1').text_content()
+        assert section in main_section_text, f'Main content did not update to {section} section on mobile after navigation click'
+    # Reset viewport to desktop size
+    await page.set_viewport_size({'width': 1280, 'height': 720})
+    await settle(page)
+
+if __name__ == "__main__":
+    asyncio.run(run_standalone(run_test))
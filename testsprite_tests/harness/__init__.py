@@ -0,0 +1,24 @@
+"""
+Shared harness for the TestSprite Playwright suite.
+
+Run the whole suite on one shared browser with ``python -m harness`` from the
+``testsprite_tests`` directory, or a single TC file directly with
+``python TC001_Dashboard_Layout_Responsiveness.py``.
+"""
+
+from .config import BASE_URL
+from .readiness import ready_click, ready_fill, settle, wait_until_ready
+from .runner import discover, run_standalone, run_suite
+from .results import TestResult
+
+__all__ = [
+    "BASE_URL",
+    "TestResult",
+    "discover",
+    "ready_click",
+    "ready_fill",
+    "run_standalone",
+    "run_suite",
+    "settle",
+    "wait_until_ready",
+]
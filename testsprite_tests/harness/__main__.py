@@ -0,0 +1,7 @@
+import sys
+
+from .runner import main
+
+# Guarded so --shards worker processes can re-import this module safely
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,125 @@
+"""
+Refresh-cycle latency benchmark.
+
+Clicks the dashboard Refresh button repeatedly and reads the User Timing
+measures emitted by ``src/lib/perf.ts``:
+
+* ``refresh:fetch``  click -> ``fetchDashboardData()`` resolved
+* ``refresh:commit`` fetch resolved -> React commit of the new data
+* ``refresh:paint``  commit -> next painted frame
+* ``refresh:total``  click -> painted
+
+Usage::
+
+    python -m harness.bench_refresh --cycles 300 --bucket-ms 10
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+from playwright import async_api
+
+from .config import BASE_URL, LAUNCH_ARGS, TESTS_DIR
+from .readiness import wait_until_ready
+from .results import utc_timestamp
+from .runner import new_test_context
+from .server import next_start
+from .stats import histogram, summarize
+
+PHASES = ["refresh:fetch", "refresh:commit", "refresh:paint", "refresh:total"]
+REFRESH_BUTTON = 'button[aria-label="Refresh dashboard data"]'
+OUTPUT_PATH = TESTS_DIR / "tmp" / "refresh_bench.json"
+
+CYCLE_DONE_SCRIPT = "(n) => performance.getEntriesByName('refresh:total', 'measure').length > n"
+COLLECT_SCRIPT = """(phases) => Object.fromEntries(phases.map((name) => [
+  name, performance.getEntriesByName(name, 'measure').map((entry) => entry.duration),
+]))"""
+
+
+async def run_cycles(page: async_api.Page, cycles: int, cycle_timeout_ms: float) -> Dict[str, List[float]]:
+    """Drive ``cycles`` refreshes and return per-phase durations (ms)."""
+    button = page.locator(REFRESH_BUTTON)
+    for completed in range(cycles):
+        await button.click()
+        await page.wait_for_function(CYCLE_DONE_SCRIPT, arg=completed, timeout=cycle_timeout_ms)
+    return await page.evaluate(COLLECT_SCRIPT, PHASES)
+
+
+async def benchmark(base_url: str, cycles: int, warmup: int, cycle_timeout_ms: float) -> Dict[str, List[float]]:
+    async with async_api.async_playwright() as pw:
+        browser = await pw.chromium.launch(headless=True, args=LAUNCH_ARGS)
+        try:
+            context = await new_test_context(browser)
+            page = await context.new_page()
+            await page.goto(f"{base_url}/dashboard")
+            await wait_until_ready(page)
+            if warmup:
+                await run_cycles(page, warmup, cycle_timeout_ms)
+                await page.evaluate("() => performance.clearMeasures()")
+            return await run_cycles(page, cycles, cycle_timeout_ms)
+        finally:
+            await browser.close()
+
+
+def build_report(base_url: str, samples: Dict[str, List[float]], bucket_ms: float) -> dict:
+    return {
+        "generated_at": utc_timestamp(),
+        "base_url": base_url,
+        "cycles": len(samples.get("refresh:total", [])),
+        "phases": {
+            name: {**summarize(values), "histogram": histogram(values, bucket_ms)}
+            for name, values in samples.items()
+        },
+    }
+
+
+def print_report(report: dict) -> None:
+    print(f"{report['cycles']} refresh cycles")
+    for name, data in report["phases"].items():
+        print(f"  {name:<15} p50 {data['p50']:8.1f}ms  p95 {data['p95']:8.1f}ms  max {data['max']:8.1f}ms")
+    total = report["phases"].get("refresh:total")
+    if total and total["histogram"]:
+        peak = max(bucket["count"] for bucket in total["histogram"])
+        for bucket in total["histogram"]:
+            bar = "#" * max(1, round(40 * bucket["count"] / peak))
+            print(f"  {bucket['lower']:7.0f}-{bucket['upper']:<7.0f} {bar} {bucket['count']}")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m harness.bench_refresh", description="Dashboard refresh latency benchmark.")
+    parser.add_argument("--cycles", "-n", type=int, default=200)
+    parser.add_argument("--warmup", type=int, default=5, help="cycles discarded before measuring")
+    parser.add_argument("--bucket-ms", type=float, default=10.0, help="histogram bucket width")
+    parser.add_argument("--cycle-timeout", type=float, default=10000, help="max ms per refresh cycle")
+    parser.add_argument("--output", type=Path, default=OUTPUT_PATH)
+    parser.add_argument("--serve", action="store_true", help="start `next start` for the run (needs a build)")
+    parser.add_argument("--port", type=int, default=3000, help="port for --serve")
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+
+    def run(base_url: str) -> dict:
+        samples = asyncio.run(benchmark(base_url, args.cycles, args.warmup, args.cycle_timeout))
+        return build_report(base_url, samples, args.bucket_ms)
+
+    if args.serve:
+        with next_start(args.port) as base_url:
+            report = run(base_url)
+    else:
+        report = run(BASE_URL)
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    print_report(report)
+    print(f"Wrote {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,164 @@
+"""
+First Load JS budget for the production build.
+
+Reads the manifests ``next build`` leaves in ``.next``, adds up the gzipped
+size of every script a route needs before it becomes interactive (the "First
+Load JS" column of the build output) and checks it against
+``bundle_budget.json``. Routes can also list ``forbid`` markers, strings that
+must not appear in any of those scripts; ``recharts-wrapper`` keeps Recharts
+out of the initial load of every route now that charts are code-split::
+
+    npm run build && python -m harness.bundle
+    python -m harness.bundle /campaigns /settings
+
+``python -m harness --bundle-check`` runs the same check after the suite and
+fails the run on a violation.
+"""
+
+import argparse
+import gzip
+import json
+import sys
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+from .config import REPO_ROOT, TESTS_DIR
+from .results import utc_timestamp
+
+ROUTES = ["/dashboard", "/analytics", "/campaigns", "/reports", "/settings"]
+BUILD_DIR = REPO_ROOT / ".next"
+BUDGET_PATH = TESTS_DIR / "bundle_budget.json"
+OUTPUT_PATH = TESTS_DIR / "tmp" / "bundle_results.json"
+
+
+def has_build(build_dir: Path = BUILD_DIR) -> bool:
+    # BUILD_ID is only written by `next build`, not by the dev server
+    return (build_dir / "BUILD_ID").exists()
+
+
+def first_load_files(route: str, build_dir: Path = BUILD_DIR) -> List[str]:
+    """Scripts loaded up front for ``route``, relative to ``build_dir``."""
+    app_manifest = json.loads((build_dir / "app-build-manifest.json").read_text(encoding="utf-8"))
+    build_manifest = json.loads((build_dir / "build-manifest.json").read_text(encoding="utf-8"))
+    pages = app_manifest.get("pages", {})
+    entry = f"{route.rstrip('/')}/page"
+    if entry not in pages:
+        raise KeyError(f"{route} is not an app route in {build_dir}")
+
+    files = [*build_manifest.get("rootMainFiles", []), *pages.get("/layout", []), *pages[entry]]
+    # Keep manifest order, drop duplicates and stylesheets
+    return [name for name in dict.fromkeys(files) if name.endswith(".js")]
+
+
+@lru_cache(maxsize=None)
+def _read(path: Path) -> bytes:
+    return path.read_bytes()
+
+
+def gzipped_size(path: Path) -> int:
+    return len(gzip.compress(_read(path), compresslevel=9))
+
+
+def measure_route(route: str, forbid: Sequence[str] = (), build_dir: Path = BUILD_DIR) -> dict:
+    """First Load JS (gzipped KB) for ``route`` and the files carrying ``forbid`` markers."""
+    files = first_load_files(route, build_dir)
+    found: Dict[str, List[str]] = {}
+    for name in files:
+        source = _read(build_dir / name)
+        for marker in forbid:
+            if marker.encode() in source:
+                found.setdefault(marker, []).append(name)
+    return {
+        "first_load_js_kb": sum(gzipped_size(build_dir / name) for name in files) / 1024,
+        "files": files,
+        "forbidden": found,
+    }
+
+
+def load_budget(path: Path, routes: Sequence[str]) -> Dict[str, dict]:
+    """Per-route limits with ``defaults`` merged in; ``forbid`` lists are combined."""
+    raw = json.loads(path.read_text(encoding="utf-8"))
+    defaults = raw.get("defaults", {})
+    budgets = {}
+    for route in routes:
+        overrides = raw.get("routes", {}).get(route, {})
+        merged = {**defaults, **overrides}
+        merged["forbid"] = list(dict.fromkeys([*defaults.get("forbid", []), *overrides.get("forbid", [])]))
+        budgets[route] = merged
+    return budgets
+
+
+def check_budget(measured: dict, budget: dict) -> List[dict]:
+    violations = []
+    limit = budget.get("first_load_js_kb")
+    if limit is not None and measured["first_load_js_kb"] > limit:
+        violations.append({"metric": "first_load_js_kb", "actual": measured["first_load_js_kb"], "budget": limit})
+    for marker, files in measured["forbidden"].items():
+        violations.append({"metric": "forbid", "marker": marker, "files": files})
+    return violations
+
+
+def build_report(routes: Sequence[str], budget_path: Path = BUDGET_PATH, build_dir: Path = BUILD_DIR) -> dict:
+    budgets = load_budget(budget_path, routes)
+    results = {}
+    for route in routes:
+        measured = measure_route(route, budgets[route]["forbid"], build_dir)
+        results[route] = {**measured, "violations": check_budget(measured, budgets[route])}
+    return {
+        "generated_at": utc_timestamp(),
+        "build_dir": str(build_dir),
+        "routes": results,
+        "passed": not any(data["violations"] for data in results.values()),
+    }
+
+
+def print_report(report: dict) -> None:
+    for route, data in report["routes"].items():
+        print(f"{route:<12} First Load JS {data['first_load_js_kb']:7.1f}KB  "
+              f"{len(data['violations'])} budget violation(s)")
+        for violation in data["violations"]:
+            if violation["metric"] == "forbid":
+                print(f"    forbidden {violation['marker']!r} in {', '.join(violation['files'])}")
+            else:
+                print(f"    {violation['metric']} = {violation['actual']:.1f} (budget {violation['budget']})")
+
+
+def check_build(
+    routes: Sequence[str] = ROUTES,
+    budget_path: Path = BUDGET_PATH,
+    output: Path = OUTPUT_PATH,
+) -> Optional[bool]:
+    """Check the current build, write ``output`` and print a summary.
+
+    Returns None when there is no build to check.
+    """
+    if not has_build():
+        return None
+    report = build_report(routes, budget_path)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    print_report(report)
+    return report["passed"]
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m harness.bundle", description=__doc__.split("\n\n")[0])
+    parser.add_argument("routes", nargs="*", default=ROUTES, help="routes to check (default: all)")
+    parser.add_argument("--budget", type=Path, default=BUDGET_PATH)
+    parser.add_argument("--output", type=Path, default=OUTPUT_PATH)
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    passed = check_build(args.routes, args.budget, args.output)
+    if passed is None:
+        print(f"No production build in {BUILD_DIR}; run `npm run build` first.", file=sys.stderr)
+        return 2
+    print(f"Wrote {args.output}")
+    return 0 if passed else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,30 @@
+"""
+Shared configuration for the TestSprite Playwright harness.
+"""
+
+import os
+from pathlib import Path
+
+# Dashboard under test; override to point the suite at another server
+BASE_URL = os.environ.get("TESTSPRITE_BASE_URL", "http://localhost:3000").rstrip("/")
+
+TESTS_DIR = Path(__file__).resolve().parent.parent
+REPO_ROOT = TESTS_DIR.parent
+RESULTS_PATH = TESTS_DIR / "tmp" / "test_results.json"
+REPORT_MD_PATH = TESTS_DIR / "testsprite-mcp-test-report.md"
+REPORT_HTML_PATH = TESTS_DIR / "testsprite-mcp-test-report.html"
+
+# Chromium flags shared by every launch. `--single-process` is deliberately
+# absent: one browser now hosts many concurrent contexts.
+LAUNCH_ARGS = [
+    "--window-size=1280,720",         # Set the browser window size
+    "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
+    "--ipc=host",                     # Use host-level IPC for better stability
+]
+
+# Per-action timeout applied to every test context (ms)
+DEFAULT_TIMEOUT_MS = 5000
+
+# Run the app in its test mode (no simulated latency, seeded data); set
+# TESTSPRITE_TEST_MODE=0 to exercise the demo delays instead
+TEST_MODE = os.environ.get("TESTSPRITE_TEST_MODE", "1") != "0"
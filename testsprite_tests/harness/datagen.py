@@ -0,0 +1,221 @@
+"""
+Seeded synthetic data for load tests.
+
+Python mirror of ``src/lib/random.ts`` and the seeded paths of
+``src/lib/data.ts``: with the same seed and sizes the functions here return
+the same campaigns and series the dashboard renders, so tests can assert on
+exact values at production-like data sizes::
+
+    config = DataConfig(seed=42, campaigns=100_000)
+    await config.apply(context)              # or page.goto(config.url("/campaigns"))
+    expected = generate_campaigns(config)
+"""
+
+import json
+import math
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional
+from urllib.parse import urlencode
+
+from .config import BASE_URL
+
+MASK32 = 0xFFFFFFFF
+DAY_MS = 24 * 60 * 60 * 1000
+SEEDED_END_MS = int(datetime(2025, 1, 1, tzinfo=timezone.utc).timestamp() * 1000)
+STORAGE_KEY = "aidash:data-config"
+# Seed the app falls back to in test mode (``TEST_MODE_SEED`` in dataConfig.ts)
+TEST_MODE_SEED = 1
+
+# Merge settings into the stored config rather than replacing it, so later
+# init scripts and URL-persisted values survive each navigation
+MERGE_CONFIG_SCRIPT = """(([key, values, overwrite]) => {
+  let current = {};
+  try { current = JSON.parse(window.sessionStorage.getItem(key) || '{}'); } catch (e) { /* corrupt */ }
+  const merged = overwrite ? { ...current, ...values } : { ...values, ...current };
+  window.sessionStorage.setItem(key, JSON.stringify(merged));
+})(%s);"""
+
+CAMPAIGN_NAMES = [
+    "Summer Sale 2024",
+    "Brand Awareness Q4",
+    "Holiday Special",
+    "Product Launch",
+    "Retargeting Campaign",
+    "New Customer Acquisition",
+    "Seasonal Promotion",
+    "Social Media Boost",
+    "Email Newsletter",
+    "Influencer Partnership",
+    "Black Friday Sale",
+    "Cyber Monday Deals",
+    "Spring Collection",
+    "Back to School",
+    "Valentine's Day Special",
+    "Easter Promotion",
+    "Mother's Day Campaign",
+    "Father's Day Special",
+    "Independence Day Sale",
+    "Labor Day Weekend",
+    "Halloween Spooky Deals",
+    "Thanksgiving Special",
+    "Christmas Countdown",
+    "New Year Resolution",
+    "Winter Clearance",
+]
+STATUSES = ["active", "paused", "completed", "draft"]
+
+Rng = Callable[[], float]
+
+
+@dataclass
+class DataConfig:
+    """Generator settings, named after the app's URL query parameters."""
+
+    seed: int
+    campaigns: int = 25
+    days: int = 30
+    granularity: str = "daily"
+    sources: int = 6
+    end: Optional[str] = None
+
+    def query(self) -> str:
+        params = {
+            "seed": self.seed,
+            "campaigns": self.campaigns,
+            "days": self.days,
+            "granularity": self.granularity,
+            "sources": self.sources,
+        }
+        if self.end:
+            params["end"] = self.end
+        return urlencode(params)
+
+    def url(self, route: str = "/dashboard", base_url: str = BASE_URL) -> str:
+        """Route URL that switches the app into this configuration."""
+        return f"{base_url}{route}?{self.query()}"
+
+    def init_script(self) -> str:
+        """Script seeding sessionStorage the way ``setDataConfig`` does."""
+        stored = {
+            "seed": self.seed,
+            "campaignCount": self.campaigns,
+            "days": self.days,
+            "granularity": self.granularity,
+            "trafficSources": self.sources,
+        }
+        if self.end:
+            stored["endDate"] = self.end
+        return MERGE_CONFIG_SCRIPT % json.dumps([STORAGE_KEY, stored, True])
+
+    async def apply(self, context) -> None:
+        """Make every page opened in ``context`` use this configuration."""
+        await context.add_init_script(self.init_script())
+
+    def end_ms(self) -> int:
+        if not self.end:
+            return SEEDED_END_MS
+        # Date-only strings parse as UTC in JS; treat naive datetimes the same way
+        parsed = datetime.fromisoformat(self.end)
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        return int(parsed.timestamp() * 1000)
+
+
+def enable_test_mode_script() -> str:
+    """Script turning on the app's test mode unless the session chose otherwise."""
+    return MERGE_CONFIG_SCRIPT % json.dumps([STORAGE_KEY, {"testMode": True}, False])
+
+
+def _imul(a: int, b: int) -> int:
+    return (a * b) & MASK32
+
+
+def create_rng(seed: int) -> Rng:
+    """Mulberry32, bit-for-bit with ``createRng``."""
+    state = seed & MASK32
+
+    def rng() -> float:
+        nonlocal state
+        state = (state + 0x6D2B79F5) & MASK32
+        t = _imul(state ^ (state >> 15), 1 | state)
+        t = ((t + _imul(t ^ (t >> 7), 61 | t)) & MASK32) ^ t
+        return ((t ^ (t >> 14)) & MASK32) / 4294967296
+
+    return rng
+
+
+def hash_seed(seed: int, stream: str) -> int:
+    """FNV-1a stream seed, as ``hashSeed``."""
+    value = 2166136261 ^ (seed & MASK32)
+    for char in stream:
+        value = _imul(value ^ ord(char), 16777619)
+    return value
+
+
+def random_int(rng: Rng, low: int, span: int) -> int:
+    return math.floor(rng() * span) + low
+
+
+def js_round(value: float) -> int:
+    """``Math.round``: halves round up, not to even."""
+    return math.floor(value + 0.5)
+
+
+def _iso(ms: float) -> str:
+    return datetime.fromtimestamp(ms / 1000, timezone.utc).strftime("%Y-%m-%dT%H")
+
+
+def generate_line_series(config: DataConfig) -> List[Dict[str, object]]:
+    """Same points as ``generateLineChartData()`` under ``config``."""
+    rng = create_rng(hash_seed(config.seed, "line"))
+    points_per_day = 24 if config.granularity == "hourly" else 1
+    end = config.end_ms()
+    total = config.days * points_per_day
+    data = []
+    for i in range(total - 1, -1, -1):
+        stamp = _iso(end - i * (DAY_MS / points_per_day))
+        base_revenue = 1200 / points_per_day
+        variation = (rng() * 800 - 400) / points_per_day
+        seasonal_factor = 1 + math.sin((i / points_per_day / 29) * math.pi * 2) * 0.2
+        revenue = max(js_round(500 / points_per_day), js_round(base_revenue * seasonal_factor + variation))
+        data.append({
+            "date": stamp[:10] if points_per_day == 1 else f"{stamp}:00",
+            "revenue": revenue,
+            "visitors": js_round(revenue * (0.8 + rng() * 0.4)),
+            "conversions": js_round(revenue * (0.05 + rng() * 0.03)),
+        })
+    return data
+
+
+def generate_campaigns(config: DataConfig) -> List[Dict[str, object]]:
+    """Same rows as ``generateCampaignData()`` under ``config``."""
+    rng = create_rng(hash_seed(config.seed, "campaigns"))
+    end = config.end_ms()
+    start_window = max(90, config.days)
+    campaigns = []
+    for index in range(config.campaigns):
+        round_ = index // len(CAMPAIGN_NAMES)
+        name = CAMPAIGN_NAMES[index % len(CAMPAIGN_NAMES)]
+        if round_:
+            name = f"{name} #{round_ + 1}"
+        clicks = random_int(rng, 100, 4900)
+        conversions = random_int(rng, 10, 490)
+        cost = random_int(rng, 50, 1450)
+        revenue = conversions * 100
+        start = end - random_int(rng, 0, start_window) * DAY_MS
+        finish = start + random_int(rng, 7, 30) * DAY_MS
+        campaigns.append({
+            "id": f"campaign-{index + 1}",
+            "name": name,
+            "clicks": clicks,
+            "conversions": conversions,
+            "cost": cost,
+            "cpc": js_round(cost / clicks * 100) / 100,
+            "status": STATUSES[random_int(rng, 0, len(STATUSES))],
+            "startDate": _iso(start)[:10],
+            "endDate": _iso(finish)[:10],
+            "conversionRate": js_round(conversions / clicks * 100 * 10) / 10,
+            "roi": js_round((revenue - cost) / cost * 100 * 10) / 10,
+        })
+    return campaigns
@@ -0,0 +1,232 @@
+"""
+Append-only run history.
+
+Every ``python -m harness`` run is appended to a local SQLite database with
+per-test and per-step timings, so performance and flakiness drift can be
+tracked without diffing ``test_results.json``::
+
+    python -m harness.history runs
+    python -m harness.history p95 --last 20
+    python -m harness.history slowest-steps --last 10 --limit 15
+    python -m harness.history flaky --last 30
+"""
+
+import argparse
+import sqlite3
+import subprocess
+import sys
+from contextlib import closing
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+from .config import BASE_URL, REPO_ROOT, TESTS_DIR
+from .results import TestResult, utc_timestamp
+from .stats import percentile
+
+HISTORY_PATH = TESTS_DIR / "tmp" / "history.sqlite3"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    started_at TEXT NOT NULL,
+    git_commit TEXT,
+    git_dirty INTEGER,
+    build_id TEXT,
+    browser TEXT,
+    base_url TEXT,
+    wall_ms REAL,
+    total INTEGER,
+    passed INTEGER
+);
+CREATE TABLE IF NOT EXISTS tests (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    tc_id TEXT NOT NULL,
+    title TEXT,
+    status TEXT NOT NULL,
+    error TEXT,
+    duration_ms REAL,
+    replaced_wait_ms REAL,
+    actual_wait_ms REAL,
+    started_at TEXT,
+    PRIMARY KEY (run_id, tc_id)
+);
+CREATE TABLE IF NOT EXISTS steps (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    tc_id TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    kind TEXT NOT NULL,
+    duration_ms REAL,
+    waited_ms REAL,
+    PRIMARY KEY (run_id, tc_id, seq)
+);
+"""
+
+
+def connect(path: Path = HISTORY_PATH) -> sqlite3.Connection:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    connection = sqlite3.connect(path)
+    connection.row_factory = sqlite3.Row
+    connection.executescript(SCHEMA)
+    return connection
+
+
+def _git(*args: str) -> str:
+    try:
+        return subprocess.run(
+            ["git", *args], cwd=REPO_ROOT, capture_output=True, text=True, timeout=10, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return ""
+
+
+def build_info() -> Dict[str, object]:
+    """Commit, dirty flag and Next.js build id of the tree under test."""
+    build_id_path = REPO_ROOT / ".next" / "BUILD_ID"
+    return {
+        "git_commit": _git("rev-parse", "HEAD") or None,
+        "git_dirty": int(bool(_git("status", "--porcelain", "--untracked-files=no"))),
+        "build_id": build_id_path.read_text().strip() if build_id_path.exists() else None,
+    }
+
+
+def record_run(
+    results: Sequence[TestResult],
+    wall_ms: float,
+    path: Path = HISTORY_PATH,
+    base_url: str = BASE_URL,
+) -> int:
+    """Append one suite run and return its id."""
+    info = build_info()
+    browsers = sorted({result.browser for result in results if result.browser})
+    with closing(connect(path)) as connection, connection:
+        cursor = connection.execute(
+            "INSERT INTO runs (started_at, git_commit, git_dirty, build_id, browser, base_url, wall_ms, total, passed)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                min((result.started_at for result in results), default=utc_timestamp()),
+                info["git_commit"],
+                info["git_dirty"],
+                info["build_id"],
+                ", ".join(browsers),
+                base_url,
+                wall_ms,
+                len(results),
+                sum(result.passed for result in results),
+            ),
+        )
+        run_id = cursor.lastrowid
+        connection.executemany(
+            "INSERT INTO tests VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [
+                (run_id, r.tc_id, r.title, r.status, r.error, r.duration_ms,
+                 r.replaced_wait_ms, r.actual_wait_ms, r.started_at)
+                for r in results
+            ],
+        )
+        connection.executemany(
+            "INSERT INTO steps VALUES (?, ?, ?, ?, ?, ?)",
+            [
+                (run_id, r.tc_id, step.seq, step.kind, step.duration_ms, step.waited_ms)
+                for r in results
+                for step in r.steps
+            ],
+        )
+    return run_id
+
+
+def _last_runs_clause(last: int) -> str:
+    return f"run_id IN (SELECT id FROM runs ORDER BY id DESC LIMIT {int(last)})"
+
+
+def recent_runs(connection: sqlite3.Connection, last: int) -> List[sqlite3.Row]:
+    return connection.execute("SELECT * FROM runs ORDER BY id DESC LIMIT ?", (last,)).fetchall()
+
+
+def duration_percentiles(connection: sqlite3.Connection, last: int) -> List[Dict[str, object]]:
+    """p50/p95 duration and pass rate per TC over the last ``last`` runs."""
+    samples: Dict[str, List[sqlite3.Row]] = {}
+    for row in connection.execute(
+        f"SELECT tc_id, status, duration_ms FROM tests WHERE {_last_runs_clause(last)}"
+    ):
+        samples.setdefault(row["tc_id"], []).append(row)
+    return [
+        {
+            "tc_id": tc_id,
+            "runs": len(rows),
+            "p50_ms": percentile([row["duration_ms"] for row in rows], 50),
+            "p95_ms": percentile([row["duration_ms"] for row in rows], 95),
+            "pass_rate": sum(row["status"] == "PASSED" for row in rows) / len(rows),
+        }
+        for tc_id, rows in sorted(samples.items())
+    ]
+
+
+def slowest_steps(connection: sqlite3.Connection, last: int, limit: int) -> List[sqlite3.Row]:
+    """Steps with the highest mean duration over the last ``last`` runs."""
+    return connection.execute(
+        "SELECT tc_id, seq, kind, COUNT(*) AS runs, AVG(duration_ms) AS mean_ms,"
+        " MAX(duration_ms) AS max_ms, AVG(waited_ms) AS mean_wait_ms"
+        f" FROM steps WHERE {_last_runs_clause(last)}"
+        " GROUP BY tc_id, seq, kind ORDER BY mean_ms DESC LIMIT ?",
+        (limit,),
+    ).fetchall()
+
+
+def flaky_tests(connection: sqlite3.Connection, last: int) -> List[sqlite3.Row]:
+    """TCs that both passed and failed within the last ``last`` runs."""
+    return connection.execute(
+        "SELECT tc_id, SUM(status = 'PASSED') AS passed, SUM(status != 'PASSED') AS failed,"
+        " COUNT(*) AS runs FROM tests"
+        f" WHERE {_last_runs_clause(last)}"
+        " GROUP BY tc_id HAVING passed > 0 AND failed > 0 ORDER BY failed DESC, tc_id"
+    ).fetchall()
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m harness.history", description="Query the TC run history.")
+    parser.add_argument("--db", type=Path, default=HISTORY_PATH)
+    commands = parser.add_subparsers(dest="command", required=True)
+    for name, help_text in (
+        ("runs", "list recent runs"),
+        ("p95", "p50/p95 duration and pass rate per TC"),
+        ("slowest-steps", "steps with the highest mean duration"),
+        ("flaky", "TCs with mixed outcomes"),
+    ):
+        command = commands.add_parser(name, help=help_text)
+        command.add_argument("--last", type=int, default=10, help="number of most recent runs to consider")
+        if name == "slowest-steps":
+            command.add_argument("--limit", type=int, default=10)
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    if not args.db.exists():
+        print(f"No run history at {args.db}", file=sys.stderr)
+        return 1
+
+    with closing(connect(args.db)) as connection:
+        if args.command == "runs":
+            for run in recent_runs(connection, args.last):
+                commit = (run["git_commit"] or "unknown")[:8] + ("+" if run["git_dirty"] else "")
+                print(f"#{run['id']:<5} {run['started_at']}  {commit:<10} {run['passed']}/{run['total']} passed  "
+                      f"{run['wall_ms'] / 1000:6.1f}s  {run['browser']}")
+        elif args.command == "p95":
+            for row in duration_percentiles(connection, args.last):
+                print(f"{row['tc_id']}  p50 {row['p50_ms'] / 1000:6.2f}s  p95 {row['p95_ms'] / 1000:6.2f}s  "
+                      f"pass {row['pass_rate']:4.0%} of {row['runs']}")
+        elif args.command == "slowest-steps":
+            for row in slowest_steps(connection, args.last, args.limit):
+                print(f"{row['tc_id']} step {row['seq']:>2} {row['kind']:<6} mean {row['mean_ms']:8.0f}ms  "
+                      f"max {row['max_ms']:8.0f}ms  waiting {row['mean_wait_ms']:8.0f}ms  ({row['runs']} runs)")
+        elif args.command == "flaky":
+            rows = flaky_tests(connection, args.last)
+            if not rows:
+                print(f"No flaky TCs in the last {args.last} runs")
+            for row in rows:
+                print(f"{row['tc_id']}  {row['failed']} failed / {row['runs']} runs")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
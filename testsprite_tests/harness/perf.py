@@ -0,0 +1,203 @@
+"""
+Page performance budget suite.
+
+Loads every dashboard route N times in a fresh context, collects navigation
+timing, FCP, LCP, CLS, TBT and JS heap size, and checks p50/p95 against
+``perf_budget.json``. Results are written as JSON so builds can be compared::
+
+    python -m harness.perf --iterations 10
+    python -m harness.perf --serve --baseline tmp/perf_results.prev.json
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+from playwright import async_api
+
+from .config import BASE_URL, LAUNCH_ARGS, TESTS_DIR
+from .readiness import wait_until_ready
+from .results import utc_timestamp
+from .runner import new_test_context
+from .server import next_start
+from .stats import summarize
+
+ROUTES = ["/dashboard", "/analytics", "/campaigns", "/reports", "/settings"]
+BUDGET_PATH = TESTS_DIR / "perf_budget.json"
+OUTPUT_PATH = TESTS_DIR / "tmp" / "perf_results.json"
+
+# Buffered observers so entries recorded before we ask are not lost
+VITALS_INIT_SCRIPT = """
+(() => {
+  const vitals = { lcp: 0, cls: 0, longTasks: [] };
+  window.__vitals = vitals;
+  const observe = (type, onEntry) => {
+    try {
+      new PerformanceObserver((list) => list.getEntries().forEach(onEntry))
+        .observe({ type, buffered: true });
+    } catch (e) { /* entry type unsupported */ }
+  };
+  observe('largest-contentful-paint', (e) => { vitals.lcp = e.startTime; });
+  observe('layout-shift', (e) => { if (!e.hadRecentInput) vitals.cls += e.value; });
+  observe('longtask', (e) => { vitals.longTasks.push([e.startTime, e.duration]); });
+})();
+"""
+
+COLLECT_SCRIPT = """() => {
+  const nav = performance.getEntriesByType('navigation')[0] || {};
+  const fcp = performance.getEntriesByName('first-contentful-paint')[0];
+  const fcpTime = fcp ? fcp.startTime : 0;
+  const vitals = window.__vitals || { lcp: 0, cls: 0, longTasks: [] };
+  // TBT: blocking portion (> 50 ms) of every long task after FCP
+  const tbt = vitals.longTasks
+    .filter(([start]) => start >= fcpTime)
+    .reduce((sum, [, duration]) => sum + Math.max(0, duration - 50), 0);
+  return {
+    ttfb_ms: nav.responseStart || 0,
+    dom_content_loaded_ms: nav.domContentLoadedEventEnd || 0,
+    load_ms: nav.loadEventEnd || 0,
+    fcp_ms: fcpTime,
+    lcp_ms: vitals.lcp,
+    cls: vitals.cls,
+    tbt_ms: tbt,
+  };
+}"""
+
+
+async def measure_route(browser: async_api.Browser, base_url: str, route: str) -> Dict[str, float]:
+    """Cold-load ``route`` once and return its metrics."""
+    context = await new_test_context(browser)
+    try:
+        await context.add_init_script(VITALS_INIT_SCRIPT)
+        page = await context.new_page()
+        cdp = await context.new_cdp_session(page)
+        await cdp.send("Performance.enable")
+        await page.goto(base_url + route, wait_until="load")
+        await wait_until_ready(page)
+        metrics = await page.evaluate(COLLECT_SCRIPT)
+        heap = await cdp.send("Performance.getMetrics")
+        used = next((m["value"] for m in heap["metrics"] if m["name"] == "JSHeapUsedSize"), 0)
+        metrics["js_heap_mb"] = used / (1024 * 1024)
+        return metrics
+    finally:
+        await context.close()
+
+
+async def measure_routes(base_url: str, routes: Sequence[str], iterations: int) -> Dict[str, List[Dict[str, float]]]:
+    samples: Dict[str, List[Dict[str, float]]] = {route: [] for route in routes}
+    async with async_api.async_playwright() as pw:
+        browser = await pw.chromium.launch(headless=True, args=LAUNCH_ARGS)
+        try:
+            # Sequential on purpose: concurrent loads would skew each other's timings
+            for _ in range(iterations):
+                for route in routes:
+                    samples[route].append(await measure_route(browser, base_url, route))
+        finally:
+            await browser.close()
+    return samples
+
+
+def load_budget(path: Path, routes: Sequence[str]) -> Dict[str, Dict[str, Dict[str, float]]]:
+    """Per-route budgets with ``defaults`` merged in."""
+    raw = json.loads(path.read_text(encoding="utf-8"))
+    defaults = raw.get("defaults", {})
+    budgets = {}
+    for route in routes:
+        merged = {metric: dict(limits) for metric, limits in defaults.items()}
+        for metric, limits in raw.get("routes", {}).get(route, {}).items():
+            merged.setdefault(metric, {}).update(limits)
+        budgets[route] = merged
+    return budgets
+
+
+def check_budget(summary: Dict[str, Dict[str, float]], budget: Dict[str, Dict[str, float]]) -> List[dict]:
+    violations = []
+    for metric, limits in budget.items():
+        for stat, limit in limits.items():
+            actual = summary.get(metric, {}).get(stat)
+            if actual is not None and actual > limit:
+                violations.append({"metric": metric, "stat": stat, "actual": actual, "budget": limit})
+    return violations
+
+
+def compare(current: dict, baseline: dict) -> Dict[str, Dict[str, Dict[str, float]]]:
+    """p50/p95 deltas (current - baseline) for routes present in both runs."""
+    deltas: Dict[str, Dict[str, Dict[str, float]]] = {}
+    for route, data in current["routes"].items():
+        previous = baseline.get("routes", {}).get(route)
+        if not previous:
+            continue
+        for metric, stats in data["metrics"].items():
+            before = previous["metrics"].get(metric)
+            if before:
+                deltas.setdefault(route, {})[metric] = {
+                    stat: stats[stat] - before[stat] for stat in ("p50", "p95")
+                }
+    return deltas
+
+
+def build_report(base_url: str, iterations: int, samples, budgets) -> dict:
+    routes = {}
+    for route, runs in samples.items():
+        metrics = {name: summarize([run[name] for run in runs]) for name in runs[0]} if runs else {}
+        routes[route] = {
+            "metrics": metrics,
+            "violations": check_budget(metrics, budgets[route]),
+        }
+    return {
+        "generated_at": utc_timestamp(),
+        "base_url": base_url,
+        "iterations": iterations,
+        "routes": routes,
+        "passed": not any(data["violations"] for data in routes.values()),
+    }
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m harness.perf", description=__doc__.split("\n\n")[0])
+    parser.add_argument("routes", nargs="*", default=ROUTES, help="routes to measure (default: all)")
+    parser.add_argument("--iterations", "-n", type=int, default=5)
+    parser.add_argument("--budget", type=Path, default=BUDGET_PATH)
+    parser.add_argument("--output", type=Path, default=OUTPUT_PATH)
+    parser.add_argument("--baseline", type=Path, help="previous output to diff p50/p95 against")
+    parser.add_argument("--serve", action="store_true", help="start `next start` for the run (needs a build)")
+    parser.add_argument("--port", type=int, default=3000, help="port for --serve")
+    return parser
+
+
+def run(args: argparse.Namespace, base_url: str) -> dict:
+    samples = asyncio.run(measure_routes(base_url, args.routes, args.iterations))
+    report = build_report(base_url, args.iterations, samples, load_budget(args.budget, args.routes))
+    if args.baseline and args.baseline.exists():
+        report["baseline"] = str(args.baseline)
+        report["deltas"] = compare(report, json.loads(args.baseline.read_text(encoding="utf-8")))
+    return report
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    if args.serve:
+        with next_start(args.port) as base_url:
+            report = run(args, base_url)
+    else:
+        report = run(args, BASE_URL)
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+
+    for route, data in report["routes"].items():
+        lcp = data["metrics"].get("lcp_ms", {})
+        print(f"{route:<12} LCP p50 {lcp.get('p50', 0):7.0f}ms  p95 {lcp.get('p95', 0):7.0f}ms  "
+              f"{len(data['violations'])} budget violation(s)")
+        for violation in data["violations"]:
+            print(f"    {violation['metric']} {violation['stat']} = {violation['actual']:.2f} "
+                  f"(budget {violation['budget']})")
+    print(f"Wrote {args.output}")
+    return 0 if report["passed"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
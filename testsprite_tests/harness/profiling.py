@@ -0,0 +1,162 @@
+"""
+Opt-in tracing and CPU profiling for TC runs.
+
+Set ``TESTSPRITE_PROFILE`` to ``trace``, ``cpu`` or ``all`` (comma separated
+values are fine too) and every test run by ``python -m harness`` writes to
+``profiles/<TC id>/``, next to the report:
+
+* ``trace.zip``         Playwright trace (``npx playwright show-trace``)
+* ``page-N.cpuprofile`` CDP Profiler output, loadable in DevTools
+* ``summary.json``      top self-time functions and long tasks
+"""
+
+import asyncio
+import json
+import os
+import shutil
+from collections import defaultdict
+from typing import Dict, List, Optional, Set, Tuple
+
+from playwright import async_api
+
+from .config import TESTS_DIR
+
+PROFILE_DIR = TESTS_DIR / "profiles"
+PROFILE_ENV = "TESTSPRITE_PROFILE"
+
+# Microseconds between CPU samples; the default (1000) misses short functions
+SAMPLING_INTERVAL_US = 200
+TOP_FUNCTIONS = 15
+LONG_TASK_MS = 50
+
+# Pseudo-frames that are not code in src/
+IGNORED_FRAMES = {"(idle)", "(root)"}
+
+LONG_TASKS_INIT_SCRIPT = """
+(() => {
+  window.__longTasks = [];
+  try {
+    new PerformanceObserver((list) => list.getEntries().forEach((e) => {
+      window.__longTasks.push([e.startTime, e.duration]);
+    })).observe({ type: 'longtask', buffered: true });
+  } catch (e) { /* entry type unsupported */ }
+})();
+"""
+
+
+def profile_modes(value: Optional[str] = None) -> Set[str]:
+    """Parse ``TESTSPRITE_PROFILE`` into a subset of {"trace", "cpu"}."""
+    raw = os.environ.get(PROFILE_ENV, "") if value is None else value
+    modes = {part.strip().lower() for part in raw.split(",") if part.strip()}
+    if modes & {"1", "all", "true", "yes"}:
+        return {"trace", "cpu"}
+    return modes & {"trace", "cpu"}
+
+
+def self_times(profile: dict) -> Dict[Tuple[str, str, int], float]:
+    """Self time (ms) per function from a ``.cpuprofile``."""
+    frames = {node["id"]: node["callFrame"] for node in profile.get("nodes", [])}
+    samples = profile.get("samples", [])
+    deltas = profile.get("timeDeltas", [])
+    totals: Dict[Tuple[str, str, int], float] = defaultdict(float)
+    # timeDeltas[i + 1] is the time spent in samples[i]
+    for index, node_id in enumerate(samples):
+        frame = frames.get(node_id)
+        if frame is None or index + 1 >= len(deltas):
+            continue
+        name = frame.get("functionName") or "(anonymous)"
+        if name in IGNORED_FRAMES:
+            continue
+        key = (name, frame.get("url", ""), frame.get("lineNumber", -1) + 1)
+        totals[key] += deltas[index + 1] / 1000
+    return totals
+
+
+def top_functions(profiles: List[dict], limit: int = TOP_FUNCTIONS) -> List[dict]:
+    totals: Dict[Tuple[str, str, int], float] = defaultdict(float)
+    for profile in profiles:
+        for key, ms in self_times(profile).items():
+            totals[key] += ms
+    ranked = sorted(totals.items(), key=lambda item: item[1], reverse=True)[:limit]
+    return [
+        {"function": name, "url": url.rsplit("/", 1)[-1], "line": line, "self_ms": round(ms, 2)}
+        for (name, url, line), ms in ranked
+    ]
+
+
+def summarize_long_tasks(tasks: List[Tuple[float, float]]) -> dict:
+    longest = sorted(tasks, key=lambda task: task[1], reverse=True)
+    return {
+        "count": len(tasks),
+        "total_blocking_ms": round(sum(max(0.0, duration - LONG_TASK_MS) for _, duration in tasks), 2),
+        "longest": [{"start_ms": round(start, 1), "duration_ms": round(duration, 1)} for start, duration in longest[:5]],
+    }
+
+
+class TestProfiler:
+    """Trace and CPU-profile every page a test opens in ``context``."""
+
+    def __init__(self, context: async_api.BrowserContext, tc_id: str, modes: Set[str]):
+        self.context = context
+        self.modes = modes
+        self.out_dir = PROFILE_DIR / tc_id
+        self.sessions: List[Tuple[async_api.Page, async_api.CDPSession]] = []
+        self._pending = []
+
+    async def start(self) -> None:
+        if self.out_dir.exists():
+            shutil.rmtree(self.out_dir)
+        self.out_dir.mkdir(parents=True)
+        await self.context.add_init_script(LONG_TASKS_INIT_SCRIPT)
+        if "trace" in self.modes:
+            await self.context.tracing.start(screenshots=True, snapshots=True)
+        if "cpu" in self.modes:
+            # Pages are created by the test itself, so hook them as they appear
+            self.context.on("page", lambda page: self._pending.append(asyncio.ensure_future(self._attach(page))))
+
+    async def _attach(self, page: async_api.Page) -> None:
+        session = await self.context.new_cdp_session(page)
+        await session.send("Profiler.enable")
+        await session.send("Profiler.setSamplingInterval", {"interval": SAMPLING_INTERVAL_US})
+        await session.send("Profiler.start")
+        self.sessions.append((page, session))
+
+    async def stop(self) -> dict:
+        """Write the artifacts and return the summary (call before closing the context)."""
+        for attach in self._pending:
+            try:
+                await attach
+            except async_api.Error:
+                pass  # page closed before the profiler attached
+        profiles = []
+        long_tasks: List[Tuple[float, float]] = []
+        for index, (page, session) in enumerate(self.sessions, start=1):
+            try:
+                profile = (await session.send("Profiler.stop"))["profile"]
+            except async_api.Error:
+                continue
+            profiles.append(profile)
+            (self.out_dir / f"page-{index}.cpuprofile").write_text(json.dumps(profile), encoding="utf-8")
+        for page in self.context.pages:
+            try:
+                long_tasks.extend(await page.evaluate("() => window.__longTasks || []"))
+            except async_api.Error:
+                pass
+        if "trace" in self.modes:
+            await self.context.tracing.stop(path=self.out_dir / "trace.zip")
+
+        summary = {
+            "top_functions": top_functions(profiles),
+            "long_tasks": summarize_long_tasks(long_tasks),
+        }
+        (self.out_dir / "summary.json").write_text(json.dumps(summary, indent=2) + "\n", encoding="utf-8")
+        return summary
+
+
+def format_summary(summary: dict, limit: int = 3) -> str:
+    """One-line digest for the run summary."""
+    hot = ", ".join(
+        f"{entry['function']} {entry['self_ms']:.0f}ms" for entry in summary["top_functions"][:limit]
+    )
+    tasks = summary["long_tasks"]
+    return f"hot: {hot or 'n/a'}; {tasks['count']} long task(s), TBT {tasks['total_blocking_ms']:.0f}ms"
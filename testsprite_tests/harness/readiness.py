@@ -0,0 +1,142 @@
+"""
+Event-driven readiness helpers for the TC files.
+
+The generated tests padded every interaction with fixed sleeps
+(``wait_for_timeout(3000)`` before each click, ``asyncio.sleep(5)`` at the
+end). These helpers wait on real signals instead:
+
+* network idle,
+* no loading skeletons (``.animate-pulse``) left in the DOM,
+* ``<html data-fetch-state="idle">``, set by ``useDataFetching`` once every
+  in-flight fetch has settled.
+
+Each helper takes the fixed wait it replaces so the runner can report how much
+time the suite saved, and records itself as a numbered step so run history can
+track per-step durations.
+"""
+
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from playwright import async_api
+
+from .config import DEFAULT_TIMEOUT_MS
+
+READY_SCRIPT = """() => {
+  if (document.documentElement.dataset.fetchState === 'loading') return false;
+  return document.querySelector('.animate-pulse') === null;
+}"""
+
+# Two animation frames: lets resize handlers and React commits flush
+SETTLE_SCRIPT = "() => new Promise(r => requestAnimationFrame(() => requestAnimationFrame(r)))"
+
+
+@dataclass
+class Step:
+    """One helper call: its kind, total duration and the readiness part of it."""
+
+    seq: int
+    kind: str
+    duration_ms: float
+    waited_ms: float
+
+
+@dataclass
+class WaitLedger:
+    """Time spent waiting versus the fixed sleeps the waits replaced."""
+
+    replaced_ms: float = 0.0
+    waited_ms: float = 0.0
+    steps: List[Step] = field(default_factory=list)
+
+    @property
+    def saved_ms(self) -> float:
+        return max(0.0, self.replaced_ms - self.waited_ms)
+
+
+_ledger: ContextVar[Optional[WaitLedger]] = ContextVar("readiness_ledger", default=None)
+
+
+def start_ledger() -> WaitLedger:
+    """Begin accounting for the current task (one per running test)."""
+    ledger = WaitLedger()
+    _ledger.set(ledger)
+    return ledger
+
+
+def _record(replaced_ms: float, started: float) -> float:
+    waited_ms = (time.perf_counter() - started) * 1000
+    ledger = _ledger.get()
+    if ledger is not None:
+        ledger.replaced_ms += replaced_ms
+        ledger.waited_ms += waited_ms
+    return waited_ms
+
+
+def _record_step(kind: str, started: float, waited_ms: float) -> None:
+    ledger = _ledger.get()
+    if ledger is not None:
+        duration_ms = (time.perf_counter() - started) * 1000
+        ledger.steps.append(Step(len(ledger.steps) + 1, kind, duration_ms, waited_ms))
+
+
+async def _wait(page: async_api.Page, replaced_ms: float, timeout: float) -> float:
+    started = time.perf_counter()
+    try:
+        await page.wait_for_load_state("networkidle", timeout=timeout)
+        await page.wait_for_function(READY_SCRIPT, timeout=timeout)
+        await page.evaluate(SETTLE_SCRIPT)
+    except async_api.Error:
+        pass
+    finally:
+        waited_ms = _record(replaced_ms, started)
+    return waited_ms
+
+
+async def wait_until_ready(
+    page: async_api.Page,
+    replaced_ms: float = 0,
+    timeout: float = DEFAULT_TIMEOUT_MS,
+) -> None:
+    """Wait until the network is idle and no widget is still loading.
+
+    A timeout is not an error here: the next action fails with a precise
+    message if the page really is not usable.
+    """
+    started = time.perf_counter()
+    waited_ms = await _wait(page, replaced_ms, timeout)
+    _record_step("wait", started, waited_ms)
+
+
+async def ready_click(page: async_api.Page, locator: async_api.Locator, replaced_ms: float = 3000) -> None:
+    """Click ``locator`` as soon as the page is ready."""
+    started = time.perf_counter()
+    waited_ms = await _wait(page, replaced_ms, DEFAULT_TIMEOUT_MS)
+    try:
+        await locator.click(timeout=DEFAULT_TIMEOUT_MS)
+    finally:
+        _record_step("click", started, waited_ms)
+
+
+async def ready_fill(
+    page: async_api.Page,
+    locator: async_api.Locator,
+    value: str,
+    replaced_ms: float = 3000,
+) -> None:
+    """Fill ``locator`` as soon as the page is ready."""
+    started = time.perf_counter()
+    waited_ms = await _wait(page, replaced_ms, DEFAULT_TIMEOUT_MS)
+    try:
+        await locator.fill(value)
+    finally:
+        _record_step("fill", started, waited_ms)
+
+
+async def settle(page: async_api.Page, replaced_ms: float = 5000) -> None:
+    """Replacement for the trailing ``asyncio.sleep(5)`` in every test."""
+    started = time.perf_counter()
+    waited_ms = await _wait(page, replaced_ms, DEFAULT_TIMEOUT_MS)
+    _record_step("settle", started, waited_ms)
@@ -0,0 +1,174 @@
+"""
+Merge harness results into the TestSprite artifacts.
+
+``tmp/test_results.json``, ``testsprite-mcp-test-report.md`` and its rendered
+``.html`` twin are produced by TestSprite; the harness only updates the
+per-test status fields and the summary numbers so the hand-written analysis
+sections survive a re-run.
+"""
+
+import html
+import json
+import re
+from datetime import date
+from pathlib import Path
+from typing import Dict, List, Sequence
+
+from .results import PASSED, TestResult, utc_timestamp
+
+REQUIREMENT_RE = re.compile(r"^### Requirement:\s*(.+)$")
+TEST_ID_RE = re.compile(r"^- \*\*Test ID:\*\*\s*(TC\d{3})")
+TABLE_ROW_RE = re.compile(r"^\| (.+?) \| (\d+) \| (\d+) \| (\d+) \| (\d+) \|$")
+PASS_RATE_RE = re.compile(r"\d+% of tests passed")
+
+HTML_REQUIREMENT_RE = re.compile(r"^<h3>Requirement:\s*(.+)</h3>$")
+HTML_TEST_ID_RE = re.compile(r"^<li><strong>Test ID:</strong>\s*(TC\d{3})</li>$")
+HTML_TABLE_CELL_RE = re.compile(r"^<td>(.+)</td>$")
+
+
+def _tc_id(title: str) -> str:
+    return title.split("-", 1)[0].strip()
+
+
+def _one_line(text: str) -> str:
+    return " ".join(text.split())
+
+
+def merge_results_json(results: Sequence[TestResult], path: Path) -> None:
+    """Update status fields in ``test_results.json``, appending unknown tests."""
+    entries: List[dict] = []
+    if path.exists():
+        entries = json.loads(path.read_text(encoding="utf-8"))
+    index = {_tc_id(entry.get("title", "")): entry for entry in entries}
+
+    for result in results:
+        now = utc_timestamp()
+        entry = index.get(result.tc_id)
+        if entry is None:
+            entry = {
+                "title": result.title,
+                "description": "",
+                "testType": "FRONTEND",
+                "createFrom": "harness",
+                "created": now,
+            }
+            entries.append(entry)
+            index[result.tc_id] = entry
+        entry["testStatus"] = result.status
+        entry["testError"] = result.error
+        entry["modified"] = now
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(entries, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+
+
+def merge_report_md(results: Sequence[TestResult], path: Path) -> None:
+    """Rewrite per-test status lines and the coverage summary of the report."""
+    if not path.exists():
+        return
+    by_id = {result.tc_id: result for result in results}
+    with open(path, encoding="utf-8", newline="") as handle:
+        text = handle.read()
+    newline = "\r\n" if "\r\n" in text else "\n"
+    lines = text.split(newline)
+
+    requirement = None
+    current = None
+    outcomes: Dict[str, List[bool]] = {}
+    for i, line in enumerate(lines):
+        match = REQUIREMENT_RE.match(line)
+        if match:
+            requirement, current = match.group(1).strip(), None
+            continue
+        match = TEST_ID_RE.match(line)
+        if match:
+            current = match.group(1)
+            continue
+        if current is None:
+            continue
+        result = by_id.get(current)
+        if line.startswith("- **Test Error:**") and result:
+            lines[i] = f"- **Test Error:** {_one_line(result.error) or 'N/A'}"
+        elif line.startswith("- **Status:**"):
+            if result:
+                lines[i] = "- **Status:** " + ("✅ Passed" if result.status == PASSED else "❌ Failed")
+            outcomes.setdefault(requirement, []).append("Passed" in lines[i])
+
+    total = sum(len(values) for values in outcomes.values())
+    passed = sum(sum(values) for values in outcomes.values())
+    rate = round(100 * passed / total) if total else 0
+    for i, line in enumerate(lines):
+        if line.startswith("- **Date:**"):
+            lines[i] = f"- **Date:** {date.today().isoformat()}"
+            continue
+        lines[i] = PASS_RATE_RE.sub(f"{rate}% of tests passed", line)
+        match = TABLE_ROW_RE.match(lines[i])
+        if match and match.group(1) in outcomes:
+            values = outcomes[match.group(1)]
+            lines[i] = (
+                f"| {match.group(1)} | {len(values)} | {sum(values)} | 0 | "
+                f"{len(values) - sum(values)} |"
+            )
+
+    with open(path, "w", encoding="utf-8", newline="") as handle:
+        handle.write(newline.join(lines))
+
+
+def merge_report_html(results: Sequence[TestResult], path: Path) -> None:
+    """Same updates as :func:`merge_report_md` for the rendered HTML report."""
+    if not path.exists():
+        return
+    by_id = {result.tc_id: result for result in results}
+    with open(path, encoding="utf-8", newline="") as handle:
+        text = handle.read()
+    newline = "\r\n" if "\r\n" in text else "\n"
+    lines = text.split(newline)
+
+    requirement = None
+    current = None
+    outcomes: Dict[str, List[bool]] = {}
+    for i, line in enumerate(lines):
+        match = HTML_REQUIREMENT_RE.match(line)
+        if match:
+            requirement, current = html.unescape(match.group(1).strip()), None
+            continue
+        match = HTML_TEST_ID_RE.match(line)
+        if match:
+            current = match.group(1)
+            continue
+        if current is None:
+            continue
+        result = by_id.get(current)
+        if line.startswith("<li><strong>Test Error:</strong>") and result:
+            error = html.escape(_one_line(result.error)) or "N/A"
+            lines[i] = f"<li><strong>Test Error:</strong> {error}</li>"
+        elif line.startswith("<li><strong>Status:</strong>"):
+            if result:
+                status = "✅ Passed" if result.status == PASSED else "❌ Failed"
+                lines[i] = f"<li><strong>Status:</strong> {status}</li>"
+            outcomes.setdefault(requirement, []).append("Passed" in lines[i])
+
+    total = sum(len(values) for values in outcomes.values())
+    passed = sum(sum(values) for values in outcomes.values())
+    rate = round(100 * passed / total) if total else 0
+    i = 0
+    while i < len(lines):
+        line = lines[i]
+        if line.startswith("<li><strong>Date:</strong>"):
+            lines[i] = f"<li><strong>Date:</strong> {date.today().isoformat()}</li>"
+        else:
+            lines[i] = PASS_RATE_RE.sub(f"{rate}% of tests passed", line)
+        match = HTML_TABLE_CELL_RE.match(lines[i])
+        name = html.unescape(match.group(1)) if match else None
+        # A coverage row is the requirement cell followed by four count cells
+        if name in outcomes and i + 4 < len(lines):
+            values = outcomes[name]
+            counts = [len(values), sum(values), 0, len(values) - sum(values)]
+            for offset, count in enumerate(counts, start=1):
+                lines[i + offset] = f"<td>{count}</td>"
+            i += 5
+            continue
+        i += 1
+
+    with open(path, "w", encoding="utf-8", newline="") as handle:
+        handle.write(newline.join(lines))
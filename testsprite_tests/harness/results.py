@@ -0,0 +1,45 @@
+"""
+Result records produced by the harness for each TC run.
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import List, Optional
+
+from .readiness import Step
+
+PASSED = "PASSED"
+FAILED = "FAILED"
+
+
+def utc_timestamp() -> str:
+    """Return an ISO-8601 UTC timestamp in the format TestSprite uses."""
+    now = datetime.now(timezone.utc)
+    return now.strftime("%Y-%m-%dT%H:%M:%S.") + f"{now.microsecond // 1000:03d}Z"
+
+
+@dataclass
+class TestResult:
+    """Outcome of a single TC file run."""
+
+    tc_id: str
+    title: str
+    status: str = FAILED
+    error: str = ""
+    duration_ms: float = 0.0
+    # Fixed sleeps the readiness helpers replaced, and what they waited instead
+    replaced_wait_ms: float = 0.0
+    actual_wait_ms: float = 0.0
+    started_at: str = field(default_factory=utc_timestamp)
+    browser: str = ""
+    steps: List[Step] = field(default_factory=list)
+    # Summary written by harness.profiling when TESTSPRITE_PROFILE is set
+    profile: Optional[dict] = None
+
+    @property
+    def passed(self) -> bool:
+        return self.status == PASSED
+
+    @property
+    def saved_ms(self) -> float:
+        return max(0.0, self.replaced_wait_ms - self.actual_wait_ms)
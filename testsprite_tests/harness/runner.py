@@ -0,0 +1,265 @@
+"""
+Concurrent runner for the TC suite.
+
+Every TC file exposes ``run_test(context)``. Instead of each test booting its
+own Chromium, the runner starts one browser (or a small pool) and runs all
+tests at once, each in an isolated BrowserContext under a single event loop.
+"""
+
+import argparse
+import asyncio
+import importlib.util
+import re
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Awaitable, Callable, List, Optional, Sequence
+
+from playwright import async_api
+
+from . import profiling, readiness, report
+from .config import (
+    DEFAULT_TIMEOUT_MS,
+    LAUNCH_ARGS,
+    REPORT_HTML_PATH,
+    REPORT_MD_PATH,
+    RESULTS_PATH,
+    TEST_MODE,
+    TESTS_DIR,
+)
+from .datagen import enable_test_mode_script
+from .results import FAILED, PASSED, TestResult
+
+TC_FILE_PATTERN = re.compile(r"^(TC\d{3})_(\w+)\.py$")
+
+RunTest = Callable[[async_api.BrowserContext], Awaitable[None]]
+
+
+@dataclass
+class TestCase:
+    """A discovered TC file."""
+
+    tc_id: str
+    title: str
+    path: Path
+
+    def load(self) -> RunTest:
+        """Import the TC module without triggering its ``__main__`` block."""
+        spec = importlib.util.spec_from_file_location(self.path.stem, self.path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module.run_test
+
+
+def discover(tests_dir: Path = TESTS_DIR, selected: Optional[Sequence[str]] = None) -> List[TestCase]:
+    """Find TC files, optionally restricted to the given TC ids."""
+    wanted = {tc_id.upper() for tc_id in selected} if selected else None
+    cases = []
+    for path in sorted(tests_dir.glob("TC*.py")):
+        match = TC_FILE_PATTERN.match(path.name)
+        if not match:
+            continue
+        tc_id, name = match.groups()
+        if wanted and tc_id not in wanted:
+            continue
+        cases.append(TestCase(tc_id, f"{tc_id}-{name.replace('_', ' ')}", path))
+    return cases
+
+
+def describe_error(exc: BaseException) -> str:
+    """Render an exception the way TestSprite reports test errors."""
+    message = str(exc).strip()
+    if isinstance(exc, AssertionError) and message:
+        return message
+    return f"{type(exc).__name__}: {message}" if message else type(exc).__name__
+
+
+async def new_test_context(browser: async_api.Browser) -> async_api.BrowserContext:
+    """Create an isolated context with the suite-wide defaults applied."""
+    context = await browser.new_context()
+    context.set_default_timeout(DEFAULT_TIMEOUT_MS)
+    if TEST_MODE:
+        await context.add_init_script(enable_test_mode_script())
+    return context
+
+
+async def run_case(
+    browser: async_api.Browser,
+    case: TestCase,
+    semaphore: asyncio.Semaphore,
+    timeout: Optional[float] = None,
+) -> TestResult:
+    """Run one TC in a fresh context and capture its outcome."""
+    result = TestResult(case.tc_id, case.title, browser=browser.version)
+    ledger = readiness.start_ledger()
+    modes = profiling.profile_modes()
+    async with semaphore:
+        context = await new_test_context(browser)
+        profiler = None
+        start = time.perf_counter()
+        try:
+            # Started inside the try so a tracing/CDP failure fails this case
+            # and still closes the context
+            if modes:
+                starting = profiling.TestProfiler(context, case.tc_id, modes)
+                try:
+                    await starting.start()
+                except Exception as exc:
+                    raise RuntimeError(f"Profiler failed to start: {describe_error(exc)}") from exc
+                profiler = starting
+                start = time.perf_counter()
+            run_test = case.load()
+            await asyncio.wait_for(run_test(context), timeout)
+            result.status = PASSED
+        except asyncio.TimeoutError:
+            result.error = f"Test exceeded the {timeout:g}s suite timeout"
+        except Exception as exc:
+            result.error = describe_error(exc)
+        finally:
+            result.duration_ms = (time.perf_counter() - start) * 1000
+            result.replaced_wait_ms = ledger.replaced_ms
+            result.actual_wait_ms = ledger.waited_ms
+            result.steps = list(ledger.steps)
+            try:
+                if profiler:
+                    result.profile = await profiler.stop()
+            except Exception as exc:
+                # A tracing/CDP failure fails this case, not the whole gather
+                result.status = FAILED
+                failure = f"Profiler failed: {describe_error(exc)}"
+                result.error = f"{result.error}; {failure}" if result.error else failure
+            finally:
+                await context.close()
+    return result
+
+
+async def run_suite(
+    cases: Sequence[TestCase],
+    browsers: int = 1,
+    concurrency: Optional[int] = None,
+    timeout: Optional[float] = None,
+) -> List[TestResult]:
+    """Run ``cases`` concurrently over a pool of ``browsers`` Chromium instances."""
+    if not cases:
+        return []
+    semaphore = asyncio.Semaphore(concurrency or len(cases))
+    async with async_api.async_playwright() as pw:
+        pool = await asyncio.gather(*(
+            pw.chromium.launch(headless=True, args=LAUNCH_ARGS)
+            for _ in range(max(1, browsers))
+        ))
+        try:
+            results = await asyncio.gather(*(
+                run_case(pool[index % len(pool)], case, semaphore, timeout)
+                for index, case in enumerate(cases)
+            ))
+        finally:
+            await asyncio.gather(*(browser.close() for browser in pool))
+    return list(results)
+
+
+async def run_standalone(run_test: RunTest) -> None:
+    """Run a single TC file directly, e.g. ``python TC001_....py``."""
+    ledger = readiness.start_ledger()
+    async with async_api.async_playwright() as pw:
+        browser = await pw.chromium.launch(headless=True, args=LAUNCH_ARGS)
+        try:
+            context = await new_test_context(browser)
+            try:
+                await run_test(context)
+            finally:
+                await context.close()
+        finally:
+            await browser.close()
+    print(f"Readiness waits saved {ledger.saved_ms / 1000:.1f}s of {ledger.replaced_ms / 1000:.1f}s fixed sleeps")
+
+
+def print_summary(results: Sequence[TestResult], wall_ms: float) -> None:
+    for result in results:
+        mark = "PASS" if result.passed else "FAIL"
+        line = f"{mark}  {result.title} ({result.duration_ms / 1000:.1f}s)"
+        if result.error:
+            line += f"\n      {result.error.splitlines()[0]}"
+        if result.profile:
+            line += f"\n      {profiling.format_summary(result.profile)}"
+        print(line)
+    passed = sum(result.passed for result in results)
+    serial_ms = sum(result.duration_ms for result in results)
+    replaced_ms = sum(result.replaced_wait_ms for result in results)
+    saved_ms = sum(result.saved_ms for result in results)
+    print(
+        f"\n{passed}/{len(results)} passed in {wall_ms / 1000:.1f}s wall clock "
+        f"({serial_ms / 1000:.1f}s of test time)"
+    )
+    if replaced_ms:
+        print(
+            f"Readiness waits saved {saved_ms / 1000:.1f}s of "
+            f"{replaced_ms / 1000:.1f}s fixed sleeps"
+        )
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m harness",
+        description="Run the TestSprite TC suite concurrently on a shared browser.",
+    )
+    parser.add_argument("tests", nargs="*", help="TC ids to run (default: all)")
+    parser.add_argument("--browsers", type=int, default=1, help="number of Chromium instances to share")
+    parser.add_argument("--concurrency", type=int, default=None, help="max tests in flight (default: all)")
+    parser.add_argument("--timeout", type=float, default=None, help="per-test timeout in seconds")
+    parser.add_argument("--shards", type=int, default=1, help="worker processes, each with its own browser pool")
+    parser.add_argument("--history-runs", type=int, default=20, help="recent runs used to balance shards")
+    parser.add_argument("--no-report", action="store_true", help="do not update test_results.json or the report")
+    parser.add_argument("--no-history", action="store_true", help="do not append this run to the history database")
+    parser.add_argument(
+        "--bundle-check",
+        action="store_true",
+        help="also check the production build in .next against the First Load JS budget",
+    )
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    cases = discover(selected=args.tests)
+    if not cases:
+        print("No TC files matched.", file=sys.stderr)
+        return 2
+
+    start = time.perf_counter()
+    if args.shards > 1:
+        from .sharding import run_sharded
+
+        results = run_sharded(
+            cases, args.shards, args.browsers, args.concurrency, args.timeout, args.history_runs
+        )
+    else:
+        results = asyncio.run(run_suite(cases, args.browsers, args.concurrency, args.timeout))
+    wall_ms = (time.perf_counter() - start) * 1000
+    print_summary(results, wall_ms)
+
+    if not args.no_history:
+        # Imported here so `python -m harness.history` does not find itself preloaded
+        from . import history
+
+        run_id = history.record_run(results, wall_ms)
+        print(f"Recorded run #{run_id} in {history.HISTORY_PATH}")
+
+    if not args.no_report:
+        report.merge_results_json(results, RESULTS_PATH)
+        report.merge_report_md(results, REPORT_MD_PATH)
+        report.merge_report_html(results, REPORT_HTML_PATH)
+
+    # Opt-in: the suite may be running against `next dev` while an unrelated
+    # production build sits in .next
+    bundle_passed = None
+    if args.bundle_check:
+        from .bundle import BUILD_DIR, check_build
+
+        print()
+        bundle_passed = check_build()
+        if bundle_passed is None:
+            print(f"No production build in {BUILD_DIR}; run `npm run build` first.", file=sys.stderr)
+            bundle_passed = False
+    return 0 if all(result.passed for result in results) and bundle_passed is not False else 1
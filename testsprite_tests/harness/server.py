@@ -0,0 +1,51 @@
+"""
+Start a production Next.js server for the benchmark modes.
+"""
+
+import os
+import subprocess
+import time
+import urllib.error
+import urllib.request
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+
+from .config import REPO_ROOT
+
+
+def wait_for_http(url: str, timeout: float = 60.0) -> None:
+    """Poll ``url`` until it answers or ``timeout`` seconds pass."""
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            with urllib.request.urlopen(url, timeout=2):
+                return
+        except (urllib.error.URLError, ConnectionError, OSError):
+            if time.monotonic() > deadline:
+                raise RuntimeError(f"Server at {url} did not come up within {timeout:g}s")
+            time.sleep(0.25)
+
+
+@contextmanager
+def next_start(port: int = 3000, env: Optional[Dict[str, str]] = None) -> Iterator[str]:
+    """Run ``next start`` from the repo root for the duration of the block.
+
+    Expects ``npm run build`` to have been run already. Yields the base URL.
+    """
+    base_url = f"http://localhost:{port}"
+    process = subprocess.Popen(
+        ["npx", "next", "start", "-p", str(port)],
+        cwd=REPO_ROOT,
+        env={**os.environ, **(env or {})},
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        wait_for_http(base_url)
+        yield base_url
+    finally:
+        process.terminate()
+        try:
+            process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            process.kill()
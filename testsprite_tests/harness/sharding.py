@@ -0,0 +1,96 @@
+"""
+Multi-process sharding for the TC suite.
+
+``python -m harness --shards 4`` splits the cases over worker processes, each
+with its own event loop and browser pool. Shards are balanced on the median
+duration of each case in the run history (longest first onto the least
+loaded shard); cases with no history are assumed to take the median of the
+known ones. Workers return their results to the parent, which writes the
+reports once.
+"""
+
+import asyncio
+import multiprocessing
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import closing
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+from .history import HISTORY_PATH, connect
+from .results import TestResult
+from .runner import TestCase, run_suite
+from .stats import percentile
+
+# Used when there is no history at all; only the relative order matters
+DEFAULT_DURATION_MS = 10000.0
+
+
+def historical_durations(path: Path = HISTORY_PATH, last: int = 20) -> Dict[str, float]:
+    """Median duration (ms) per TC over the last ``last`` recorded runs."""
+    if not path.exists():
+        return {}
+    samples: Dict[str, List[float]] = {}
+    try:
+        with closing(connect(path)) as connection:
+            rows = connection.execute(
+                "SELECT tc_id, duration_ms FROM tests"
+                " WHERE run_id IN (SELECT id FROM runs ORDER BY id DESC LIMIT ?)",
+                (last,),
+            ).fetchall()
+    except sqlite3.Error:
+        return {}
+    for row in rows:
+        samples.setdefault(row["tc_id"], []).append(row["duration_ms"])
+    return {tc_id: percentile(values, 50) for tc_id, values in samples.items()}
+
+
+def plan_shards(
+    cases: Sequence[TestCase],
+    shards: int,
+    durations: Dict[str, float],
+) -> List[List[TestCase]]:
+    """Greedy longest-processing-time split of ``cases`` into ``shards`` lists."""
+    fallback = percentile(list(durations.values()), 50) if durations else DEFAULT_DURATION_MS
+    estimate = {case.tc_id: durations.get(case.tc_id, fallback) for case in cases}
+    plans: List[List[TestCase]] = [[] for _ in range(max(1, min(shards, len(cases))))]
+    loads = [0.0] * len(plans)
+    for case in sorted(cases, key=lambda case: estimate[case.tc_id], reverse=True):
+        target = loads.index(min(loads))
+        plans[target].append(case)
+        loads[target] += estimate[case.tc_id]
+    return plans
+
+
+def _run_shard(
+    cases: List[TestCase],
+    browsers: int,
+    concurrency: Optional[int],
+    timeout: Optional[float],
+) -> List[TestResult]:
+    return asyncio.run(run_suite(cases, browsers, concurrency, timeout))
+
+
+def run_sharded(
+    cases: Sequence[TestCase],
+    shards: int,
+    browsers: int = 1,
+    concurrency: Optional[int] = None,
+    timeout: Optional[float] = None,
+    history_runs: int = 20,
+) -> List[TestResult]:
+    """Run ``cases`` over ``shards`` processes; results come back in case order."""
+    durations = historical_durations(last=history_runs)
+    plans = plan_shards(cases, shards, durations)
+    for index, plan in enumerate(plans, start=1):
+        estimate_s = sum(durations.get(case.tc_id, 0.0) for case in plan) / 1000
+        print(f"shard {index}: {', '.join(case.tc_id for case in plan)} (~{estimate_s:.1f}s by history)")
+
+    # Spawn, not fork: Playwright's driver and event loop must not be inherited
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=len(plans), mp_context=context) as pool:
+        futures = [pool.submit(_run_shard, plan, browsers, concurrency, timeout) for plan in plans]
+        results = [result for future in futures for result in future.result()]
+
+    order = {case.tc_id: index for index, case in enumerate(cases)}
+    return sorted(results, key=lambda result: order[result.tc_id])
@@ -0,0 +1,217 @@
+"""
+Memory soak test for the dashboard refresh path.
+
+Keeps one dashboard page open and clicks Refresh for a fixed period (or
+number of cycles), like a wall screen left running for days. Every few cycles
+it forces a GC and samples the JS heap and DOM counters over CDP. The run fails
+when retained memory grows past a threshold; heap snapshots from the start and
+end of the run are saved so they can be diffed in DevTools::
+
+    python -m harness.soak --minutes 30 --threshold-mb 10
+    python -m harness.soak --cycles 5000 --sample-every 100 --serve
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+from playwright import async_api
+
+from .bench_refresh import REFRESH_BUTTON
+from .config import BASE_URL, LAUNCH_ARGS, TESTS_DIR
+from .readiness import wait_until_ready
+from .results import utc_timestamp
+from .runner import new_test_context
+from .server import next_start
+
+OUTPUT_PATH = TESTS_DIR / "tmp" / "soak_results.json"
+SNAPSHOT_DIR = TESTS_DIR / "tmp" / "heap_snapshots"
+
+# Measures are cleared before each click so the perf buffer itself does not grow
+CLEAR_TIMINGS_SCRIPT = "() => { performance.clearMarks(); performance.clearMeasures(); }"
+CYCLE_DONE_SCRIPT = "() => performance.getEntriesByName('refresh:total', 'measure').length > 0"
+PAGE_MEMORY_SCRIPT = "() => (performance.memory ? performance.memory.usedJSHeapSize : 0)"
+
+# Growth is judged on the smallest of the last few samples, which filters out
+# garbage that survived a single forced GC
+TRAILING_SAMPLES = 3
+
+
+async def take_heap_snapshot(cdp: async_api.CDPSession) -> str:
+    chunks: List[str] = []
+
+    def on_chunk(event: dict) -> None:
+        chunks.append(event["chunk"])
+
+    cdp.on("HeapProfiler.addHeapSnapshotChunk", on_chunk)
+    try:
+        await cdp.send("HeapProfiler.takeHeapSnapshot", {"reportProgress": False})
+    finally:
+        cdp.remove_listener("HeapProfiler.addHeapSnapshotChunk", on_chunk)
+    return "".join(chunks)
+
+
+async def sample_memory(page: async_api.Page, cdp: async_api.CDPSession) -> Dict[str, float]:
+    """Heap and DOM counters after a forced GC."""
+    await cdp.send("HeapProfiler.collectGarbage")
+    heap = await cdp.send("Runtime.getHeapUsage")
+    counters = await cdp.send("Memory.getDOMCounters")
+    return {
+        "heap_mb": heap["usedSize"] / (1024 * 1024),
+        "page_heap_mb": await page.evaluate(PAGE_MEMORY_SCRIPT) / (1024 * 1024),
+        "dom_nodes": counters["nodes"],
+        "listeners": counters["jsEventListeners"],
+        "documents": counters["documents"],
+    }
+
+
+def retained_growth(samples: List[Dict[str, float]]) -> Optional[Dict[str, float]]:
+    """Growth of the trailing samples over the first (post-warmup) sample.
+
+    None when there is no sample after the baseline, i.e. nothing was measured.
+    """
+    if len(samples) < 2:
+        return None
+    baseline, trailing = samples[0], samples[1:][-TRAILING_SAMPLES:]
+    return {
+        key: min(sample[key] for sample in trailing) - baseline[key]
+        for key in ("heap_mb", "dom_nodes", "listeners")
+    }
+
+
+async def soak(args: argparse.Namespace, base_url: str) -> dict:
+    samples: List[Dict[str, float]] = []
+    async with async_api.async_playwright() as pw:
+        browser = await pw.chromium.launch(
+            headless=True, args=[*LAUNCH_ARGS, "--enable-precise-memory-info"]
+        )
+        try:
+            context = await new_test_context(browser)
+            page = await context.new_page()
+            cdp = await context.new_cdp_session(page)
+            await cdp.send("HeapProfiler.enable")
+            await page.goto(f"{base_url}/dashboard")
+            await wait_until_ready(page)
+
+            button = page.locator(REFRESH_BUTTON)
+            deadline = time.monotonic() + args.minutes * 60 if args.minutes else None
+            started = time.monotonic()
+            cycle = 0
+            baseline_snapshot = None
+
+            while True:
+                if cycle == args.warmup:
+                    samples.append({"cycle": cycle, "elapsed_s": 0.0, **await sample_memory(page, cdp)})
+                    if not args.no_snapshots:
+                        baseline_snapshot = await take_heap_snapshot(cdp)
+                if args.cycles and cycle >= args.cycles:
+                    break
+                if deadline and time.monotonic() >= deadline:
+                    break
+
+                await page.evaluate(CLEAR_TIMINGS_SCRIPT)
+                await button.click()
+                await page.wait_for_function(CYCLE_DONE_SCRIPT, timeout=args.cycle_timeout)
+                if args.pause_ms:
+                    await asyncio.sleep(args.pause_ms / 1000)
+                cycle += 1
+
+                if cycle > args.warmup and (cycle - args.warmup) % args.sample_every == 0:
+                    sample = await sample_memory(page, cdp)
+                    samples.append({"cycle": cycle, "elapsed_s": time.monotonic() - started, **sample})
+                    print(f"cycle {cycle:>6}  heap {sample['heap_mb']:7.2f}MB  "
+                          f"nodes {sample['dom_nodes']:>6}  listeners {sample['listeners']:>5}")
+
+            growth = retained_growth(samples)
+            # Too few samples is a failed run, not a leak-free one
+            passed = (
+                growth is not None
+                and growth["heap_mb"] <= args.threshold_mb
+                and growth["dom_nodes"] <= args.node_threshold
+            )
+            snapshots = []
+            if growth is not None and not passed and not args.no_snapshots:
+                SNAPSHOT_DIR.mkdir(parents=True, exist_ok=True)
+                stamp = time.strftime("%Y%m%d-%H%M%S")
+                for label, data in (("start", baseline_snapshot), ("end", await take_heap_snapshot(cdp))):
+                    if data:
+                        path = SNAPSHOT_DIR / f"soak-{stamp}-{label}.heapsnapshot"
+                        path.write_text(data, encoding="utf-8")
+                        snapshots.append(str(path))
+        finally:
+            await browser.close()
+
+    return {
+        "generated_at": utc_timestamp(),
+        "base_url": base_url,
+        "cycles": cycle,
+        "duration_s": samples[-1]["elapsed_s"] if samples else 0.0,
+        "thresholds": {"heap_mb": args.threshold_mb, "dom_nodes": args.node_threshold},
+        "growth": growth,
+        "passed": passed,
+        "snapshots": snapshots,
+        "samples": samples,
+    }
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m harness.soak", description=__doc__.split("\n\n")[0])
+    parser.add_argument("--minutes", type=float, default=None, help="soak duration (default: until --cycles)")
+    parser.add_argument("--cycles", type=int, default=None, help="stop after this many refreshes")
+    parser.add_argument("--warmup", type=int, default=20, help="cycles before the baseline sample")
+    parser.add_argument("--sample-every", type=int, default=50, help="cycles between memory samples")
+    parser.add_argument("--pause-ms", type=float, default=0, help="idle time between cycles")
+    parser.add_argument("--threshold-mb", type=float, default=10.0, help="max retained JS heap growth")
+    parser.add_argument("--node-threshold", type=int, default=500, help="max retained DOM node growth")
+    parser.add_argument("--cycle-timeout", type=float, default=10000, help="max ms per refresh cycle")
+    parser.add_argument("--no-snapshots", action="store_true", help="skip heap snapshots on failure")
+    parser.add_argument("--output", type=Path, default=OUTPUT_PATH)
+    parser.add_argument("--serve", action="store_true", help="start `next start` for the run (needs a build)")
+    parser.add_argument("--port", type=int, default=3000, help="port for --serve")
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if not args.minutes and not args.cycles:
+        parser.error("give --minutes and/or --cycles")
+    if args.sample_every < 1:
+        parser.error("--sample-every must be at least 1")
+    if args.cycles and args.cycles < args.warmup + args.sample_every:
+        parser.error(
+            f"--cycles {args.cycles} stops before the first sample after the baseline; "
+            f"use at least --warmup + --sample-every ({args.warmup + args.sample_every})"
+        )
+
+    if args.serve:
+        with next_start(args.port) as base_url:
+            report = asyncio.run(soak(args, base_url))
+    else:
+        report = asyncio.run(soak(args, BASE_URL))
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+
+    growth = report["growth"]
+    if growth is None:
+        print(f"\n{report['cycles']} cycles in {report['duration_s'] / 60:.1f} min: fewer than two memory "
+              f"samples after {args.warmup} warmup cycles, so growth was not measured")
+        print(f"FAIL - wrote {args.output}")
+        return 1
+    print(f"\n{report['cycles']} cycles in {report['duration_s'] / 60:.1f} min: "
+          f"heap {growth['heap_mb']:+.2f}MB (limit {args.threshold_mb}), "
+          f"DOM nodes {growth['dom_nodes']:+.0f} (limit {args.node_threshold}), "
+          f"listeners {growth['listeners']:+.0f}")
+    for path in report["snapshots"]:
+        print(f"Heap snapshot: {path}")
+    print(f"{'PASS' if report['passed'] else 'FAIL'} - wrote {args.output}")
+    return 0 if report["passed"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
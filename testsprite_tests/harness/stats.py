@@ -0,0 +1,40 @@
+"""
+Small statistics helpers for the benchmark modes.
+"""
+
+import math
+from typing import Dict, List, Sequence
+
+
+def percentile(samples: Sequence[float], pct: float) -> float:
+    """Nearest-rank percentile; ``pct`` is in the 0-100 range."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def summarize(samples: Sequence[float]) -> Dict[str, float]:
+    """p50/p95 plus range for a list of samples."""
+    return {
+        "p50": percentile(samples, 50),
+        "p95": percentile(samples, 95),
+        "min": min(samples) if samples else 0.0,
+        "max": max(samples) if samples else 0.0,
+        "count": len(samples),
+    }
+
+
+def histogram(samples: Sequence[float], bucket_width: float) -> List[Dict[str, float]]:
+    """Fixed-width buckets as ``[{"lower": ..., "upper": ..., "count": ...}]``."""
+    if not samples or bucket_width <= 0:
+        return []
+    counts: Dict[int, int] = {}
+    for value in samples:
+        index = int(value // bucket_width)
+        counts[index] = counts.get(index, 0) + 1
+    return [
+        {"lower": index * bucket_width, "upper": (index + 1) * bucket_width, "count": counts[index]}
+        for index in sorted(counts)
+    ]